@@ -0,0 +1,106 @@
+# -------- Write-driven cache invalidation --------- #
+"""Redis pub/sub bus keeping per-process L1 caches coherent.
+
+Endpoints that serve rendered JSON bytes can keep a copy in a small
+in-process dict (the L1) and skip the Redis round trip on repeat hits.
+That only works if writes can reach every worker process, so writers
+publish the invalidated key list on one pub/sub channel and each process
+runs a daemon listener that evicts those keys from its own L1.
+
+Redis remains the source of truth (the shared cache is deleted first,
+before publishing); the L1 entries also carry a short TTL as a backstop
+for the window where a process misses a message (restart, dropped
+connection). Without django-redis everything degrades to local-only
+eviction, which is correct for a single process.
+"""
+
+import json
+import threading
+import time
+
+try:
+    from django_redis import get_redis_connection
+except ImportError:
+    get_redis_connection = None
+
+CHANNEL = 'cache:inval'
+
+L1_TTL = 30
+L1_MAX = 2048
+
+_l1 = {}
+_l1_lock = threading.Lock()
+_listener_started = False
+
+
+def l1_get(key):
+    """Bytes for key from the in-process cache, or None."""
+    with _l1_lock:
+        entry = _l1.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at < time.monotonic():
+            del _l1[key]
+            return None
+        return body
+
+
+def l1_set(key, body):
+    with _l1_lock:
+        if len(_l1) >= L1_MAX:
+            # Drop expired entries first; if everything is live, drop the
+            # soonest-to-expire so hot keys survive.
+            now = time.monotonic()
+            for stale in [k for k, (exp, _) in _l1.items() if exp < now]:
+                del _l1[stale]
+            if len(_l1) >= L1_MAX:
+                del _l1[min(_l1, key=lambda k: _l1[k][0])]
+        _l1[key] = (time.monotonic() + L1_TTL, body)
+
+
+def l1_evict(keys):
+    with _l1_lock:
+        for key in keys:
+            _l1.pop(key, None)
+
+
+def publish_invalidation(keys):
+    """Evict keys locally and broadcast them to every other process."""
+    keys = list(keys)
+    l1_evict(keys)
+    if get_redis_connection is None:
+        return
+    try:
+        get_redis_connection('default').publish(CHANNEL, json.dumps(keys))
+    except Exception:
+        # The shared cache was already deleted; worst case other
+        # processes serve their L1 copy until its short TTL runs out.
+        pass
+
+
+def ensure_listener():
+    """Start the per-process eviction listener (idempotent)."""
+    global _listener_started
+    if _listener_started or get_redis_connection is None:
+        return
+    _listener_started = True
+    threading.Thread(target=_listen, name='cache-inval-listener', daemon=True).start()
+
+
+def _listen():
+    while True:
+        try:
+            pubsub = get_redis_connection('default').pubsub()
+            pubsub.subscribe(CHANNEL)
+            for message in pubsub.listen():
+                if message.get('type') != 'message':
+                    continue
+                try:
+                    keys = json.loads(message['data'])
+                except (TypeError, ValueError):
+                    continue
+                l1_evict(keys)
+        except Exception:
+            # Redis hiccup: back off, reconnect, resubscribe.
+            time.sleep(1)
@@ -26,6 +26,8 @@ INSTALLED_APPS += ['rest_framework']
 
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 30000
 
+AUTH_USER_MODEL = 'users.User'
+
 SITE_ID = 1
 JAZZMIN_SETTINGS = {
     "site_title": "RESPlateForm Admin",
@@ -70,6 +72,10 @@ CACHES = {
 REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    'DEFAULT_RENDERER_CLASSES': (
+        'RESPlateForm.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 TEMPLATES = [
     {
@@ -93,6 +99,11 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Keep connections alive across requests instead of paying
+        # connect/auth per request; health checks catch server-side drops
+        # before a query fails on a dead connection.
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
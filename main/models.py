@@ -1188,7 +1188,7 @@ class GeofenceAlert(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
-        related_name='geofence_alerts',
+        related_name='geofence_alert_rules',
         verbose_name=_("User")
     )
     geofence_name = models.CharField(max_length=100, verbose_name=_("Geofence Name"))
@@ -0,0 +1,56 @@
+# -------- Write-Behind Counter Buffer --------- #
+# Hot counters (views, favorites, inquiries, attendees) used to be bumped with
+# one UPDATE per impression. Increments are now buffered in Redis hashes
+# (HINCRBY) and flushed periodically in bulk, so write load scales with the
+# number of unique rows touched per flush window instead of raw impressions.
+from django.db.models import F
+from django_redis import get_redis_connection
+
+from users.models import User
+
+from .models import Listing, ListingAnalytics, OpenHouse, Property
+
+# model_key -> (model class, fields that may be buffered)
+COUNTER_MODELS = {
+    'property': (Property, ['views_count', 'favorites_count']),
+    'listing': (Listing, ['views_count', 'unique_visitors', 'inquiries_count', 'favorites_count']),
+    'openhouse': (OpenHouse, ['attendees_count']),
+    'listinganalytics': (ListingAnalytics, ['views', 'unique_visitors', 'inquiries', 'favorites']),
+    'user': (User, ['profile_views']),
+}
+
+
+def _counter_key(model_key, field):
+    return f"cnt:{model_key}:{field}"
+
+
+def bump(model_key, pk, field, n=1):
+    """Buffer a counter increment in Redis instead of issuing an UPDATE."""
+    conn = get_redis_connection('default')
+    conn.hincrby(_counter_key(model_key, field), str(pk), n)
+
+
+def flush_counters():
+    """Drain buffered increments and apply them with one bulk_update per field.
+
+    Meant to run every ~30s from a scheduler (cron/Celery beat via the
+    flush_counters management command).
+    """
+    conn = get_redis_connection('default')
+    flushed = 0
+    for model_key, (model, fields) in COUNTER_MODELS.items():
+        for field in fields:
+            key = _counter_key(model_key, field)
+            pipe = conn.pipeline()
+            pipe.hgetall(key)
+            pipe.delete(key)
+            counts, _ = pipe.execute()
+            if not counts:
+                continue
+            increments = {pk.decode() if isinstance(pk, bytes) else pk: int(n) for pk, n in counts.items()}
+            instances = model.objects.in_bulk(increments.keys())
+            for pk, instance in instances.items():
+                setattr(instance, field, F(field) + increments[str(pk)])
+            model.objects.bulk_update(instances.values(), [field])
+            flushed += len(instances)
+    return flushed
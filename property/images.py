@@ -0,0 +1,48 @@
+# -------- Listing Photo Variants --------- #
+# Listing pages never need the original upload: they render a thumbnail, a
+# card image and a lightbox image. Each upload is resized once into WebP
+# variants and only the storage keys are kept, so the CDN (or whatever backs
+# default_storage) serves the bytes instead of Django.
+import io
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from PIL import Image
+
+VARIANT_SIZES = {'thumb': 320, 'card': 640, 'full': 1600}
+
+
+def build_variants(photo):
+    """Generate resized WebP variants for a ListingPhoto; returns key/size dict."""
+    try:
+        photo.image.open()
+        image = Image.open(photo.image)
+        image.load()
+    except (OSError, ValueError):
+        return {}
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGB')
+    variants = {}
+    for name, width in VARIANT_SIZES.items():
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            resized = image.resize((width, height), Image.LANCZOS)
+        else:
+            resized = image.copy()
+        buffer = io.BytesIO()
+        resized.save(buffer, format='WEBP', quality=80)
+        key = f"listing_photos/variants/{photo.photo_id}/{name}.webp"
+        default_storage.save(key, ContentFile(buffer.getvalue()))
+        variants[name] = {'key': key, 'width': resized.width, 'height': resized.height}
+    return variants
+
+
+def generate_photo_variants(sender, instance, **kwargs):
+    """post_save hook: build variants once per photo and record their keys."""
+    if instance.variants or not instance.image:
+        return
+    variants = build_variants(instance)
+    if variants:
+        # queryset update so the signal doesn't fire again
+        sender.objects.filter(pk=instance.pk).update(variants=variants)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from property.counters import flush_counters
+
+
+class Command(BaseCommand):
+    help = "Flush buffered counter increments from Redis to the database."
+
+    def handle(self, *args, **options):
+        flushed = flush_counters()
+        self.stdout.write(self.style.SUCCESS(f"Flushed counters for {flushed} rows"))
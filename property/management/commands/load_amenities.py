@@ -0,0 +1,37 @@
+import csv
+
+from django.core.management.base import BaseCommand
+
+from property.models import Amenity, AmenityManager
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "Seed or refresh amenities from a CSV (name, category, is_premium) in one upsert."
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help="Path to the amenities CSV file.")
+
+    def handle(self, *args, **options):
+        with open(options['csv_path'], newline='') as fh:
+            rows = [
+                Amenity(
+                    name=row['name'].strip(),
+                    category=row.get('category') or Amenity.Category.BUILDING,
+                    is_premium=(row.get('is_premium') or '').strip().lower() in ('1', 'true', 'yes'),
+                )
+                for row in csv.DictReader(fh)
+            ]
+        # One ON CONFLICT DO UPDATE statement per batch instead of a
+        # get_or_create round trip per row.
+        Amenity.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['name'],
+            update_fields=['category', 'is_premium'],
+            batch_size=BATCH_SIZE,
+        )
+        # bulk_create bypasses signals, so drop the amenity cache by hand.
+        AmenityManager.invalidate()
+        self.stdout.write(self.style.SUCCESS(f"Upserted {len(rows)} amenities"))
@@ -0,0 +1,41 @@
+import csv
+
+from django.core.management.base import BaseCommand
+
+from property.models import School
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "Seed or refresh schools from a CSV feed in batched upserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help="Path to the schools CSV file.")
+
+    def handle(self, *args, **options):
+        with open(options['csv_path'], newline='') as fh:
+            rows = [
+                School(
+                    name=row['name'].strip(),
+                    school_type=row.get('school_type') or School.SchoolType.ELEMENTARY,
+                    latitude=float(row['latitude']),
+                    longitude=float(row['longitude']),
+                    rating=int(row['rating']) if row.get('rating') else None,
+                    student_count=int(row['student_count']) if row.get('student_count') else None,
+                    teacher_student_ratio=row.get('teacher_student_ratio') or '',
+                    website=row.get('website') or '',
+                )
+                for row in csv.DictReader(fh)
+            ]
+        School.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['name', 'school_type'],
+            update_fields=[
+                'latitude', 'longitude', 'rating', 'student_count',
+                'teacher_student_ratio', 'website',
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Upserted {len(rows)} schools"))
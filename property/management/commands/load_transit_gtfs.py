@@ -0,0 +1,43 @@
+import csv
+
+from django.core.management.base import BaseCommand
+
+from property.models import Transit
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "Seed or refresh transit stops from a GTFS stops.txt file in batched upserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('stops_path', help="Path to the GTFS stops.txt file.")
+        parser.add_argument(
+            '--transit-type',
+            default=Transit.TransitType.SUBWAY,
+            choices=[value for value, _ in Transit.TransitType.choices],
+            help="Transit type recorded for every stop in the feed.",
+        )
+        parser.add_argument('--operator', default='', help="Operator recorded for every stop in the feed.")
+
+    def handle(self, *args, **options):
+        with open(options['stops_path'], newline='') as fh:
+            rows = [
+                Transit(
+                    name=row['stop_name'].strip(),
+                    transit_type=options['transit_type'],
+                    latitude=float(row['stop_lat']),
+                    longitude=float(row['stop_lon']),
+                    operator=options['operator'],
+                    schedule_url=row.get('stop_url') or '',
+                )
+                for row in csv.DictReader(fh)
+            ]
+        Transit.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['name', 'transit_type', 'operator'],
+            update_fields=['latitude', 'longitude', 'schedule_url'],
+            batch_size=BATCH_SIZE,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Upserted {len(rows)} transit stops"))
@@ -0,0 +1,19 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+from property.views import update_map_clusters
+
+
+class Command(BaseCommand):
+    help = "Recompute MapCluster statistics when listing writes have marked them stale."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Refresh even if not marked stale.")
+
+    def handle(self, *args, **options):
+        if not options['force'] and not cache.get('map_clusters_stale'):
+            self.stdout.write("Clusters up to date; nothing to do")
+            return
+        cache.delete('map_clusters_stale')
+        update_map_clusters()
+        self.stdout.write(self.style.SUCCESS("Refreshed map clusters"))
@@ -1,35 +1,72 @@
 # -------- Property App Models --------- #
-from django.db import models
+from django.db import connection, models
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
+import math
+import os
+import time
 import uuid
 
+from . import images
+
+
+def uuid7():
+    """Time-ordered UUID (draft v7): millisecond timestamp prefix + random tail.
+
+    Random v4 primary keys scatter inserts across the whole B-tree; the
+    monotonic prefix keeps inserts appending to the hot leaf page while the
+    IDs stay URL-safe UUIDs.
+    """
+    raw = bytearray((time.time_ns() // 1_000_000).to_bytes(6, 'big') + os.urandom(10))
+    raw[6] = (raw[6] & 0x0F) | 0x70
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    return uuid.UUID(bytes=bytes(raw))
+
 
 # --- Property Model (Buildings/Units) ---
 class Property(models.Model):
-    property_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    class PropertyType(models.TextChoices):
+        CONDO = 'condo', 'Condo'
+        COOP = 'coop', 'Co-op'
+        TOWNHOUSE = 'townhouse', 'Townhouse'
+        SINGLE_FAMILY = 'single_family', 'Single Family'
+        MULTI_FAMILY = 'multi_family', 'Multi-Family'
+        RENTAL = 'rental', 'Rental'
+        COMMERCIAL = 'commercial', 'Commercial'
+        MIXED_USE = 'mixed_use', 'Mixed Use'
+        LAND = 'land', 'Land'
+        INDUSTRIAL = 'industrial', 'Industrial'
+        TINY_HOME = 'tiny_home', 'Tiny Home'
+        MODULAR = 'modular', 'Modular'
+        PREFAB = 'prefab', 'Prefabricated'
+
+    class Status(models.TextChoices):
+        ACTIVE = 'active', 'Active'
+        PENDING = 'pending', 'Pending'
+        SOLD = 'sold', 'Sold'
+        OFF_MARKET = 'off_market', 'Off Market'
+        UNDER_CONTRACT = 'under_contract', 'Under Contract'
+        EXPIRED = 'expired', 'Expired'
+        WITHDRAWN = 'withdrawn', 'Withdrawn'
+
+    class ConstructionStatus(models.TextChoices):
+        COMPLETED = 'completed', 'Completed'
+        UNDER_CONSTRUCTION = 'under_construction', 'Under Construction'
+        PLANNED = 'planned', 'Planned'
+
+    property_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     building_name = models.CharField(max_length=255, blank=True, verbose_name=_("Building Name"))
     property_type = models.CharField(
         max_length=50,
-        choices=[
-            ('condo', 'Condo'), ('coop', 'Co-op'), ('townhouse', 'Townhouse'),
-            ('single_family', 'Single Family'), ('multi_family', 'Multi-Family'),
-            ('rental', 'Rental'), ('commercial', 'Commercial'), ('mixed_use', 'Mixed Use'),
-            ('land', 'Land'), ('industrial', 'Industrial'), ('tiny_home', 'Tiny Home'),
-            ('modular', 'Modular'), ('prefab', 'Prefabricated')
-        ],
+        choices=PropertyType.choices,
         verbose_name=_("Property Type")
     )
     status = models.CharField(
         max_length=20,
-        choices=[
-            ('active', 'Active'), ('pending', 'Pending'), ('sold', 'Sold'),
-            ('off_market', 'Off Market'), ('under_contract', 'Under Contract'),
-            ('expired', 'Expired'), ('withdrawn', 'Withdrawn')
-        ],
-        default='active',
+        choices=Status.choices,
+        default=Status.ACTIVE,
         verbose_name=_("Status")
     )
     address = models.ForeignKey('Address', on_delete=models.SET_NULL, null=True, related_name='properties')
@@ -50,8 +87,8 @@ class Property(models.Model):
     zoning_type = models.CharField(max_length=50, blank=True, verbose_name=_("Zoning Type"))
     construction_status = models.CharField(
         max_length=20,
-        choices=[('completed', 'Completed'), ('under_construction', 'Under Construction'), ('planned', 'Planned')],
-        default='completed',
+        choices=ConstructionStatus.choices,
+        default=ConstructionStatus.COMPLETED,
         verbose_name=_("Construction Status")
     )
     energy_efficiency_rating = models.CharField(
@@ -77,15 +114,51 @@ class Property(models.Model):
         indexes = [
             models.Index(fields=['status']),
             models.Index(fields=['property_type']),
+            # The list endpoint filters type and status together
+            models.Index(fields=['property_type', 'status']),
         ]
 
     def __str__(self):
         return self.building_name or f"Property {self.property_id}"
 
 
+# --- Custom QuerySet/Manager for Addresses ---
+class AddressQuerySet(models.QuerySet):
+    def grid_clusters(self, grid_size=0.01):
+        """Cluster addresses into grid cells with a single GROUP BY.
+
+        Snapping lat/lon to a grid in SQL (the ST_SnapToGrid pattern) lets
+        the database aggregate counts and prices per cell in one round trip
+        instead of iterating rows in Python.
+        """
+        grid = models.Value(grid_size)
+        return (
+            self.annotate(
+                cell_latitude=models.Func(models.F('latitude') / grid, function='FLOOR') * grid,
+                cell_longitude=models.Func(models.F('longitude') / grid, function='FLOOR') * grid,
+            )
+            .values('cell_latitude', 'cell_longitude')
+            .annotate(
+                property_count=models.Count('properties', distinct=True),
+                listing_count=models.Count('properties__listings'),
+                avg_price=models.Avg('properties__listings__price'),
+            )
+            .order_by()
+        )
+
+
+class AddressManager(models.Manager.from_queryset(AddressQuerySet)):
+    pass
+
+
 # --- Address Model (Property-Specific Addresses) ---
 class Address(models.Model):
-    address_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    class NoiseLevel(models.TextChoices):
+        QUIET = 'quiet', 'Quiet'
+        MODERATE = 'moderate', 'Moderate'
+        NOISY = 'noisy', 'Noisy'
+
+    address_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     street_address = models.CharField(max_length=255, verbose_name=_("Street Address"))
     unit_number = models.CharField(max_length=50, blank=True, verbose_name=_("Unit Number"))
     city = models.CharField(max_length=100, verbose_name=_("City"))
@@ -114,7 +187,7 @@ class Address(models.Model):
     )
     noise_level = models.CharField(
         max_length=20,
-        choices=[('quiet', 'Quiet'), ('moderate', 'Moderate'), ('noisy', 'Noisy')],
+        choices=NoiseLevel.choices,
         blank=True,
         verbose_name=_("Noise Level")
     )
@@ -125,6 +198,8 @@ class Address(models.Model):
     )
     flood_zone = models.BooleanField(default=False, verbose_name=_("In Flood Zone"))
 
+    objects = AddressManager()
+
     class Meta:
         verbose_name = _("Address")
         verbose_name_plural = _("Addresses")
@@ -137,15 +212,76 @@ class Address(models.Model):
         return f"{self.street_address}, {self.city}, {self.state}"
 
 
+# --- Custom QuerySet/Manager for Listings ---
+class ListingQuerySet(models.QuerySet):
+    def active_listings(self):
+        return self.filter(is_active=True)
+
+    def for_list(self):
+        # List/card endpoints only need the summary columns; skipping the
+        # description TextField keeps the blobs off the wire.
+        return self.only(
+            'listing_id', 'property_id', 'listing_type', 'price', 'bedrooms',
+            'bathrooms', 'square_footage', 'is_active', 'listed_date',
+            'days_on_market', 'is_no_fee',
+        )
+
+    def by_neighborhood(self, neighborhood):
+        return self.filter(property__address__neighborhood=neighborhood, is_active=True)
+
+    def price_drops(self):
+        # EXISTS stops at the first PriceHistory row per listing; the old
+        # JOIN + DISTINCT materialized and deduped the whole join product.
+        return self.filter(
+            is_active=True
+        ).filter(models.Exists(PriceHistory.objects.filter(listing=models.OuterRef('pk'))))
+
+    def within_radius(self, latitude, longitude, radius_km=5):
+        # Bounding-box prefilter over the listing's own denormalized,
+        # indexed (latitude, longitude) columns — no property/address JOIN.
+        # A longitude degree spans 111*cos(latitude) km, so the longitude
+        # window must widen with latitude.
+        lat_delta = radius_km / 111.0
+        lon_delta = radius_km / (111.0 * max(math.cos(math.radians(latitude)), 0.01))
+        return self.filter(
+            latitude__gte=latitude - lat_delta,
+            latitude__lte=latitude + lat_delta,
+            longitude__gte=longitude - lon_delta,
+            longitude__lte=longitude + lon_delta,
+            is_active=True
+        )
+
+
+class ListingManager(models.Manager.from_queryset(ListingQuerySet)):
+    pass
+
+
 # --- Listing Model (For Sale/Rent Listings) ---
 class Listing(models.Model):
-    listing_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    class ListingType(models.TextChoices):
+        SALE = 'sale', 'For Sale'
+        RENT = 'rent', 'For Rent'
+        AUCTION = 'auction', 'Auction'
+        LEASE_TO_OWN = 'lease_to_own', 'Lease to Own'
+
+    class PetPolicy(models.TextChoices):
+        ALLOWED = 'allowed', 'Allowed'
+        NOT_ALLOWED = 'not_allowed', 'Not Allowed'
+        CASE_BY_CASE = 'case_by_case', 'Case by Case'
+
+    class ParkingType(models.TextChoices):
+        GARAGE = 'garage', 'Garage'
+        DRIVEWAY = 'driveway', 'Driveway'
+        STREET = 'street', 'Street'
+        NONE = 'none', 'None'
+
+    listing_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='listings')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='listings')
     listing_type = models.CharField(
         max_length=20,
-        choices=[('sale', 'For Sale'), ('rent', 'For Rent'), ('auction', 'Auction'), ('lease_to_own', 'Lease to Own')],
-        default='sale',
+        choices=ListingType.choices,
+        default=ListingType.SALE,
         verbose_name=_("Listing Type")
     )
     price = models.DecimalField(max_digits=15, decimal_places=2, verbose_name=_("Price"))
@@ -167,7 +303,7 @@ class Listing(models.Model):
     description = models.TextField(blank=True, verbose_name=_("Description"))
     pet_policy = models.CharField(
         max_length=20,
-        choices=[('allowed', 'Allowed'), ('not_allowed', 'Not Allowed'), ('case_by_case', 'Case by Case')],
+        choices=PetPolicy.choices,
         blank=True,
         verbose_name=_("Pet Policy")
     )
@@ -181,7 +317,7 @@ class Listing(models.Model):
     parking_spaces = models.PositiveIntegerField(default=0, verbose_name=_("Parking Spaces"))
     parking_type = models.CharField(
         max_length=20,
-        choices=[('garage', 'Garage'), ('driveway', 'Driveway'), ('street', 'Street'), ('none', 'None')],
+        choices=ParkingType.choices,
         blank=True,
         verbose_name=_("Parking Type")
     )
@@ -199,6 +335,13 @@ class Listing(models.Model):
         validators=[MinValueValidator(0)],
         verbose_name=_("Heatmap Weight")
     )
+    # Denormalized from property.address so map queries skip the
+    # listing -> property -> address double JOIN; kept in sync on save()
+    # and by the Address post_save hook below.
+    latitude = models.FloatField(null=True, blank=True, editable=False, verbose_name=_("Latitude"))
+    longitude = models.FloatField(null=True, blank=True, editable=False, verbose_name=_("Longitude"))
+
+    objects = ListingManager()
 
     class Meta:
         verbose_name = _("Listing")
@@ -206,28 +349,76 @@ class Listing(models.Model):
         indexes = [
             models.Index(fields=['is_active', 'listing_type']),
             models.Index(fields=['price']),
+            # Matches the list endpoint's active + bedrooms + price-range
+            # predicate shape
+            models.Index(fields=['is_active', 'bedrooms', 'price']),
+            models.Index(fields=['latitude', 'longitude']),
         ]
 
     def save(self, *args, **kwargs):
         if self.contract_date and self.listed_date:
             self.days_on_market = (self.contract_date - self.listed_date).days
+        if self.latitude is None and self.property_id:
+            address = self.property.address
+            if address is not None:
+                self.latitude = address.latitude
+                self.longitude = address.longitude
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.property.building_name} - {self.listing_type} - ${self.price}"
 
 
+def sync_listing_coordinates(sender, instance, **kwargs):
+    """post_save hook: push address moves down to the denormalized columns."""
+    Listing.objects.filter(property__address=instance).update(
+        latitude=instance.latitude, longitude=instance.longitude
+    )
+
+
+models.signals.post_save.connect(sync_listing_coordinates, sender=Address)
+
+
+# --- Custom Manager for Amenities ---
+class AmenityManager(models.Manager):
+    """Manager with a whole-table in-process cache.
+
+    Amenity is a tiny controlled vocabulary joined on almost every listing
+    read/write; resolving names from a cached dict avoids a query per lookup.
+    """
+    _name_cache = None
+
+    def as_dict(self):
+        if AmenityManager._name_cache is None:
+            AmenityManager._name_cache = {a.name: a for a in self.all()}
+        return AmenityManager._name_cache
+
+    def by_name(self, name):
+        return self.as_dict().get(name)
+
+    @classmethod
+    def invalidate(cls, **kwargs):
+        cls._name_cache = None
+
+
 # --- Amenity Model ---
 class Amenity(models.Model):
+    class Category(models.TextChoices):
+        BUILDING = 'building', 'Building'
+        UNIT = 'unit', 'Unit'
+        COMMUNITY = 'community', 'Community'
+
     name = models.CharField(max_length=100, unique=True, verbose_name=_("Name"))
     category = models.CharField(
         max_length=20,
-        choices=[('building', 'Building'), ('unit', 'Unit'), ('community', 'Community')],
-        default='building',
+        choices=Category.choices,
+        default=Category.BUILDING,
         verbose_name=_("Category")
     )
     is_premium = models.BooleanField(default=False, verbose_name=_("Premium Amenity"))
 
+    objects = AmenityManager()
+
     class Meta:
         verbose_name = _("Amenity")
         verbose_name_plural = _("Amenities")
@@ -236,6 +427,10 @@ class Amenity(models.Model):
         return self.name
 
 
+models.signals.post_save.connect(AmenityManager.invalidate, sender=Amenity)
+models.signals.post_delete.connect(AmenityManager.invalidate, sender=Amenity)
+
+
 class ListingAmenity(models.Model):
     listing = models.ForeignKey(Listing, on_delete=models.CASCADE, related_name='amenities')
     amenity = models.ForeignKey(Amenity, on_delete=models.CASCADE)
@@ -253,7 +448,7 @@ class ListingAmenity(models.Model):
 
 # --- Listing Photo Model ---
 class ListingPhoto(models.Model):
-    photo_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    photo_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     listing = models.ForeignKey(Listing, on_delete=models.CASCADE, related_name='photos')
     image = models.ImageField(upload_to='listing_photos/%Y/%m/%d/', verbose_name=_("Image"))
     caption = models.CharField(max_length=255, blank=True, verbose_name=_("Caption"))
@@ -262,6 +457,11 @@ class ListingPhoto(models.Model):
     resolution = models.CharField(max_length=20, blank=True, verbose_name=_("Resolution"))
     file_size_kb = models.PositiveIntegerField(null=True, blank=True, verbose_name=_("File Size (KB)"))
     is_360_view = models.BooleanField(default=False, verbose_name=_("360° View"))
+    variants = models.JSONField(
+        blank=True, null=True,
+        verbose_name=_("Variants"),
+        help_text=_("Storage keys and dimensions of the resized WebP renditions, e.g. {'thumb': {'key': ..., 'width': 320}}")
+    )
 
     class Meta:
         verbose_name = _("Listing Photo")
@@ -274,9 +474,12 @@ class ListingPhoto(models.Model):
         return f"Photo for {self.listing.property.building_name}"
 
 
+models.signals.post_save.connect(images.generate_photo_variants, sender=ListingPhoto)
+
+
 # --- Price History Model ---
 class PriceHistory(models.Model):
-    history_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    history_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     listing = models.ForeignKey(Listing, on_delete=models.CASCADE, related_name='price_history')
     old_price = models.DecimalField(max_digits=15, decimal_places=2, verbose_name=_("Old Price"))
     new_price = models.DecimalField(max_digits=15, decimal_places=2, verbose_name=_("New Price"))
@@ -290,6 +493,11 @@ class PriceHistory(models.Model):
         indexes = [
             models.Index(fields=['listing', 'change_date']),
         ]
+        if connection.vendor == 'postgresql':
+            from django.contrib.postgres.indexes import BrinIndex
+            # Append-only time series: BRIN stays tiny and tracks the
+            # physical insert order of change_date.
+            indexes.append(BrinIndex(fields=['change_date'], name='price_history_change_date_brin'))
 
     def save(self, *args, **kwargs):
         if self.old_price and self.new_price:
@@ -302,7 +510,7 @@ class PriceHistory(models.Model):
 
 # --- Market Trend Model ---
 class MarketTrend(models.Model):
-    trend_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    trend_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     neighborhood = models.CharField(max_length=100, verbose_name=_("Neighborhood"))
     borough = models.CharField(max_length=100, blank=True, verbose_name=_("Borough"))
     period = models.DateField(verbose_name=_("Period"))
@@ -328,12 +536,19 @@ class MarketTrend(models.Model):
 
 # --- Transit Model ---
 class Transit(models.Model):
-    transit_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    class TransitType(models.TextChoices):
+        SUBWAY = 'subway', 'Subway'
+        BUS = 'bus', 'Bus'
+        FERRY = 'ferry', 'Ferry'
+        TRAIN = 'train', 'Train'
+        TRAM = 'tram', 'Tram'
+
+    transit_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=100, verbose_name=_("Name"))
     transit_type = models.CharField(
         max_length=20,
-        choices=[('subway', 'Subway'), ('bus', 'Bus'), ('ferry', 'Ferry'), ('train', 'Train'), ('tram', 'Tram')],
-        default='subway',
+        choices=TransitType.choices,
+        default=TransitType.SUBWAY,
         verbose_name=_("Transit Type")
     )
     latitude = models.FloatField(verbose_name=_("Latitude"))
@@ -347,6 +562,13 @@ class Transit(models.Model):
         indexes = [
             models.Index(fields=['latitude', 'longitude']),
         ]
+        constraints = [
+            # Natural key for feed upserts (see load_transit_gtfs).
+            models.UniqueConstraint(
+                fields=['name', 'transit_type', 'operator'],
+                name='transit_natural_key',
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -369,12 +591,19 @@ class PropertyTransit(models.Model):
 
 # --- School Model ---
 class School(models.Model):
-    school_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    class SchoolType(models.TextChoices):
+        ELEMENTARY = 'elementary', 'Elementary'
+        MIDDLE = 'middle', 'Middle'
+        HIGH = 'high', 'High'
+        CHARTER = 'charter', 'Charter'
+        PRIVATE = 'private', 'Private'
+
+    school_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=255, verbose_name=_("Name"))
     school_type = models.CharField(
         max_length=20,
-        choices=[('elementary', 'Elementary'), ('middle', 'Middle'), ('high', 'High'), ('charter', 'Charter'), ('private', 'Private')],
-        default='elementary',
+        choices=SchoolType.choices,
+        default=SchoolType.ELEMENTARY,
         verbose_name=_("School Type")
     )
     latitude = models.FloatField(verbose_name=_("Latitude"))
@@ -394,6 +623,13 @@ class School(models.Model):
         indexes = [
             models.Index(fields=['latitude', 'longitude']),
         ]
+        constraints = [
+            # Natural key for feed upserts (see load_schools).
+            models.UniqueConstraint(
+                fields=['name', 'school_type'],
+                name='school_natural_key',
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -416,7 +652,7 @@ class PropertySchool(models.Model):
 
 # --- Open House Model ---
 class OpenHouse(models.Model):
-    open_house_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    open_house_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     listing = models.ForeignKey(Listing, on_delete=models.CASCADE, related_name='open_houses')
     start_time = models.DateTimeField(verbose_name=_("Start Time"))
     end_time = models.DateTimeField(verbose_name=_("End Time"))
@@ -438,7 +674,7 @@ class OpenHouse(models.Model):
 
 # --- Map Cluster Model (For Map Circles with Property Counts) ---
 class MapCluster(models.Model):
-    cluster_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    cluster_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     center_latitude = models.FloatField(verbose_name=_("Center Latitude"))
     center_longitude = models.FloatField(verbose_name=_("Center Longitude"))
     radius_km = models.FloatField(default=5.0, verbose_name=_("Radius (km)"))
@@ -458,17 +694,31 @@ class MapCluster(models.Model):
         return f"Cluster at ({self.center_latitude}, {self.center_longitude}) - {self.property_count} properties"
 
 
+# --- Custom Manager for Map Overlays ---
+class MapOverlayManager(models.Manager):
+    def lightweight(self):
+        # overlay_data can be megabytes of GeoJSON; defer it unless a view
+        # explicitly needs the payload.
+        return self.defer('overlay_data')
+
+
 # --- Map Overlay Model (Custom Map Features) ---
 class MapOverlay(models.Model):
-    overlay_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    class OverlayType(models.TextChoices):
+        TRAFFIC = 'traffic', 'Traffic'
+        TRANSIT = 'transit', 'Transit'
+        BIKE = 'bike', 'Bike Paths'
+        CRIME = 'crime', 'Crime Heatmap'
+        SCHOOLS = 'schools', 'Schools'
+        AMENITIES = 'amenities', 'Amenities'
+        FLOOD = 'flood', 'Flood Zones'
+        ZONING = 'zoning', 'Zoning'
+
+    overlay_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=100, verbose_name=_("Overlay Name"))
     overlay_type = models.CharField(
         max_length=20,
-        choices=[
-            ('traffic', 'Traffic'), ('transit', 'Transit'), ('bike', 'Bike Paths'),
-            ('crime', 'Crime Heatmap'), ('schools', 'Schools'), ('amenities', 'Amenities'),
-            ('flood', 'Flood Zones'), ('zoning', 'Zoning')
-        ],
+        choices=OverlayType.choices,
         verbose_name=_("Overlay Type")
     )
     data_source = models.CharField(max_length=100, blank=True, verbose_name=_("Data Source"))
@@ -479,6 +729,8 @@ class MapOverlay(models.Model):
     )
     is_active = models.BooleanField(default=True, verbose_name=_("Is Active"))
 
+    objects = MapOverlayManager()
+
     class Meta:
         verbose_name = _("Map Overlay")
         verbose_name_plural = _("Map Overlays")
@@ -492,7 +744,12 @@ class MapOverlay(models.Model):
 
 # --- Property Valuation Model ---
 class PropertyValuation(models.Model):
-    valuation_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    class ValuationMethod(models.TextChoices):
+        AI = 'ai', 'AI Model'
+        MANUAL = 'manual', 'Manual'
+        MARKET = 'market', 'Market Comparison'
+
+    valuation_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='valuations')
     estimated_value = models.DecimalField(max_digits=15, decimal_places=2, verbose_name=_("Estimated Value"))
     valuation_date = models.DateTimeField(auto_now_add=True, verbose_name=_("Valuation Date"))
@@ -502,8 +759,8 @@ class PropertyValuation(models.Model):
     )
     valuation_method = models.CharField(
         max_length=50,
-        choices=[('ai', 'AI Model'), ('manual', 'Manual'), ('market', 'Market Comparison')],
-        default='ai',
+        choices=ValuationMethod.choices,
+        default=ValuationMethod.AI,
         verbose_name=_("Valuation Method")
     )
     comparable_properties = models.JSONField(
@@ -525,7 +782,7 @@ class PropertyValuation(models.Model):
 
 # --- Listing Analytics Model ---
 class ListingAnalytics(models.Model):
-    analytics_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    analytics_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     listing = models.ForeignKey(Listing, on_delete=models.CASCADE, related_name='analytics')
     date = models.DateField(verbose_name=_("Date"))
     views = models.PositiveIntegerField(default=0, verbose_name=_("Views"))
@@ -545,32 +802,11 @@ class ListingAnalytics(models.Model):
         indexes = [
             models.Index(fields=['listing', 'date']),
         ]
+        if connection.vendor == 'postgresql':
+            from django.contrib.postgres.indexes import BrinIndex
+            # Append-only time series: BRIN on date is orders of magnitude
+            # smaller than a btree and is all the "last 30 days" scans need.
+            indexes.append(BrinIndex(fields=['date'], name='listing_analytics_date_brin'))
 
     def __str__(self):
         return f"Analytics for {self.listing.property.building_name} - {self.date}"
-
-
-# --- Custom Manager for Listings ---
-class ListingManager(models.Manager):
-    def active_listings(self):
-        return self.filter(is_active=True)
-
-    def by_neighborhood(self, neighborhood):
-        return self.filter(property__address__neighborhood=neighborhood, is_active=True)
-
-    def price_drops(self):
-        return self.filter(price_history__isnull=False, is_active=True).distinct()
-
-    def within_radius(self, latitude, longitude, radius_km=5):
-        # Simple distance filter using Haversine approximation
-        return self.filter(
-            property__address__latitude__gte=latitude - radius_km / 111,
-            property__address__latitude__lte=latitude + radius_km / 111,
-            property__address__longitude__gte=longitude - radius_km / 111,
-            property__address__longitude__lte=longitude + radius_km / 111,
-            is_active=True
-        )
-
-
-# Assign Manager to Listing
-Listing.objects = ListingManager()
\ No newline at end of file
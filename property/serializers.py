@@ -1,4 +1,10 @@
+import copy
+
+from django.core.files.storage import default_storage
+from django.utils.functional import cached_property
 from rest_framework import serializers
+
+
 from .models import (
     Property, Address, Listing, Amenity, ListingAmenity, ListingPhoto, PriceHistory,
     MarketTrend, Transit, PropertyTransit, School, PropertySchool, OpenHouse,
@@ -6,6 +12,108 @@ from .models import (
 )
 
 
+class CachedFieldsSerializerMixin:
+    """Build the field map once per serializer class, then shallow-copy it.
+
+    DRF's get_fields() deep-copies every declared field on each
+    instantiation; with nested serializers that cost repeats for every row
+    of a list response. Caching the constructed fields per class and
+    handing out shallow copies keeps binding per-instance while skipping
+    the rebuild.
+
+    The copies deliberately share the configured state (error_messages,
+    style, child querysets) — none of it is mutated after binding. The
+    validators list is the one attribute callers do extend in place
+    (extra_kwargs, model-derived validators), so it alone is re-listed to
+    keep an append on one instance from leaking into the class cache.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        if '_fields_cache' not in cls.__dict__:
+            cls._fields_cache = super().get_fields()
+        fields = {}
+        for name, field in cls._fields_cache.items():
+            clone = copy.copy(field)
+            clone.validators = list(field.validators)
+            fields[name] = clone
+        return fields
+
+    # Upstream these are generator properties, re-filtered on every
+    # access — for many=True the one child serializer re-walks its field
+    # dict once per row. The split never changes after binding, so
+    # snapshot each as a tuple on first use. Instance-level (not
+    # per-class) because DynamicFieldsSerializerMixin prunes self.fields
+    # per instance.
+    @cached_property
+    def _readable_fields(self):
+        return tuple(field for field in self.fields.values() if not field.write_only)
+
+    @cached_property
+    def _writable_fields(self):
+        return tuple(field for field in self.fields.values() if not field.read_only)
+
+
+class DynamicFieldsSerializerMixin:
+    """Restrict output to a caller-supplied subset of fields.
+
+    Pass fields=['a', 'b'] (e.g. parsed from a ?fields= query param) and
+    everything else is dropped before rendering.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+def _identity(value):
+    return value
+
+
+class FastToRepresentationMixin:
+    """Precompiled to_representation for flat serializers.
+
+    When every readable field maps straight to a model attribute (no dotted
+    sources, no method fields, no nesting), per-row output reduces to a
+    getattr plus the field's own to_representation. The plan is compiled
+    once per class; foreign keys read the stored *_id column so no related
+    row is ever fetched. Falls back to the stock implementation if the
+    serializer turns out not to be flat.
+    """
+
+    def to_representation(self, instance):
+        cls = type(self)
+        if '_repr_plan' not in cls.__dict__:
+            cls._repr_plan = self._build_repr_plan()
+        plan = cls._repr_plan
+        if plan is None:
+            return super().to_representation(instance)
+        data = {}
+        for name, source, convert in plan:
+            value = getattr(instance, source)
+            data[name] = None if value is None else convert(value)
+        return data
+
+    def _build_repr_plan(self):
+        plan = []
+        for field in self._readable_fields:
+            if isinstance(field, serializers.PrimaryKeyRelatedField):
+                plan.append((field.field_name, field.source + '_id', _identity))
+                continue
+            if (
+                isinstance(field, (serializers.SerializerMethodField, serializers.BaseSerializer,
+                                   serializers.ManyRelatedField, serializers.RelatedField))
+                or field.source == '*'
+                or '.' in field.source
+            ):
+                return None
+            plan.append((field.field_name, field.source, field.to_representation))
+        return plan
+
+
 class AddressSerializer(serializers.ModelSerializer):
     """Serializer for the Address model."""
     class Meta:
@@ -13,7 +121,7 @@ class AddressSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class PropertySerializer(serializers.ModelSerializer):
+class PropertySerializer(DynamicFieldsSerializerMixin, CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for the Property model with nested Address."""
     address = AddressSerializer(read_only=True)
 
@@ -22,7 +130,7 @@ class PropertySerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class ListingSerializer(serializers.ModelSerializer):
+class ListingSerializer(DynamicFieldsSerializerMixin, CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for the Listing model with nested Property."""
     property = PropertySerializer(read_only=True)
 
@@ -31,14 +139,25 @@ class ListingSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class AmenitySerializer(serializers.ModelSerializer):
+class ListingListSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    """Compact Listing serializer for list endpoints, matching ListingManager.for_list()."""
+    class Meta:
+        model = Listing
+        fields = [
+            'listing_id', 'property', 'listing_type', 'price', 'bedrooms',
+            'bathrooms', 'square_footage', 'is_active', 'listed_date',
+            'days_on_market', 'is_no_fee',
+        ]
+
+
+class AmenitySerializer(FastToRepresentationMixin, serializers.ModelSerializer):
     """Serializer for the Amenity model."""
     class Meta:
         model = Amenity
         fields = '__all__'
 
 
-class ListingAmenitySerializer(serializers.ModelSerializer):
+class ListingAmenitySerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for the ListingAmenity model with nested Amenity."""
     amenity = AmenitySerializer(read_only=True)
 
@@ -47,10 +166,21 @@ class ListingAmenitySerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
+class ListingDetailSerializer(ListingSerializer):
+    """Listing with its amenities inlined for the detail endpoint.
+
+    Pair with Prefetch('amenities', ListingAmenity.objects
+    .select_related('amenity')) so the nested rows arrive in one IN query
+    instead of one query per amenity row.
+    """
+    amenities = ListingAmenitySerializer(many=True, read_only=True)
+
+
 class ListingPhotoSerializer(serializers.ModelSerializer):
     """Serializer for the ListingPhoto model."""
     # Optional: Add a computed field for image URL if needed
     image_url = serializers.SerializerMethodField()
+    variant_urls = serializers.SerializerMethodField()
 
     class Meta:
         model = ListingPhoto
@@ -63,8 +193,14 @@ class ListingPhotoSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return None
 
+    def get_variant_urls(self, obj):
+        """Return storage URLs for the resized WebP renditions."""
+        if not obj.variants:
+            return {}
+        return {name: default_storage.url(info['key']) for name, info in obj.variants.items()}
+
 
-class PriceHistorySerializer(serializers.ModelSerializer):
+class PriceHistorySerializer(FastToRepresentationMixin, serializers.ModelSerializer):
     """Serializer for the PriceHistory model."""
     class Meta:
         model = PriceHistory
@@ -78,14 +214,14 @@ class MarketTrendSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class TransitSerializer(serializers.ModelSerializer):
+class TransitSerializer(FastToRepresentationMixin, serializers.ModelSerializer):
     """Serializer for the Transit model."""
     class Meta:
         model = Transit
         fields = '__all__'
 
 
-class PropertyTransitSerializer(serializers.ModelSerializer):
+class PropertyTransitSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for the PropertyTransit model with nested Transit."""
     transit = TransitSerializer(read_only=True)
 
@@ -94,14 +230,14 @@ class PropertyTransitSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class SchoolSerializer(serializers.ModelSerializer):
+class SchoolSerializer(FastToRepresentationMixin, serializers.ModelSerializer):
     """Serializer for the School model."""
     class Meta:
         model = School
         fields = '__all__'
 
 
-class PropertySchoolSerializer(serializers.ModelSerializer):
+class PropertySchoolSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for the PropertySchool model with nested School."""
     school = SchoolSerializer(read_only=True)
 
@@ -110,14 +246,14 @@ class PropertySchoolSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class OpenHouseSerializer(serializers.ModelSerializer):
+class OpenHouseSerializer(FastToRepresentationMixin, serializers.ModelSerializer):
     """Serializer for the OpenHouse model."""
     class Meta:
         model = OpenHouse
         fields = '__all__'
 
 
-class MapClusterSerializer(serializers.ModelSerializer):
+class MapClusterSerializer(FastToRepresentationMixin, serializers.ModelSerializer):
     """Serializer for the MapCluster model."""
     class Meta:
         model = MapCluster
@@ -131,6 +267,13 @@ class MapOverlaySerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
+class MapOverlayListSerializer(serializers.ModelSerializer):
+    """MapOverlay serializer without the (potentially huge) overlay_data blob."""
+    class Meta:
+        model = MapOverlay
+        exclude = ['overlay_data']
+
+
 class PropertyValuationSerializer(serializers.ModelSerializer):
     """Serializer for the PropertyValuation model."""
     class Meta:
@@ -138,7 +281,7 @@ class PropertyValuationSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class ListingAnalyticsSerializer(serializers.ModelSerializer):
+class ListingAnalyticsSerializer(FastToRepresentationMixin, serializers.ModelSerializer):
     """Serializer for the ListingAnalytics model."""
     class Meta:
         model = ListingAnalytics
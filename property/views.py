@@ -1,12 +1,14 @@
+from django.core.paginator import Paginator
 from django.shortcuts import render, get_object_or_404
 from django.views.decorators.cache import cache_page
 from django.views.decorators.vary import vary_on_cookie
 from django.core.cache import cache
-from django.http import JsonResponse, HttpResponse
+from django.http import Http404, JsonResponse, HttpResponse
 from django.views import View
 from django.utils.decorators import method_decorator
 from django.contrib.auth.decorators import login_required
 from rest_framework import generics, status, filters
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
@@ -19,19 +21,23 @@ from .models import (
 )
 from users.models import UserProperty
 from .serializers import (
-    PropertySerializer, ListingSerializer, AddressSerializer, AmenitySerializer,
-    ListingAmenitySerializer, ListingPhotoSerializer, PriceHistorySerializer,
+    PropertySerializer, ListingSerializer, ListingDetailSerializer,
+    ListingListSerializer, AddressSerializer,
+    AmenitySerializer, ListingAmenitySerializer, ListingPhotoSerializer, PriceHistorySerializer,
     MarketTrendSerializer, TransitSerializer, PropertyTransitSerializer,
     SchoolSerializer, PropertySchoolSerializer, OpenHouseSerializer,
-    MapClusterSerializer, MapOverlaySerializer, PropertyValuationSerializer,
-    ListingAnalyticsSerializer
+    MapClusterSerializer, MapOverlaySerializer, MapOverlayListSerializer,
+    PropertyValuationSerializer, ListingAnalyticsSerializer
 )
-from django.db.models import Count, Avg, Q
+from django.db import transaction
+from django.db.models import Count, Avg, Prefetch, Q
 from functools import reduce
 from math import sqrt
 import json
 import logging
 
+from . import counters
+
 logger = logging.getLogger(__name__)
 
 # --- Pagination Class ---
@@ -47,28 +53,152 @@ def calculate_distance(lat1, lon1, lat2, lon2):
     lon_diff = (lon1 - lon2) * 111 * abs(lat1)
     return sqrt(lat_diff**2 + lon_diff**2)
 
+def calculate_distances(points, lat0, lon0):
+    """Bulk calculate_distance for a sequence of (lat, lon) pairs.
+
+    The per-degree scale factors are hoisted out of the loop and the whole
+    batch runs as one comprehension instead of a function call per point —
+    the cheap pure-Python take on vectorizing the distance math.
+    """
+    lat_scale = 111.0
+    lon_scale = 111.0 * abs(lat0)
+    return [
+        sqrt(((lat0 - lat) * lat_scale) ** 2 + ((lon0 - lon) * lon_scale) ** 2)
+        for lat, lon in points
+    ]
+
 def update_map_clusters():
-    """Update MapCluster dynamically."""
-    clusters = MapCluster.objects.all()
+    """Recompute cluster stats and persist them in one bulk UPDATE."""
+    clusters = list(MapCluster.objects.all())
     for cluster in clusters:
         listings = Listing.objects.within_radius(cluster.center_latitude, cluster.center_longitude, cluster.radius_km)
-        cluster.property_count = listings.values('property').distinct().count()
-        cluster.listing_count = listings.count()
-        cluster.avg_price = listings.aggregate(Avg('price'))['price__avg'] or 0
-        cluster.save()
+        # One fused aggregate instead of three separate scans per cluster.
+        # Clusters are independent circles (arbitrary center/radius), so
+        # their membership can't be expressed as a single GROUP BY.
+        stats = listings.aggregate(
+            property_count=Count('property', distinct=True),
+            listing_count=Count('pk'),
+            avg_price=Avg('price'),
+        )
+        cluster.property_count = stats['property_count']
+        cluster.listing_count = stats['listing_count']
+        cluster.avg_price = stats['avg_price'] or 0
+    MapCluster.objects.bulk_update(
+        clusters, ['property_count', 'listing_count', 'avg_price'], batch_size=500
+    )
     cache.delete('map_clusters')
 
-def invalidate_cache(key_pattern):
-    """Invalidate cache keys matching a pattern (simplified for latest Django)."""
-    # Django doesn’t natively support pattern deletion; use cache.clear() for simplicity or a custom backend
-    cache.delete(key_pattern)  # Assumes exact key match; adjust if using a custom cache backend
+def schedule_cluster_refresh():
+    """Mark cluster stats stale once the write lands.
+
+    The refresh itself runs out of band via the refresh_map_clusters
+    management command (scheduled like flush_counters), so listing writes
+    return at the cost of their INSERT/UPDATE alone.
+    """
+    transaction.on_commit(lambda: cache.set('map_clusters_stale', True, timeout=None))
+
+def to_plain(value):
+    """Recursively convert ReturnDict/OrderedDict trees to builtin types.
+
+    DRF responses are OrderedDict trees, which pickle several times slower
+    than plain dicts; key order is irrelevant for a cached JSON payload.
+    """
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    return value
+
+def get_clusters_payload():
+    """Serialized cluster list, computed once per refresh tick.
+
+    update_map_clusters deletes the key after each recompute, so every map
+    request in between reuses the same serialized payload instead of
+    re-serializing all clusters.
+    """
+    return cache.get_or_set(
+        'map_clusters',
+        lambda: to_plain(MapClusterSerializer(MapCluster.objects.all(), many=True).data),
+        timeout=60 * 10,
+    )
+
+def get_overlays_payload():
+    """Serialized active-overlay list, shared across map requests."""
+    return cache.get_or_set(
+        'map_overlays',
+        lambda: to_plain(
+            MapOverlayListSerializer(
+                MapOverlay.objects.lightweight().filter(is_active=True), many=True
+            ).data
+        ),
+        timeout=60 * 10,
+    )
+
+def invalidate_cache(*keys):
+    """Drop one or more exact cache keys in a single backend round-trip."""
+    cache.delete_many(keys)
+
+def listing_list_version():
+    """Current version of the listing-list cache key family."""
+    return cache.get_or_set('listing_list_ver', 1, timeout=None)
+
+def bump_listing_list_version():
+    """Invalidate every cached listing-list variant with one O(1) INCR.
+
+    Each cached page embeds the version in its key, so bumping the counter
+    orphans all variants at once — no pattern deletes, no stale pages
+    lingering until their TTL.
+    """
+    try:
+        cache.incr('listing_list_ver')
+    except ValueError:
+        cache.set('listing_list_ver', 1, timeout=None)
+
+# --- Dynamic field selection (?fields=...) ---
+class DynamicFieldsViewMixin:
+    """Honor ?fields= on GET: prune serializer output and .only() the query.
+
+    eager_relations maps serializer field -> select_related path, so joins
+    are kept only when the caller actually asked for the nested object.
+    """
+    eager_relations = {}
+
+    def get_requested_fields(self):
+        fields = self.request.query_params.get('fields')
+        if not fields:
+            return None
+        return [name.strip() for name in fields.split(',') if name.strip()]
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields and self.request.method == 'GET':
+            kwargs['fields'] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_requested_fields()
+        if not fields or self.request.method != 'GET':
+            return queryset
+        model_fields = {f.name for f in queryset.model._meta.concrete_fields}
+        only = [name for name in fields if name in model_fields]
+        if not only:
+            return queryset
+        queryset = queryset.select_related(None)
+        for field_name, path in self.eager_relations.items():
+            if field_name in only:
+                queryset = queryset.select_related(path)
+        return queryset.only(*only)
 
 # --- CRUD API Views with DRF Generics ---
-class PropertyListCreateView(generics.ListCreateAPIView):
-    queryset = Property.objects.all()
+class PropertyListCreateView(DynamicFieldsViewMixin, generics.ListCreateAPIView):
+    # PropertySerializer nests the address, so join it up front instead of
+    # one SELECT per row.
+    queryset = Property.objects.select_related('address')
     serializer_class = PropertySerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     pagination_class = StandardPagination
+    eager_relations = {'address': 'address'}
 
     @method_decorator(cache_page(60 * 15))
     @method_decorator(vary_on_cookie)
@@ -89,53 +219,70 @@ class PropertyListCreateView(generics.ListCreateAPIView):
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
-        invalidate_cache('property_list')
-        invalidate_cache('property_detail')
+        invalidate_cache('property_list', 'property_detail')
 
 class PropertyDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Property.objects.all()
+    queryset = Property.objects.select_related('address')
     serializer_class = PropertySerializer
     lookup_field = 'property_id'
 
     def get(self, request, *args, **kwargs):
         cache_key = f"property_detail_{self.kwargs['property_id']}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
+        cached_body = cache.get(cache_key)
+        if cached_body is not None:
+            # Pre-rendered bytes: no serializer, no renderer on hits
+            return HttpResponse(cached_body, content_type='application/json')
         response = super().get(request, *args, **kwargs)
-        cache.set(cache_key, response.data, timeout=60 * 60)
+        cache.set(cache_key, JSONRenderer().render(response.data), timeout=60 * 60)
         return response
 
     def perform_update(self, serializer):
         serializer.save()
-        invalidate_cache(f"property_detail_{self.kwargs['property_id']}")
-        invalidate_cache('property_list')
+        invalidate_cache(f"property_detail_{self.kwargs['property_id']}", 'property_list')
 
     def perform_destroy(self, instance):
         instance.delete()
-        invalidate_cache(f"property_detail_{self.kwargs['property_id']}")
-        invalidate_cache('property_list')
+        invalidate_cache(f"property_detail_{self.kwargs['property_id']}", 'property_list')
 
-class ListingListCreateView(generics.ListCreateAPIView):
-    queryset = Listing.objects.active_listings()
+class ListingListCreateView(DynamicFieldsViewMixin, generics.ListCreateAPIView):
+    # ListingSerializer nests property -> address; fetch both in the same
+    # query so a page of 20 listings is 1 SELECT instead of 40+.
+    queryset = Listing.objects.active_listings().select_related('property__address')
     serializer_class = ListingSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     pagination_class = StandardPagination
+    eager_relations = {'property': 'property__address'}
 
-    @method_decorator(cache_page(60 * 10))
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        # Versioned key instead of cache_page: writes bump the version,
+        # which cache_page's URL-derived keys could never be told about.
+        cache_key = f"listing_list_v{listing_list_version()}:{request.get_full_path()}"
+        cached_data = cache.get(cache_key)
+        if cached_data is not None:
+            return Response(cached_data)
+        response = super().get(request, *args, **kwargs)
+        cache.set(cache_key, to_plain(response.data), timeout=60 * 10)
+        return response
 
     def get_queryset(self):
         queryset = super().get_queryset()
+
+        def param(name, cast):
+            # QueryDict.get has no type= kwarg; coerce by hand and drop junk
+            value = self.request.query_params.get(name)
+            try:
+                return cast(value) if value is not None else None
+            except (TypeError, ValueError):
+                return None
+
         filters = {
-            'min_price': self.request.query_params.get('min_price', type=float),
-            'max_price': self.request.query_params.get('max_price', type=float),
-            'bedrooms': self.request.query_params.get('bedrooms', type=int),
+            'min_price': param('min_price', float),
+            'max_price': param('max_price', float),
+            'bedrooms': param('bedrooms', int),
             'neighborhood': self.request.query_params.get('neighborhood'),
-            'latitude': self.request.query_params.get('latitude', type=float),
-            'longitude': self.request.query_params.get('longitude', type=float),
-            'radius': float(self.request.query_params.get('radius', 5)),
+            'latitude': param('latitude', float),
+            'longitude': param('longitude', float),
+            'radius': param('radius', float) or 5,
         }
         if filters['min_price']:
             queryset = queryset.filter(price__gte=filters['min_price'])
@@ -151,38 +298,42 @@ class ListingListCreateView(generics.ListCreateAPIView):
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
-        invalidate_cache('listing_list')
-        invalidate_cache('listing_detail')
-        update_map_clusters()
+        bump_listing_list_version()
+        schedule_cluster_refresh()
 
 class ListingDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Listing.objects.all()
-    serializer_class = ListingSerializer
+    # Amenities come back in one IN query with their Amenity rows joined,
+    # instead of a query per ListingAmenity plus one per Amenity.
+    queryset = Listing.objects.select_related('property__address').prefetch_related(
+        Prefetch('amenities', queryset=ListingAmenity.objects.select_related('amenity'))
+    )
+    serializer_class = ListingDetailSerializer
     lookup_field = 'listing_id'
 
     def get(self, request, *args, **kwargs):
         cache_key = f"listing_detail_{self.kwargs['listing_id']}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
-        instance = self.get_object()
-        instance.views_count += 1
-        instance.save(update_fields=['views_count'])
+        # Bump straight off the URL kwarg (cache hits count too): no extra
+        # SELECT, and the Redis HINCRBY buffer makes concurrent increments
+        # atomic (flushed to the DB as F() updates by flush_counters).
+        counters.bump('listing', self.kwargs['listing_id'], 'views_count')
+        cached_body = cache.get(cache_key)
+        if cached_body is not None:
+            return HttpResponse(cached_body, content_type='application/json')
         response = super().get(request, *args, **kwargs)
-        cache.set(cache_key, response.data, timeout=60 * 30)
+        cache.set(cache_key, JSONRenderer().render(response.data), timeout=60 * 30)
         return response
 
     def perform_update(self, serializer):
         serializer.save()
         invalidate_cache(f"listing_detail_{self.kwargs['listing_id']}")
-        invalidate_cache('listing_list')
-        update_map_clusters()
+        bump_listing_list_version()
+        schedule_cluster_refresh()
 
     def perform_destroy(self, instance):
         instance.delete()
         invalidate_cache(f"listing_detail_{self.kwargs['listing_id']}")
-        invalidate_cache('listing_list')
-        update_map_clusters()
+        bump_listing_list_version()
+        schedule_cluster_refresh()
 
 # --- Map-Specific Views ---
 class ListingMapView(generics.GenericAPIView):
@@ -193,21 +344,31 @@ class ListingMapView(generics.GenericAPIView):
         lat = float(request.query_params.get('latitude', 40.7128))
         lon = float(request.query_params.get('longitude', -74.0060))
         radius = float(request.query_params.get('radius', 5))
-        listings = Listing.objects.within_radius(lat, lon, radius)
+        # heatmap_data walks property.address per row; join it up front and
+        # materialize once so the counts/average reuse the same rows instead
+        # of re-running the query per statistic.
+        candidates = list(
+            Listing.objects.within_radius(lat, lon, radius).select_related('property__address')
+        )
+        # within_radius is a bounding box; trim the corners with one bulk
+        # distance pass so the response really is a circle of radius_km.
+        coords = [(l.latitude, l.longitude) for l in candidates]
+        distances = calculate_distances(coords, lat, lon)
+        listings = [l for l, d in zip(candidates, distances) if d <= radius]
 
         data = {
             'listings': ListingSerializer(listings, many=True).data,
             'center': {'latitude': lat, 'longitude': lon},
             'radius_km': radius,
-            'property_count': listings.values('property').distinct().count(),
-            'listing_count': listings.count(),
-            'avg_price': listings.aggregate(Avg('price'))['price__avg'] or 0,
+            'property_count': len({l.property_id for l in listings}),
+            'listing_count': len(listings),
+            'avg_price': (sum(l.price for l in listings) / len(listings)) if listings else 0,
             'heatmap_data': [
-                {'lat': l.property.address.latitude, 'lon': l.property.address.longitude, 'weight': l.heatmap_weight}
+                {'lat': l.latitude, 'lon': l.longitude, 'weight': l.heatmap_weight}
                 for l in listings
             ],
-            'clusters': MapClusterSerializer(MapCluster.objects.all(), many=True).data,
-            'overlays': MapOverlaySerializer(MapOverlay.objects.filter(is_active=True), many=True).data
+            'clusters': get_clusters_payload(),
+            'overlays': get_overlays_payload()
         }
         return Response(data)
 
@@ -217,47 +378,62 @@ class MapClusterListCreateView(generics.ListCreateAPIView):
 
     @method_decorator(cache_page(60 * 10))
     def get(self, request, *args, **kwargs):
-        update_map_clusters()
+        # Serve the stored stats; the scheduled refresh keeps them current
+        # instead of recomputing every cluster inside the request.
         return super().get(request, *args, **kwargs)
 
     def perform_create(self, serializer):
         serializer.save()
-        update_map_clusters()
+        schedule_cluster_refresh()
         invalidate_cache('map_clusters')
 
 # --- User Interaction Views ---
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def favorite_listing(request, listing_id):
-    listing = get_object_or_404(Listing, listing_id=listing_id)
+    # Only the property FK is needed; skip loading (and joining) the rest
+    property_id = (
+        Listing.objects.filter(listing_id=listing_id)
+        .values_list('property_id', flat=True)
+        .first()
+    )
+    if property_id is None:
+        raise Http404
     # Assuming UserProperty or similar model for favorites
-    UserProperty.objects.get_or_create(user=request.user, property=listing.property, property_type='saved')
-    listing.favorites_count += 1
-    listing.save(update_fields=['favorites_count'])
+    UserProperty.objects.get_or_create(user=request.user, property_id=property_id, property_type='saved')
+    counters.bump('listing', listing_id, 'favorites_count')
     invalidate_cache(f"listing_detail_{listing_id}")
     return Response({'message': 'Listing favorited'}, status=status.HTTP_200_OK)
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def send_inquiry(request, listing_id):
-    listing = get_object_or_404(Listing, listing_id=listing_id)
+    if not Listing.objects.filter(listing_id=listing_id).exists():
+        raise Http404
     message = request.data.get('message')
     if not message:
         return Response({'error': 'Message required'}, status=status.HTTP_400_BAD_REQUEST)
     # Logic to send inquiry (e.g., email or notification) can be added
-    listing.inquiries_count += 1
-    listing.save(update_fields=['inquiries_count'])
+    counters.bump('listing', listing_id, 'inquiries_count')
     invalidate_cache(f"listing_detail_{listing_id}")
     return Response({'message': 'Inquiry sent'}, status=status.HTTP_200_OK)
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def rsvp_open_house(request, open_house_id):
-    open_house = get_object_or_404(OpenHouse, open_house_id=open_house_id)
-    if open_house.registration_required:
-        open_house.attendees_count += 1
-        open_house.save(update_fields=['attendees_count'])
-        invalidate_cache(f"open_houses_{open_house.listing.listing_id}")
+    # One two-column fetch covers the 404 check, the flag and the
+    # invalidation key (the old path loaded the row, then the listing too)
+    row = (
+        OpenHouse.objects.filter(open_house_id=open_house_id)
+        .values_list('registration_required', 'listing_id')
+        .first()
+    )
+    if row is None:
+        raise Http404
+    registration_required, listing_id = row
+    if registration_required:
+        counters.bump('openhouse', open_house_id, 'attendees_count')
+        invalidate_cache(f"open_houses_{listing_id}")
         # Add user to RSVP list (e.g., via a related model)
     return Response({'message': 'RSVP confirmed'}, status=status.HTTP_200_OK)
 
@@ -266,18 +442,29 @@ def rsvp_open_house(request, open_house_id):
 @permission_classes([IsAuthenticated])
 def bulk_listing_upload(request):
     listings_data = request.data.get('listings', [])
-    created_listings = []
-    for data in listings_data:
-        serializer = ListingSerializer(data=data, context={'request': request})
-        if serializer.is_valid():
-            serializer.save(user=request.user)
-            created_listings.append(serializer.data)
-    if created_listings:
-        invalidate_cache('listing_list')
-        invalidate_cache('listing_detail')
-        update_map_clusters()
-        return Response({'created': created_listings}, status=status.HTTP_201_CREATED)
-    return Response({'error': 'No valid listings'}, status=status.HTTP_400_BAD_REQUEST)
+    if not listings_data:
+        return Response({'error': 'No valid listings'}, status=status.HTTP_400_BAD_REQUEST)
+    # Validate the whole batch in one serializer pass, insert it in
+    # ceil(N/500) statements, and return just the new IDs instead of
+    # re-serializing every row.
+    serializer = ListingSerializer(data=listings_data, many=True, context={'request': request})
+    if not serializer.is_valid():
+        return Response(
+            {'error': 'No valid listings', 'details': serializer.errors},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    instances = []
+    for validated in serializer.validated_data:
+        validated.pop('user', None)
+        instances.append(Listing(user=request.user, **validated))
+    with transaction.atomic():
+        created = Listing.objects.bulk_create(instances, batch_size=500)
+        bump_listing_list_version()
+        schedule_cluster_refresh()
+    return Response(
+        {'created': [str(listing.listing_id) for listing in created]},
+        status=status.HTTP_201_CREATED,
+    )
 
 # --- Analytics Dashboard View ---
 class ListingAnalyticsDashboardView(generics.GenericAPIView):
@@ -286,29 +473,36 @@ class ListingAnalyticsDashboardView(generics.GenericAPIView):
 
     def get(self, request, listing_id):
         cache_key = f"listing_analytics_dashboard_{listing_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
+        cached_body = cache.get(cache_key)
+        if cached_body is not None:
+            return HttpResponse(cached_body, content_type='application/json')
 
-        listing = get_object_or_404(Listing, listing_id=listing_id)
+        listing = get_object_or_404(
+            Listing.objects.select_related('property__address'), listing_id=listing_id
+        )
         analytics = ListingAnalytics.objects.filter(listing=listing)
         serializer = self.get_serializer(analytics, many=True)
+        # Both averages in one scan instead of one aggregate query each
+        totals = analytics.aggregate(avg_views=Avg('views'), avg_inquiries=Avg('inquiries'))
         data = {
             'listing': ListingSerializer(listing).data,
             'analytics': serializer.data,
-            'total_views': analytics.aggregate(Avg('views'))['views__avg'] or 0,
-            'total_inquiries': analytics.aggregate(Avg('inquiries'))['inquiries__avg'] or 0,
+            'total_views': totals['avg_views'] or 0,
+            'total_inquiries': totals['avg_inquiries'] or 0,
         }
-        cache.set(cache_key, data, timeout=60 * 60)
-        return Response(data)
+        body = JSONRenderer().render(data)
+        cache.set(cache_key, body, timeout=60 * 60)
+        return HttpResponse(body, content_type='application/json')
 
 # --- Traditional Views with CRUD ---
 @method_decorator(login_required, name='dispatch')
 @method_decorator(cache_page(60 * 15), name='dispatch')
 class PropertyListView(View):
     def get(self, request):
-        properties = Property.objects.all()
-        context = {'properties': properties}
+        # Unbounded .all() loaded the whole table per render; page it.
+        paginator = Paginator(Property.objects.select_related('address').order_by('created_at'), 50)
+        page_obj = paginator.get_page(request.GET.get('page'))
+        context = {'properties': page_obj.object_list, 'page_obj': page_obj}
         return render(request, 'property_app/property_list.html', context)
 
 @method_decorator(login_required, name='dispatch')
@@ -330,7 +524,8 @@ class PropertyCreateView(View):
 @method_decorator(login_required, name='dispatch')
 class ListingCreateView(View):
     def get(self, request):
-        properties = Property.objects.all()
+        # Dropdown source: stream in chunks instead of one giant fetch
+        properties = Property.objects.order_by('building_name').iterator(chunk_size=2000)
         return render(request, 'property_app/listing_create.html', {'properties': properties})
 
     def post(self, request):
@@ -342,8 +537,8 @@ class ListingCreateView(View):
             price=data.get('price'),
             # Add other fields
         )
-        invalidate_cache('listing_list')
-        update_map_clusters()
+        bump_listing_list_version()
+        schedule_cluster_refresh()
         return JsonResponse({'message': 'Listing created', 'listing_id': str(listing.listing_id)})
 
 # --- Additional StreetEasy-Inspired Views ---
@@ -352,16 +547,18 @@ class NeighborhoodStatsView(View):
     def get(self, request, neighborhood):
         trends = MarketTrend.objects.filter(neighborhood=neighborhood)
         listings = Listing.objects.by_neighborhood(neighborhood)
+        # Count and average share one scan of the neighborhood's listings
+        stats = listings.aggregate(listing_count=Count('pk'), avg_price=Avg('price'))
         context = {
             'neighborhood': neighborhood,
             'trends': trends,
-            'listing_count': listings.count(),
-            'avg_price': listings.aggregate(Avg('price'))['price__avg'] or 0,
+            'listing_count': stats['listing_count'],
+            'avg_price': stats['avg_price'] or 0,
         }
         return render(request, 'property_app/neighborhood_stats.html', context)
 
 @api_view(['GET'])
 def price_drop_listings(request):
-    listings = Listing.objects.price_drops()
-    serializer = ListingSerializer(listings, many=True, context={'request': request})
+    listings = Listing.objects.price_drops().for_list()
+    serializer = ListingListSerializer(listings, many=True, context={'request': request})
     return Response(serializer.data)
\ No newline at end of file
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        # Each worker process listens for cache invalidations published
+        # by writers so its in-process L1 stays coherent.
+        from RESPlateForm.cache_bus import ensure_listener
+        ensure_listener()
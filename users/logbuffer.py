@@ -0,0 +1,60 @@
+# -------- Request-Scoped Log Buffering --------- #
+# Append-only log rows (UserActivity, UserMapInteraction, UserNotification,
+# UserAuditLog) don't need to hit the database one INSERT at a time: rows
+# queued during a request are flushed on response as one bulk_create per
+# model, so a request that logs N events costs one round trip, not N.
+#
+# Opt-in: nothing in the request path calls log() yet — the signup
+# activity row deliberately stays inside the create_user transaction,
+# and the viewset creates echo the inserted row (pk, db-defaulted
+# timestamp) back in the response, so they can't defer the INSERT.
+# LogBufferMiddleware therefore is NOT installed; add it to MIDDLEWARE
+# together with the first fire-and-forget writer that adopts log().
+# Without the middleware, log() degrades to an immediate save().
+import threading
+
+_buffers = threading.local()
+
+
+def log(instance):
+    """Queue an unsaved log row for bulk insert at the end of the request.
+
+    Outside a request cycle (management commands, shells) the row is
+    written through immediately. Buffered instances do not get a pk until
+    the flush, so only fire-and-forget rows belong here — anything whose
+    id the response needs should still be saved directly.
+    """
+    buf = getattr(_buffers, 'rows', None)
+    if buf is None:
+        instance.save()
+        return instance
+    buf.setdefault(type(instance), []).append(instance)
+    return instance
+
+
+def open_buffer():
+    _buffers.rows = {}
+
+
+def flush_buffer():
+    rows = getattr(_buffers, 'rows', None)
+    _buffers.rows = None
+    if not rows:
+        return
+    for model, instances in rows.items():
+        model.objects.bulk_create(instances, batch_size=1000)
+
+
+class LogBufferMiddleware:
+    """Open a log buffer per request and flush it after the response is built."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        open_buffer()
+        try:
+            response = self.get_response(request)
+        finally:
+            flush_buffer()
+        return response
@@ -0,0 +1,41 @@
+import hashlib
+
+from django.core.management.base import BaseCommand
+
+from users.models import UserDocument
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute SHA-256 checksums for uploaded user documents that have "
+        "none yet. Runs out of band (cron/worker) so the upload request "
+        "never re-reads the file; documents are streamed in 64KiB chunks "
+        "through default_storage, so memory stays flat for large files."
+    )
+
+    def handle(self, *args, **options):
+        pending = (
+            UserDocument.objects.select_related(None)
+            .filter(checksum='')
+            .only('pk', 'file')
+        )
+        processed = 0
+        missing = 0
+        for doc in pending.iterator(chunk_size=500):
+            digest = hashlib.sha256()
+            try:
+                with doc.file.open('rb') as fh:
+                    for chunk in fh.chunks(CHUNK_SIZE):
+                        digest.update(chunk)
+            except (FileNotFoundError, ValueError):
+                missing += 1
+                continue
+            # Targeted UPDATE: no save() signals, no full-row write.
+            UserDocument.objects.filter(pk=doc.pk).update(checksum=digest.hexdigest())
+            processed += 1
+        message = f"Hashed {processed} documents"
+        if missing:
+            message += f" ({missing} skipped: file missing)"
+        self.stdout.write(self.style.SUCCESS(message))
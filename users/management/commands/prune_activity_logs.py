@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from users.models import UserActivity, UserMapInteraction
+
+BATCH_SIZE = 10000
+
+LOG_MODELS = [UserActivity, UserMapInteraction]
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete activity/map-interaction log rows older than the retention "
+        "window, in primary-key batches so the table is never locked for "
+        "one giant DELETE. Meant to run nightly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=365,
+            help="Retention window in days (default 365).",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        for model in LOG_MODELS:
+            total = 0
+            while True:
+                pks = list(
+                    model.objects.select_related(None)
+                    .filter(timestamp__lt=cutoff)
+                    .values_list('pk', flat=True)[:BATCH_SIZE]
+                )
+                if not pks:
+                    break
+                deleted, _ = model.objects.filter(pk__in=pks).delete()
+                total += deleted
+            self.stdout.write(self.style.SUCCESS(
+                f"Pruned {total} {model._meta.label} rows older than {options['days']} days"
+            ))
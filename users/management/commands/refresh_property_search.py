@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+
+from users.models import AgentProfile, PropertySearchEntry, UserProperty
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized property search table from UserProperty and AgentProfile."
+
+    def handle(self, *args, **options):
+        agents = {
+            a.user_id: a
+            for a in AgentProfile.objects.select_related(None).only('user_id', 'rating', 'review_count', 'verified_agent')
+        }
+        entries = []
+        total = 0
+        for prop in UserProperty.objects.all().iterator(chunk_size=2000):
+            agent = agents.get(prop.user_id)
+            entries.append(PropertySearchEntry(
+                property=prop,
+                user_id=prop.user_id,
+                property_type=prop.property_type,
+                city=prop.city,
+                price=prop.price,
+                bedrooms=prop.bedrooms,
+                location_latitude=prop.location_latitude,
+                location_longitude=prop.location_longitude,
+                is_active=prop.is_active,
+                agent_rating=agent.rating if agent else 0.0,
+                agent_review_count=agent.review_count if agent else 0,
+                agent_verified=agent.verified_agent if agent else False,
+            ))
+            if len(entries) >= BATCH_SIZE:
+                total += self._flush(entries)
+                entries = []
+        total += self._flush(entries)
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {total} search entries"))
+
+    @staticmethod
+    def _flush(entries):
+        if not entries:
+            return 0
+        PropertySearchEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=['property'],
+            update_fields=[
+                'user', 'property_type', 'city', 'price', 'bedrooms',
+                'location_latitude', 'location_longitude', 'is_active',
+                'agent_rating', 'agent_review_count', 'agent_verified',
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        return len(entries)
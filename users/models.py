@@ -1,6 +1,11 @@
 # -------- Users App Models --------- #
-from django.db import models
+import ipaddress
+import math
+
+from django.core.cache import cache
+from django.db import connection, models, transaction
 from django.contrib.auth.models import AbstractUser, UserManager
+from django.db.models.functions import Coalesce, Concat, NullIf, Now, Sqrt, Trim
 from django.utils import timezone
 from django.core.validators import (
     MinLengthValidator, RegexValidator, MinValueValidator, MaxValueValidator,
@@ -11,6 +16,156 @@ from django_countries.fields import CountryField
 import uuid
 from django.utils.translation import gettext_lazy as _
 
+from RESPlateForm.cache_bus import publish_invalidation
+
+if connection.vendor == 'postgresql':
+    # Needs the pgcrypto extension for gen_random_uuid() on PostgreSQL < 13.
+    _REFERRAL_CODE_DB_DEFAULT = models.expressions.RawSQL(
+        "substr(replace(gen_random_uuid()::text, '-', ''), 1, 10)", []
+    )
+else:
+    # randomblob(5) hex-encodes to exactly 10 characters.
+    _REFERRAL_CODE_DB_DEFAULT = models.expressions.RawSQL("lower(hex(randomblob(5)))", [])
+
+
+# Fixed amenity vocabulary backing User.preferred_amenities_mask. A set
+# check against these is one integer AND per row, versus parsing JSON;
+# anything outside this list stays in the preferred_amenities JSONField.
+AMENITY_BITS = {
+    'pool': 1 << 0,
+    'gym': 1 << 1,
+    'doorman': 1 << 2,
+    'parking': 1 << 3,
+    'elevator': 1 << 4,
+    'laundry': 1 << 5,
+    'dishwasher': 1 << 6,
+    'balcony': 1 << 7,
+    'roof_deck': 1 << 8,
+    'storage': 1 << 9,
+    'bike_room': 1 << 10,
+    'pets_allowed': 1 << 11,
+}
+
+
+def amenities_to_mask(names):
+    """Encode an iterable of amenity names into the bitmask; unknown names are ignored."""
+    mask = 0
+    for name in names or ():
+        mask |= AMENITY_BITS.get(name, 0)
+    return mask
+
+
+def mask_to_amenities(mask):
+    """Decode a bitmask back into the list of amenity names it contains."""
+    return [name for name, bit in AMENITY_BITS.items() if mask & bit]
+
+
+def _name_part(field_name):
+    """Name component plus trailing space, or '' when the column is NULL/blank.
+
+    Building blocks for the full_name generated column; spelled with
+    Case/Concat rather than concat_ws so the expression compiles on both
+    SQLite and PostgreSQL.
+    """
+    return models.Case(
+        models.When(
+            models.Q(**{f"{field_name}__isnull": False}) & ~models.Q(**{field_name: ''}),
+            then=Concat(models.F(field_name), models.Value(' ')),
+        ),
+        default=models.Value(''),
+    )
+
+
+def _today():
+    """Callable MaxValueValidator limit; evaluated per validation, not at import."""
+    return timezone.now().date()
+
+
+def _current_year():
+    """Callable MaxValueValidator limit; evaluated per validation, not at import."""
+    return timezone.now().year
+
+
+def _haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km between two lat/lon points."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 6371 * 2 * math.asin(math.sqrt(a))
+
+
+def _pks_within_km(latitude, longitude, rows, distance_km):
+    """Filter (pk, lat, lon) rows to those within distance_km of the centre.
+
+    This is the hot scalar loop behind the exact nearby-users pass, so the
+    per-row haversine is stripped down: the centre's radians and cosine are
+    hoisted out of the loop, and each candidate is compared on the raw
+    haversine term against a precomputed sin^2(d/2R) threshold — no asin,
+    sqrt or final multiply per row. Equivalent to
+    _haversine_km(...) <= distance_km.
+    """
+    rlat0 = math.radians(latitude)
+    rlon0 = math.radians(longitude)
+    cos_lat0 = math.cos(rlat0)
+    threshold = math.sin(distance_km / (2 * 6371)) ** 2
+    radians, sin, cos = math.radians, math.sin, math.cos
+    pks = []
+    for pk, lat, lon in rows:
+        rlat = radians(lat)
+        a = (sin((rlat - rlat0) / 2) ** 2
+             + cos_lat0 * cos(rlat) * sin((radians(lon) - rlon0) / 2) ** 2)
+        if a <= threshold:
+            pks.append(pk)
+    return pks
+
+
+def _polygon_bounds(points):
+    """Bounding box (min_lat, max_lat, min_lon, max_lon) of a polygon list, or None.
+
+    Polygons are stored as [{'lat': ..., 'lon': ...}, ...] JSON lists.
+    """
+    if not points:
+        return None
+    lats = [pt['lat'] for pt in points]
+    lons = [pt['lon'] for pt in points]
+    return min(lats), max(lats), min(lons), max(lons)
+
+
+def _rows_in_subnet(model, cidr):
+    """Rows of model whose ip_address falls inside the CIDR block.
+
+    On PostgreSQL the check compiles to the native inet <<= operator so
+    the ip_address btree can serve it; elsewhere candidate addresses are
+    refined in Python with the ipaddress module.
+    """
+    if connection.vendor == 'postgresql':
+        return model.objects.extra(where=["ip_address <<= %s::inet"], params=[cidr])
+    network = ipaddress.ip_network(cidr, strict=False)
+    matched = [
+        pk for pk, ip in model.objects.exclude(ip_address__isnull=True)
+                                      .values_list('pk', 'ip_address')
+        if ipaddress.ip_address(ip) in network
+    ]
+    return model.objects.filter(pk__in=matched)
+
+
+def _point_in_polygon(latitude, longitude, points):
+    """Ray-casting test: is the point inside the JSON polygon?"""
+    if not points or len(points) < 3:
+        return False
+    inside = False
+    j = len(points) - 1
+    for i in range(len(points)):
+        lat_i, lon_i = points[i]['lat'], points[i]['lon']
+        lat_j, lon_j = points[j]['lat'], points[j]['lon']
+        if ((lat_i > latitude) != (lat_j > latitude)) and (
+            longitude < (lon_j - lon_i) * (latitude - lat_i) / (lat_j - lat_i) + lon_i
+        ):
+            inside = not inside
+        j = i
+    return inside
+
+
 # Custom User Manager
 class CustomUserManager(UserManager):
     def create_user(self, email, password=None, **extra_fields):
@@ -21,14 +176,58 @@ class CustomUserManager(UserManager):
         extra_fields.setdefault('date_joined', timezone.now())
         user = self.model(email=email, **extra_fields)
         user.set_password(password)
-        user.save(using=self._db)
-        UserActivity.objects.create(
-            user=user,
-            action_type='account_creation',
-            action_detail=f"User {email} created account"
-        )
+        # One transaction (and one commit fsync) for all three signup rows.
+        with transaction.atomic(using=self._db):
+            user.save(using=self._db)
+            UserProfile.objects.create(user=user)
+            UserActivity.objects.create(
+                user=user,
+                action_type='account_creation',
+                action_detail=f"User {email} created account"
+            )
         return user
 
+    def create_users_bulk(self, users_data, batch_size=500):
+        """Create many users with three statements instead of three per user.
+
+        users_data is an iterable of dicts in create_user's shape (email
+        required, password optional, any other User fields welcome).
+        Rows go in via bulk_create, so the profile and signup-activity
+        rows are bulk-created alongside in the same transaction.
+        """
+        users = []
+        for data in users_data:
+            data = dict(data)
+            email = data.pop('email', None)
+            if not email:
+                raise ValueError(_("The Email field must be set"))
+            password = data.pop('password', None)
+            data.setdefault('is_active', True)
+            data.setdefault('date_joined', timezone.now())
+            user = self.model(email=self.normalize_email(email), **data)
+            if password:
+                user.set_password(password)
+            else:
+                user.set_unusable_password()
+            users.append(user)
+        with transaction.atomic(using=self.db):
+            self.bulk_create(users, batch_size=batch_size)
+            UserProfile.objects.bulk_create(
+                [UserProfile(user=user) for user in users], batch_size=batch_size
+            )
+            UserActivity.objects.bulk_create(
+                [
+                    UserActivity(
+                        user=user,
+                        action_type='account_creation',
+                        action_detail=f"User {user.email} created account"
+                    )
+                    for user in users
+                ],
+                batch_size=batch_size,
+            )
+        return users
+
     def create_superuser(self, email, password=None, **extra_fields):
         extra_fields.setdefault('is_staff', True)
         extra_fields.setdefault('is_superuser', True)
@@ -36,27 +235,191 @@ class CustomUserManager(UserManager):
         extra_fields.setdefault('user_role', 'admin')
         return self.create_user(email, password, **extra_fields)
 
-    def nearby_users(self, latitude, longitude, distance_km=10):
-        # Simplified: Filter based on latitude/longitude (approximation, no GIS)
-        return self.filter(
-            primary_location_latitude__gte=latitude - distance_km / 111,
-            primary_location_latitude__lte=latitude + distance_km / 111,
-            primary_location_longitude__gte=longitude - distance_km / 111,
-            primary_location_longitude__lte=longitude + distance_km / 111
+    def nearby_users(self, latitude, longitude, distance_km=10, exact=False):
+        # Bounding-box prefilter over the indexed (latitude, longitude)
+        # columns. A longitude degree spans 111*cos(latitude) km, so the
+        # longitude window must widen with latitude — the old fixed /111
+        # window returned false negatives away from the equator.
+        lat_delta = distance_km / 111.0
+        lon_delta = distance_km / (111.0 * max(math.cos(math.radians(latitude)), 0.01))
+        qs = self.filter(
+            primary_location_latitude__gte=latitude - lat_delta,
+            primary_location_latitude__lte=latitude + lat_delta,
+            primary_location_longitude__gte=longitude - lon_delta,
+            primary_location_longitude__lte=longitude + lon_delta
+        )
+        if not exact:
+            return qs
+        # Refine the (cheap, index-backed) box to a true circle. Only the
+        # two coordinate columns come back for the candidates, and the
+        # exact pass runs _pks_within_km's stripped-down haversine over
+        # that small bbox-surviving subset.
+        ids = _pks_within_km(
+            latitude, longitude,
+            qs.values_list('pk', 'primary_location_latitude', 'primary_location_longitude'),
+            distance_km,
+        )
+        return self.filter(pk__in=ids)
+
+    def nearby_users_batch(self, points, distance_km=10):
+        """Batch variant of nearby_users for many centre points at once.
+
+        points is an iterable of (latitude, longitude) pairs, e.g. every
+        user in a nightly recommendation run. Instead of one query (and
+        one exact pass) per centre, a single query ORs the per-centre
+        bounding boxes together, then one in-process Haversine sweep over
+        the candidates keeps those within distance_km of any centre.
+        """
+        points = list(points)
+        if not points:
+            return self.none()
+        lat_delta = distance_km / 111.0
+        box = models.Q()
+        for lat, lon in points:
+            lon_delta = distance_km / (111.0 * max(math.cos(math.radians(lat)), 0.01))
+            box |= models.Q(
+                primary_location_latitude__gte=lat - lat_delta,
+                primary_location_latitude__lte=lat + lat_delta,
+                primary_location_longitude__gte=lon - lon_delta,
+                primary_location_longitude__lte=lon + lon_delta,
+            )
+        candidates = self.filter(box).values_list(
+            'pk', 'primary_location_latitude', 'primary_location_longitude'
         )
+        ids = [
+            pk for pk, lat, lon in candidates
+            if any(_haversine_km(clat, clon, lat, lon) <= distance_km for clat, clon in points)
+        ]
+        return self.filter(pk__in=ids)
+
+    def with_preferred_amenities(self, names):
+        """Users whose amenity mask contains every one of the named amenities.
+
+        "wants pool AND gym" compiles to a single bitwise AND against the
+        integer column instead of JSON containment over preferred_amenities.
+        """
+        mask = amenities_to_mask(names)
+        if not mask:
+            return self.none()
+        return self.annotate(
+            _amenity_hits=models.F('preferred_amenities_mask').bitand(mask)
+        ).filter(_amenity_hits=mask)
 
     def active_users(self):
         return self.filter(is_active=True, account_status='active')
 
+    def prefers_city(self, city):
+        """Users whose denormalized preferred_cities list contains city."""
+        return self.filter(preferred_cities__contains=[city])
+
     def by_role(self, role):
         return self.filter(user_role=role)
 
 # Main User Model
 class User(AbstractUser):
+    # String-backed enums: the stored values double as the public API
+    # vocabulary (e.g. /api/users/role/<role>/ and the view cache keys),
+    # so they stay text rather than small integers — renumbering would
+    # need a data migration and break every string-filtering caller.
+    class Title(models.TextChoices):
+        MR = 'mr', 'Mr.'
+        MRS = 'mrs', 'Mrs.'
+        MS = 'ms', 'Ms.'
+        DR = 'dr', 'Dr.'
+        PROF = 'prof', 'Prof.'
+
+    class MaritalStatus(models.TextChoices):
+        SINGLE = 'single', 'Single'
+        MARRIED = 'married', 'Married'
+        DIVORCED = 'divorced', 'Divorced'
+        WIDOWED = 'widowed', 'Widowed'
+        PARTNERED = 'partnered', 'Partnered'
+        SEPARATED = 'separated', 'Separated'
+
+    class AccountStatus(models.TextChoices):
+        ACTIVE = 'active', 'Active'
+        SUSPENDED = 'suspended', 'Suspended'
+        BANNED = 'banned', 'Banned'
+        PENDING = 'pending', 'Pending'
+        UNDER_REVIEW = 'under_review', 'Under Review'
+        DELETED = 'deleted', 'Soft Deleted'
+
+    class UserRole(models.TextChoices):
+        BUYER = 'buyer', 'Buyer'
+        SELLER = 'seller', 'Seller'
+        AGENT = 'agent', 'Real Estate Agent'
+        LANDLORD = 'landlord', 'Landlord'
+        TENANT = 'tenant', 'Tenant'
+        DEVELOPER = 'developer', 'Developer'
+        BROKER = 'broker', 'Broker'
+        INSPECTOR = 'inspector', 'Inspector'
+        APPRAISER = 'appraiser', 'Appraiser'
+        ADMIN = 'admin', 'Administrator'
+        MODERATOR = 'moderator', 'Moderator'
+        GUEST = 'guest', 'Guest'
+        PARTNER = 'partner', 'Business Partner'
+
+    class EmploymentStatus(models.TextChoices):
+        EMPLOYED = 'employed', 'Employed'
+        SELF_EMPLOYED = 'self_employed', 'Self-Employed'
+        UNEMPLOYED = 'unemployed', 'Unemployed'
+        RETIRED = 'retired', 'Retired'
+        STUDENT = 'student', 'Student'
+
+    class PrivacyLevel(models.TextChoices):
+        PUBLIC = 'public', 'Public'
+        FRIENDS = 'friends', 'Friends Only'
+        AGENTS = 'agents', 'Agents Only'
+        PRIVATE = 'private', 'Private'
+        CUSTOM = 'custom', 'Custom'
+
+    class NotificationFrequency(models.TextChoices):
+        IMMEDIATE = 'immediate', 'Immediate'
+        DAILY = 'daily', 'Daily'
+        WEEKLY = 'weekly', 'Weekly'
+        MONTHLY = 'monthly', 'Monthly'
+
+    class MapProvider(models.TextChoices):
+        GOOGLE = 'google', 'Google Maps'
+        OPENSTREET = 'openstreet', 'OpenStreetMap'
+        MAPBOX = 'mapbox', 'Mapbox'
+        BING = 'bing', 'Bing Maps'
+
+    class MapStyle(models.TextChoices):
+        ROADMAP = 'roadmap', 'Roadmap'
+        SATELLITE = 'satellite', 'Satellite'
+        HYBRID = 'hybrid', 'Hybrid'
+        TERRAIN = 'terrain', 'Terrain'
+        CUSTOM = 'custom', 'Custom'
+
+    class TwoFactorMethod(models.TextChoices):
+        SMS = 'sms', 'SMS'
+        APP = 'app', 'Authenticator App'
+        EMAIL = 'email', 'Email'
+        PHONE_CALL = 'phone_call', 'Phone Call'
+
+    class CreditScoreSource(models.TextChoices):
+        EXPERIAN = 'experian', 'Experian'
+        EQUIFAX = 'equifax', 'Equifax'
+        TRANSUNION = 'transunion', 'TransUnion'
+        SELF = 'self', 'Self-Reported'
+
+    class LeaseTerm(models.TextChoices):
+        SHORT = 'short', 'Short-term (<6 months)'
+        LONG = 'long', 'Long-term (1+ year)'
+        MONTH = 'month', 'Month-to-month'
+        FLEXIBLE = 'flexible', 'Flexible'
+
+    class PetPolicy(models.TextChoices):
+        YES = 'yes', 'Pets Allowed'
+        NO = 'no', 'No Pets'
+        NEGOTIABLE = 'negotiable', 'Negotiable'
+
     # Authentication & Core Identifiers
     username = None
+    # Uniqueness lives in Meta.constraints so the backing index can carry
+    # an INCLUDE list on PostgreSQL (covering the login read).
     email = models.EmailField(
-        unique=True,
         max_length=255,
         validators=[MinLengthValidator(5), EmailValidator()],
         verbose_name=_("Primary Email"),
@@ -82,7 +445,7 @@ class User(AbstractUser):
     # Personal Information
     title = models.CharField(
         max_length=20,
-        choices=[('mr', 'Mr.'), ('mrs', 'Mrs.'), ('ms', 'Ms.'), ('dr', 'Dr.'), ('prof', 'Prof.')],
+        choices=Title.choices,
         blank=True, null=True,
         verbose_name=_("Title"),
         help_text=_("Honorific title")
@@ -100,12 +463,6 @@ class User(AbstractUser):
         verbose_name=_("Last Name")
     )
     middle_name = models.CharField(max_length=50, blank=True, null=True, verbose_name=_("Middle Name"))
-    maiden_name = models.CharField(
-        max_length=50,
-        blank=True, null=True,
-        verbose_name=_("Maiden Name"),
-        help_text=_("For historical or legal reference")
-    )
     suffix = models.CharField(
         max_length=10,
         blank=True, null=True,
@@ -118,9 +475,27 @@ class User(AbstractUser):
         verbose_name=_("Preferred Name"),
         help_text=_("Nickname or preferred display name")
     )
+    # Stored in the database (same parts the old Python @property joined,
+    # falling back to email) so list endpoints can order and search by
+    # display name without hydrating User objects.
+    full_name = models.GeneratedField(
+        expression=Coalesce(
+            NullIf(
+                Trim(Concat(
+                    _name_part('title'), _name_part('first_name'), _name_part('middle_name'),
+                    _name_part('last_name'), _name_part('suffix'),
+                )),
+                models.Value(''),
+            ),
+            models.F('email'),
+        ),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
+        verbose_name=_("Full Name")
+    )
     date_of_birth = models.DateField(
         blank=True, null=True,
-        validators=[MaxValueValidator(timezone.now().date())],
+        validators=[MaxValueValidator(_today)],
         verbose_name=_("Date of Birth")
     )
     gender = models.CharField(
@@ -132,24 +507,9 @@ class User(AbstractUser):
         blank=True, null=True,
         verbose_name=_("Gender")
     )
-    gender_custom = models.CharField(
-        max_length=50,
-        blank=True, null=True,
-        verbose_name=_("Custom Gender"),
-        help_text=_("If 'Other' selected, user can specify")
-    )
-    pronouns = models.CharField(
-        max_length=20,
-        blank=True, null=True,
-        verbose_name=_("Pronouns"),
-        help_text=_("e.g., 'they/them', 'he/him', 'she/her'")
-    )
     marital_status = models.CharField(
         max_length=20,
-        choices=[
-            ('single', 'Single'), ('married', 'Married'), ('divorced', 'Divorced'),
-            ('widowed', 'Widowed'), ('partnered', 'Partnered'), ('separated', 'Separated')
-        ],
+        choices=MaritalStatus.choices,
         blank=True, null=True,
         verbose_name=_("Marital Status")
     )
@@ -189,17 +549,27 @@ class User(AbstractUser):
         blank=True, null=True,
         verbose_name=_("Cover Photo")
     )
-    video_intro = models.FileField(
-        upload_to='users/video_intros/%Y/%m/%d/',
-        blank=True, null=True,
-        verbose_name=_("Video Introduction"),
-        help_text=_("Short intro video for profile")
-    )
 
     # Account Metadata
     is_verified = models.BooleanField(default=False, verbose_name=_("Fully Verified"))
-    email_verified = models.BooleanField(default=False, verbose_name=_("Email Verified"))
-    phone_verified = models.BooleanField(default=False, verbose_name=_("Phone Verified"))
+    # Derived in the database so update()/bulk_update() on is_verified keep
+    # them consistent — the old save() override silently skipped both paths.
+    email_verified = models.GeneratedField(
+        expression=models.F('is_verified'),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        verbose_name=_("Email Verified")
+    )
+    phone_verified = models.GeneratedField(
+        expression=models.Case(
+            models.When(models.Q(is_verified=True, phone_number__isnull=False), then=models.Value(True)),
+            default=models.Value(False),
+            output_field=models.BooleanField(),
+        ),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        verbose_name=_("Phone Verified")
+    )
     verification_token = models.UUIDField(default=uuid.uuid4, editable=False)
     verification_token_expiry = models.DateTimeField(blank=True, null=True, help_text=_("Expiration for verification token"))
     date_joined = models.DateTimeField(default=timezone.now, verbose_name=_("Date Joined"))
@@ -210,11 +580,8 @@ class User(AbstractUser):
     is_superuser = models.BooleanField(default=False, verbose_name=_("Superuser"))
     account_status = models.CharField(
         max_length=20,
-        choices=[
-            ('active', 'Active'), ('suspended', 'Suspended'), ('banned', 'Banned'),
-            ('pending', 'Pending'), ('under_review', 'Under Review'), ('deleted', 'Soft Deleted')
-        ],
-        default='pending',
+        choices=AccountStatus.choices,
+        default=AccountStatus.PENDING,
         verbose_name=_("Account Status")
     )
     status_reason = models.TextField(
@@ -227,24 +594,12 @@ class User(AbstractUser):
     deactivation_reason = models.TextField(blank=True, null=True, verbose_name=_("Deactivation Reason"))
 
     # User Roles & Permissions
-    USER_ROLES = (
-        ('buyer', 'Buyer'), ('seller', 'Seller'), ('agent', 'Real Estate Agent'),
-        ('landlord', 'Landlord'), ('tenant', 'Tenant'), ('developer', 'Developer'),
-        ('broker', 'Broker'), ('inspector', 'Inspector'), ('appraiser', 'Appraiser'),
-        ('admin', 'Administrator'), ('moderator', 'Moderator'), ('guest', 'Guest'),
-        ('partner', 'Business Partner')
-    )
     user_role = models.CharField(
         max_length=20,
-        choices=USER_ROLES,
-        default='buyer',
+        choices=UserRole.choices,
+        default=UserRole.BUYER,
         verbose_name=_("User Role")
     )
-    custom_permissions = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("Custom Permissions"),
-        help_text=_("e.g., {'can_view_reports': True}")
-    )
 
     # Enhanced Geospatial Fields (Future-Proofed)
     primary_location_latitude = models.FloatField(
@@ -284,21 +639,16 @@ class User(AbstractUser):
     )
     map_provider_preference = models.CharField(
         max_length=20,
-        choices=[('google', 'Google Maps'), ('openstreet', 'OpenStreetMap'), ('mapbox', 'Mapbox'), ('bing', 'Bing Maps')],
-        default='google',
+        choices=MapProvider.choices,
+        default=MapProvider.GOOGLE,
         verbose_name=_("Map Provider Preference")
     )
     map_style = models.CharField(
         max_length=20,
-        choices=[('roadmap', 'Roadmap'), ('satellite', 'Satellite'), ('hybrid', 'Hybrid'), ('terrain', 'Terrain'), ('custom', 'Custom')],
-        default='roadmap',
+        choices=MapStyle.choices,
+        default=MapStyle.ROADMAP,
         verbose_name=_("Map Style")
     )
-    custom_map_style = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("Custom Map Style"),
-        help_text=_("e.g., {'elementType': 'geometry', 'stylers': [{'color': '#f5f5f5'}]}")
-    )
     geofence_alerts = models.BooleanField(
         default=False,
         verbose_name=_("Geofence Alerts"),
@@ -325,11 +675,6 @@ class User(AbstractUser):
         verbose_name=_("Directions Enabled"),
         help_text=_("Allow direction calculations to/from this location")
     )
-    default_map_overlays = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("Default Map Overlays"),
-        help_text=_("e.g., {'overlays': ['traffic', 'transit', 'bike']}")
-    )
     map_interaction_history_enabled = models.BooleanField(
         default=True,
         verbose_name=_("Map Interaction History Enabled"),
@@ -342,6 +687,13 @@ class User(AbstractUser):
         verbose_name=_("Preferred Locations"),
         help_text=_("e.g., {'cities': ['NYC'], 'coordinates': [{'lat': 40.7128, 'lon': -74.0060}]}")
     )
+    # Flat list kept in sync from preferred_locations['cities'] so city
+    # containment filters hit a small dedicated column (GIN-indexed on
+    # PostgreSQL) instead of digging through the nested blob.
+    preferred_cities = models.JSONField(
+        default=list, blank=True,
+        verbose_name=_("Preferred Cities")
+    )
     min_price = models.DecimalField(
         max_digits=15, decimal_places=2, blank=True, null=True,
         validators=[MinValueValidator(0)],
@@ -376,6 +728,11 @@ class User(AbstractUser):
         verbose_name=_("Preferred Amenities"),
         help_text=_("e.g., {'amenities': ['pool', 'gym', 'doorman', 'parking']}")
     )
+    preferred_amenities_mask = models.BigIntegerField(
+        default=0,
+        verbose_name=_("Preferred Amenities Mask"),
+        help_text=_("Bitmask over AMENITY_BITS; free-form extras stay in preferred_amenities")
+    )
     building_styles = models.JSONField(
         blank=True, null=True,
         verbose_name=_("Building Styles"),
@@ -383,28 +740,25 @@ class User(AbstractUser):
     )
     min_year_built = models.PositiveIntegerField(
         blank=True, null=True,
-        validators=[MinValueValidator(1800), MaxValueValidator(timezone.now().year)],
+        validators=[MinValueValidator(1800), MaxValueValidator(_current_year)],
         verbose_name=_("Min Year Built")
     )
     max_year_built = models.PositiveIntegerField(
         blank=True, null=True,
-        validators=[MinValueValidator(1800), MaxValueValidator(timezone.now().year)],
+        validators=[MinValueValidator(1800), MaxValueValidator(_current_year)],
         verbose_name=_("Max Year Built")
     )
     move_in_date_min = models.DateField(blank=True, null=True, verbose_name=_("Earliest Move-In Date"))
     move_in_date_max = models.DateField(blank=True, null=True, verbose_name=_("Latest Move-In Date"))
     lease_term = models.CharField(
         max_length=20,
-        choices=[
-            ('short', 'Short-term (<6 months)'), ('long', 'Long-term (1+ year)'),
-            ('month', 'Month-to-month'), ('flexible', 'Flexible')
-        ],
+        choices=LeaseTerm.choices,
         blank=True, null=True,
         verbose_name=_("Lease Term")
     )
     pet_policy = models.CharField(
         max_length=20,
-        choices=[('yes', 'Pets Allowed'), ('no', 'No Pets'), ('negotiable', 'Negotiable')],
+        choices=PetPolicy.choices,
         blank=True, null=True,
         verbose_name=_("Pet Policy Preference")
     )
@@ -444,7 +798,7 @@ class User(AbstractUser):
     credit_score_source = models.CharField(
         max_length=50,
         blank=True, null=True,
-        choices=[('experian', 'Experian'), ('equifax', 'Equifax'), ('transunion', 'TransUnion'), ('self', 'Self-Reported')],
+        choices=CreditScoreSource.choices,
         verbose_name=_("Credit Score Source")
     )
     budget_range = models.JSONField(
@@ -454,10 +808,7 @@ class User(AbstractUser):
     )
     employment_status = models.CharField(
         max_length=20,
-        choices=[
-            ('employed', 'Employed'), ('self_employed', 'Self-Employed'), ('unemployed', 'Unemployed'),
-            ('retired', 'Retired'), ('student', 'Student')
-        ],
+        choices=EmploymentStatus.choices,
         blank=True, null=True,
         verbose_name=_("Employment Status")
     )
@@ -476,8 +827,8 @@ class User(AbstractUser):
     whatsapp_notifications = models.BooleanField(default=False, verbose_name=_("WhatsApp Notifications"))
     notification_frequency = models.CharField(
         max_length=20,
-        choices=[('immediate', 'Immediate'), ('daily', 'Daily'), ('weekly', 'Weekly'), ('monthly', 'Monthly')],
-        default='immediate',
+        choices=NotificationFrequency.choices,
+        default=NotificationFrequency.IMMEDIATE,
         verbose_name=_("Notification Frequency")
     )
     muted_notification_types = models.JSONField(
@@ -496,15 +847,10 @@ class User(AbstractUser):
     two_factor_enabled = models.BooleanField(default=False, verbose_name=_("Two-Factor Authentication"))
     two_factor_method = models.CharField(
         max_length=20,
-        choices=[('sms', 'SMS'), ('app', 'Authenticator App'), ('email', 'Email'), ('phone_call', 'Phone Call')],
+        choices=TwoFactorMethod.choices,
         blank=True, null=True,
         verbose_name=_("2FA Method")
     )
-    two_factor_backup_codes = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("2FA Backup Codes"),
-        help_text=_("e.g., {'codes': ['abc123', 'xyz789']}")
-    )
     last_password_change = models.DateTimeField(blank=True, null=True, verbose_name=_("Last Password Change"))
     password_expiry_date = models.DateTimeField(
         blank=True, null=True,
@@ -513,25 +859,12 @@ class User(AbstractUser):
     )
     failed_login_attempts = models.PositiveIntegerField(default=0, verbose_name=_("Failed Login Attempts"))
     account_locked_until = models.DateTimeField(blank=True, null=True, verbose_name=_("Account Locked Until"))
-    trusted_devices = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("Trusted Devices"),
-        help_text=_("e.g., {'devices': [{'id': 'device1', 'last_used': '2025-03-24'}]}")
-    )
     privacy_level = models.CharField(
         max_length=20,
-        choices=[
-            ('public', 'Public'), ('friends', 'Friends Only'), ('agents', 'Agents Only'),
-            ('private', 'Private'), ('custom', 'Custom')
-        ],
-        default='private',
+        choices=PrivacyLevel.choices,
+        default=PrivacyLevel.PRIVATE,
         verbose_name=_("Privacy Level")
     )
-    custom_privacy_settings = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("Custom Privacy Settings"),
-        help_text=_("e.g., {'profile_visible_to': ['friends', 'agents']}")
-    )
 
     # Social Media & External Integrations
     facebook_id = models.CharField(max_length=100, blank=True, null=True, unique=True, verbose_name=_("Facebook ID"))
@@ -556,11 +889,6 @@ class User(AbstractUser):
         through='UserConnection',
         verbose_name=_("Social Connections")
     )
-    external_api_keys = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("External API Keys"),
-        help_text=_("e.g., {'google_maps': 'xyz123'}")
-    )
 
     # Legal & Compliance
     terms_accepted = models.BooleanField(default=False, verbose_name=_("Terms Accepted"))
@@ -580,11 +908,6 @@ class User(AbstractUser):
     )
     data_sharing_opt_in = models.BooleanField(default=False, verbose_name=_("Data Sharing Opt-In"))
     marketing_consent = models.BooleanField(default=False, verbose_name=_("Marketing Consent"))
-    consent_history = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("Consent History"),
-        help_text=_("e.g., {'gdpr': {'date': '2025-03-24', 'version': '1.0'}}")
-    )
 
     # Analytics & Engagement
     profile_views = models.PositiveIntegerField(default=0, verbose_name=_("Profile Views"))
@@ -598,7 +921,8 @@ class User(AbstractUser):
     referral_code = models.CharField(
         max_length=20,
         unique=True,
-        default=lambda: uuid.uuid4().hex[:10],  # Lambda for callable default
+        # Generated by the database so bulk_create never has to prefill it.
+        db_default=_REFERRAL_CODE_DB_DEFAULT,
         verbose_name=_("Referral Code")
     )
     referred_by = models.ForeignKey(
@@ -617,34 +941,114 @@ class User(AbstractUser):
         verbose_name_plural = _("Users")
         ordering = ['-date_joined']
         indexes = [
-            models.Index(fields=['email']),
+            # No btree on email here: the unique constraint already creates one.
             models.Index(fields=['user_role']),
-            models.Index(fields=['is_active', 'account_status']),
-            models.Index(fields=['last_login']),
+            # Partial index over exactly the rows active_users() returns;
+            # suspended/banned/deleted rows never enter it, so it stays
+            # small and cache-resident.
+            models.Index(
+                name='user_active_partial',
+                fields=['id'],
+                condition=models.Q(is_active=True, account_status='active'),
+            ),
+            # Serves the nearby_users() bounding box. A dedicated spatial
+            # (SP-GiST/GiST) index would need a GeoDjango PointField and the
+            # gis database backends, which this project does not use.
             models.Index(fields=['primary_location_latitude', 'primary_location_longitude']),
+            # Covers the get_user_meta probe (user_id -> pk, privacy_level)
+            # so the cold-cache permission lookup is an index-only scan
+            # that never visits the wide users_user heap row.
+            models.Index(fields=['user_id', 'privacy_level'], name='user_meta_cover_idx'),
         ]
+        if connection.vendor == 'postgresql':
+            from django.contrib.postgres.indexes import BrinIndex, GinIndex, HashIndex
+            # Substring search over the generated full_name column; needs
+            # the pg_trgm extension.
+            indexes.append(GinIndex(
+                fields=['full_name'], name='user_full_name_trgm', opclasses=['gin_trgm_ops']
+            ))
+            # date_joined / last_login grow (mostly) monotonically, so a
+            # BRIN covers the range scans — default '-date_joined'
+            # pagination, "joined this month" analytics — at a fraction of
+            # a btree's size.
+            indexes.append(BrinIndex(fields=['date_joined'], name='user_date_joined_brin', pages_per_range=32))
+            indexes.append(BrinIndex(fields=['last_login'], name='user_last_login_brin', pages_per_range=32))
+            # Login resolves email by equality only (USERNAME_FIELD), so a
+            # hash index is the cheapest lookup path; uniqueness stays
+            # enforced by the implicit unique btree.
+            indexes.append(HashIndex(fields=['email'], name='user_email_hash'))
+            # jsonb containment for prefers_city().
+            indexes.append(GinIndex(
+                fields=['preferred_cities'], name='user_pref_cities_gin', opclasses=['jsonb_path_ops']
+            ))
+        else:
+            indexes.append(models.Index(fields=['last_login']))
         constraints = [
             models.CheckConstraint(
                 check=models.Q(min_price__lte=models.F('max_price')),
                 name='min_price_lte_max_price'
-            )
+            ),
+            # DB-side mirrors of the RegexValidators: full_clean only runs
+            # on the forms path, so these hold bulk_create and update()
+            # writes to the same format rules without per-row Python.
+            models.CheckConstraint(
+                check=models.Q(first_name='') | models.Q(first_name__regex=r'^[a-zA-Z\- ]+$'),
+                name='user_first_name_format'
+            ),
+            models.CheckConstraint(
+                check=models.Q(last_name='') | models.Q(last_name__regex=r'^[a-zA-Z\- ]+$'),
+                name='user_last_name_format'
+            ),
+            models.CheckConstraint(
+                check=models.Q(twitter_handle__isnull=True)
+                | models.Q(twitter_handle__regex=r'^@?(\w){1,15}$'),
+                name='user_twitter_handle_format'
+            ),
+            models.CheckConstraint(
+                check=models.Q(instagram_handle__isnull=True)
+                | models.Q(instagram_handle__regex=r'^@?(\w){1,30}$'),
+                name='user_instagram_handle_format'
+            ),
         ]
+        if connection.vendor == 'postgresql':
+            # The login query (get by email) needs only these columns; an
+            # INCLUDE list lets it complete as an index-only scan instead
+            # of btree-then-heap-fetch.
+            constraints.append(models.UniqueConstraint(
+                fields=['email'],
+                name='user_email_unique',
+                include=['password', 'is_active', 'is_staff', 'is_superuser', 'user_id'],
+            ))
+        else:
+            constraints.append(models.UniqueConstraint(fields=['email'], name='user_email_unique'))
 
     def __str__(self):
         return self.email
 
     @property
-    def full_name(self):
-        parts = [self.title, self.first_name, self.middle_name, self.last_name, self.suffix]
-        return " ".join(filter(None, parts)).strip() or self.email
-
-    def save(self, *args, **kwargs):
-        if not self.user_id:
-            self.user_id = uuid.uuid4()
-        if self.is_verified:
-            self.email_verified = True
-            self.phone_verified = True if self.phone_number else False
-        super().save(*args, **kwargs)
+    def preferred_amenity_names(self):
+        return mask_to_amenities(self.preferred_amenities_mask)
+
+    @preferred_amenity_names.setter
+    def preferred_amenity_names(self, names):
+        self.preferred_amenities_mask = amenities_to_mask(names)
+
+    def search_preferences_payload(self):
+        """Search-preferences dict served by user_search_preferences_api.
+
+        The JSONField columns come back from the driver as Python
+        values already, so this is plain attribute access — no parsing.
+        Lives on the model so the view and the write-through cache
+        signal render the exact same shape.
+        """
+        return {
+            'min_price': self.min_price,
+            'max_price': self.max_price,
+            'min_bedrooms': self.min_bedrooms,
+            'max_bedrooms': self.max_bedrooms,
+            'property_types': self.property_types or [],
+            'preferred_locations': self.preferred_locations or [],
+        }
 
     def properties_nearby(self, distance_km=5):
         if self.primary_location_latitude and self.primary_location_longitude:
@@ -656,6 +1060,224 @@ class User(AbstractUser):
             )
         return UserProperty.objects.none()
 
+def _invalidate_user_list_caches(sender, **kwargs):
+    """Drop cached user-list payloads whenever any User row changes.
+
+    active_users / by_role results are cached in Redis by their API views;
+    without this hook a saved or deleted user keeps serving from the stale
+    payload for the full TTL. The role vocabulary is fixed, so every
+    possible key can be enumerated and cleared in one delete_many.
+    """
+    keys = ['active_users'] + [f"users_by_role_{role}" for role in User.UserRole.values]
+    cache.delete_many(keys)
+    # These keys are also L1-cached per process (see cache_bus), so the
+    # delete has to reach every worker, not just this one.
+    publish_invalidation(keys)
+
+
+models.signals.post_save.connect(_invalidate_user_list_caches, sender=User)
+models.signals.post_delete.connect(_invalidate_user_list_caches, sender=User)
+
+
+def _write_through_search_preferences(sender, instance, **kwargs):
+    """Refill the search-preferences cache on every User save.
+
+    The payload depends only on User columns, so instead of deleting the
+    key and making the next reader rebuild it, the writer renders the
+    fresh bytes and sets them once the transaction commits — reads stay
+    hits across profile edits. Saves that bypass signals (queryset
+    update()) fall back to the view's TTL, same as preferred_cities.
+    """
+    from RESPlateForm.renderers import FastJSONRenderer
+
+    body = FastJSONRenderer().render(instance.search_preferences_payload())
+    key = f"user_search_preferences_{instance.user_id}"
+    transaction.on_commit(lambda: cache.set(key, body, 60 * 10))
+
+
+models.signals.post_save.connect(_write_through_search_preferences, sender=User)
+
+
+def _sync_preferred_cities(sender, instance, **kwargs):
+    """Keep the denormalized preferred_cities list matching preferred_locations."""
+    cities = (instance.preferred_locations or {}).get('cities') or []
+    instance.preferred_cities = list(cities)
+
+
+models.signals.pre_save.connect(_sync_preferred_cities, sender=User)
+
+
+class UserRelatedManager(models.Manager):
+    """Default manager that eagerly joins the owning user rows.
+
+    Every __str__ on these models (and most list renderings) reads
+    self.user.email, so admin and DRF list pages otherwise issue one extra
+    SELECT per row. The relations are FK/OneToOne, so eager loading is a
+    single JOIN.
+    """
+    related = ('user',)
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(*self.related)
+
+
+class ReviewRelatedManager(UserRelatedManager):
+    related = ('reviewer', 'reviewed_user')
+
+
+class ReferralRelatedManager(UserRelatedManager):
+    related = ('referrer', 'referred_user')
+
+
+class AgentRelatedManager(UserRelatedManager):
+    related = ('user', 'agency_address')
+
+
+class UnsortedManager(models.Manager):
+    """Secondary manager for existence/count probes.
+
+    Meta.ordering makes even qs[:1] pay an ORDER BY, and the default
+    managers join the user row; neither helps a "has any unread?" check.
+    raw_objects.filter(...).exists() compiles to a bare indexed probe.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().order_by()
+
+
+# Polygon Area Base (indexable bounds for JSON polygon fields)
+class PolygonAreaModel(models.Model):
+    """Abstract base for models holding a JSON polygon area.
+
+    "Which rows' area contains this point?" used to require loading every
+    polygon into Python. The polygon's bounding box is denormalized into
+    four indexed float columns on save, so the containment query becomes
+    a cheap SQL range prefilter plus an exact ray-cast refine over the
+    handful of surviving rows.
+    """
+    polygon_field = None  # name of the JSON polygon field, set by subclasses
+
+    bounds_min_latitude = models.FloatField(blank=True, null=True, editable=False)
+    bounds_max_latitude = models.FloatField(blank=True, null=True, editable=False)
+    bounds_min_longitude = models.FloatField(blank=True, null=True, editable=False)
+    bounds_max_longitude = models.FloatField(blank=True, null=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        bounds = _polygon_bounds(getattr(self, self.polygon_field) or [])
+        if bounds:
+            (self.bounds_min_latitude, self.bounds_max_latitude,
+             self.bounds_min_longitude, self.bounds_max_longitude) = bounds
+        else:
+            self.bounds_min_latitude = self.bounds_max_latitude = None
+            self.bounds_min_longitude = self.bounds_max_longitude = None
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def area_containing(cls, latitude, longitude, queryset=None):
+        """Rows whose polygon contains the point, as a chainable queryset."""
+        qs = queryset if queryset is not None else cls.objects.all()
+        candidates = qs.filter(
+            bounds_min_latitude__lte=latitude,
+            bounds_max_latitude__gte=latitude,
+            bounds_min_longitude__lte=longitude,
+            bounds_max_longitude__gte=longitude,
+        ).select_related(None).only('pk', cls.polygon_field)
+        matched = [
+            obj.pk for obj in candidates
+            if _point_in_polygon(latitude, longitude, getattr(obj, cls.polygon_field) or [])
+        ]
+        return cls.objects.filter(pk__in=matched)
+
+
+# User Profile (cold half of the hot/cold User split)
+class UserProfile(models.Model):
+    """Rarely-read User columns, vertically split off the hot auth row.
+
+    User is loaded on every authenticated request, and the default ORM
+    query is SELECT * — so every bulky JSON/file column moved here is row
+    width the session/auth path no longer drags over the wire. Reach the
+    cold half via user.profile (add select_related('profile') on the few
+    views that render it).
+    """
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name='profile'
+    )
+    maiden_name = models.CharField(
+        max_length=50,
+        blank=True, null=True,
+        verbose_name=_("Maiden Name"),
+        help_text=_("For historical or legal reference")
+    )
+    gender_custom = models.CharField(
+        max_length=50,
+        blank=True, null=True,
+        verbose_name=_("Custom Gender"),
+        help_text=_("If 'Other' selected, user can specify")
+    )
+    pronouns = models.CharField(
+        max_length=20,
+        blank=True, null=True,
+        verbose_name=_("Pronouns"),
+        help_text=_("e.g., 'they/them', 'he/him', 'she/her'")
+    )
+    video_intro = models.FileField(
+        upload_to='users/video_intros/%Y/%m/%d/',
+        blank=True, null=True,
+        verbose_name=_("Video Introduction"),
+        help_text=_("Short intro video for profile")
+    )
+    custom_permissions = models.JSONField(
+        blank=True, null=True,
+        verbose_name=_("Custom Permissions"),
+        help_text=_("e.g., {'can_view_reports': True}")
+    )
+    custom_map_style = models.JSONField(
+        blank=True, null=True,
+        verbose_name=_("Custom Map Style"),
+        help_text=_("e.g., {'elementType': 'geometry', 'stylers': [{'color': '#f5f5f5'}]}")
+    )
+    default_map_overlays = models.JSONField(
+        blank=True, null=True,
+        verbose_name=_("Default Map Overlays"),
+        help_text=_("e.g., {'overlays': ['traffic', 'transit', 'bike']}")
+    )
+    two_factor_backup_codes = models.JSONField(
+        blank=True, null=True,
+        verbose_name=_("2FA Backup Codes"),
+        help_text=_("e.g., {'codes': ['abc123', 'xyz789']}")
+    )
+    trusted_devices = models.JSONField(
+        blank=True, null=True,
+        verbose_name=_("Trusted Devices"),
+        help_text=_("e.g., {'devices': [{'id': 'device1', 'last_used': '2025-03-24'}]}")
+    )
+    custom_privacy_settings = models.JSONField(
+        blank=True, null=True,
+        verbose_name=_("Custom Privacy Settings"),
+        help_text=_("e.g., {'profile_visible_to': ['friends', 'agents']}")
+    )
+    external_api_keys = models.JSONField(
+        blank=True, null=True,
+        verbose_name=_("External API Keys"),
+        help_text=_("e.g., {'google_maps': 'xyz123'}")
+    )
+    consent_history = models.JSONField(
+        blank=True, null=True,
+        verbose_name=_("Consent History"),
+        help_text=_("e.g., {'gdpr': {'date': '2025-03-24', 'version': '1.0'}}")
+    )
+
+    class Meta:
+        verbose_name = _("User Profile")
+        verbose_name_plural = _("User Profiles")
+
+    def __str__(self):
+        return f"Profile of {self.user.email}"
+
+
 # User Connection
 class UserConnection(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='connection_from')
@@ -709,6 +1331,7 @@ class UserAddress(models.Model):
         verbose_name=_("Elevation (meters)"),
         help_text=_("Height above sea level")
     )
+    created_at = models.DateTimeField(default=timezone.now, verbose_name=_("Created At"))
     timezone = models.CharField(
         max_length=50,
         blank=True, null=True,
@@ -727,18 +1350,40 @@ class UserAddress(models.Model):
         choices=[('manual', 'Manual'), ('api', 'API'), ('user', 'User-Confirmed')],
         verbose_name=_("Verification Method")
     )
-    created_at = models.DateTimeField(default=timezone.now, verbose_name=_("Created At"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Updated At"))
 
+    objects = UserRelatedManager()
+
     class Meta:
         constraints = [
-            models.UniqueConstraint(fields=['user', 'address_type', 'is_primary'], name='unique_user_address_type_primary')
+            # Partial: only one primary per (user, address_type). The old
+            # three-column form also made is_primary=False rows collide —
+            # a user couldn't keep two non-primary shipping addresses.
+            models.UniqueConstraint(
+                fields=['user', 'address_type'],
+                condition=models.Q(is_primary=True),
+                name='unique_primary_address_per_type',
+            ),
+            models.CheckConstraint(
+                check=models.Q(postal_code__regex=r'^[A-Za-z0-9\s\-]+$'),
+                name='user_address_postal_code_format'
+            ),
         ]
         verbose_name = _("User Address")
         verbose_name_plural = _("User Addresses")
         indexes = [
-            models.Index(fields=['user', 'is_primary']),
+            # "The user's primary address" is a probe into an index that
+            # only holds primaries.
+            models.Index(
+                fields=['user'],
+                condition=models.Q(is_primary=True),
+                name='user_primary_addr_idx',
+            ),
             models.Index(fields=['country', 'postal_code']),
+            # Kept as a btree: the geocoded-address lookups here are
+            # bounding-box prefilters that range-scan on latitude, which
+            # this serves. A true spatial (GiST) index needs a GeoDjango
+            # PointField and the gis backends this project doesn't use.
             models.Index(fields=['latitude', 'longitude']),
         ]
 
@@ -746,7 +1391,9 @@ class UserAddress(models.Model):
         return f"{self.address_line_1}, {self.city}, {self.postal_code} ({self.user.email})"
 
 # Saved Search
-class SavedSearch(models.Model):
+class SavedSearch(PolygonAreaModel):
+    polygon_field = 'search_area'
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_searches')
     name = models.CharField(max_length=100, verbose_name=_("Search Name"))
     search_query = models.JSONField(
@@ -768,7 +1415,7 @@ class SavedSearch(models.Model):
         verbose_name=_("Notification Frequency")
     )
     is_active = models.BooleanField(default=True, verbose_name=_("Active"))
-    priority = models.PositiveIntegerField(
+    priority = models.PositiveSmallIntegerField(
         default=1,
         validators=[MinValueValidator(1), MaxValueValidator(10)],
         verbose_name=_("Priority"),
@@ -782,34 +1429,71 @@ class SavedSearch(models.Model):
         help_text=_("e.g., ['urgent', 'nyc', 'rental']")
     )
 
+    objects = UserRelatedManager()
+    raw_objects = UnsortedManager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = _("Saved Search")
         verbose_name_plural = _("Saved Searches")
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(priority__gte=1) & models.Q(priority__lte=10),
+                name='search_priority_1_10'
+            ),
+        ]
         indexes = [
             models.Index(fields=['user', 'is_active']),
             models.Index(fields=['created_at']),
+            models.Index(fields=['bounds_min_latitude', 'bounds_max_latitude',
+                                 'bounds_min_longitude', 'bounds_max_longitude']),
         ]
 
     def __str__(self):
         return f"{self.name} - {self.user.email}"
 
+    @classmethod
+    def matching(cls, latitude, longitude):
+        """Active searches whose drawn area contains the point, highest priority first.
+
+        This is the notification-dispatch query: new-listing fan-out runs it
+        per listing instead of scanning every saved search in Python.
+        """
+        return cls.area_containing(
+            latitude, longitude, cls.objects.filter(is_active=True)
+        ).order_by('-priority')
+
 # User Activity
 class UserActivity(models.Model):
+    # Enum form of the old inline choice list: full_clean() validates
+    # against the enum's precomputed member map instead of scanning a
+    # literal list per save — the stored values are unchanged.
+    class ActionType(models.TextChoices):
+        LOGIN = 'login', 'Login'
+        LOGOUT = 'logout', 'Logout'
+        VIEW_LISTING = 'view_listing', 'View Listing'
+        SAVE_SEARCH = 'save_search', 'Save Search'
+        PROFILE_UPDATE = 'profile_update', 'Profile Update'
+        PASSWORD_CHANGE = 'password_change', 'Password Change'
+        MESSAGE_SENT = 'message_sent', 'Message Sent'
+        LISTING_FAVORITED = 'listing_favorited', 'Listing Favorited'
+        REVIEW_POSTED = 'review_posted', 'Review Posted'
+        MAP_INTERACTION = 'map_interaction', 'Map Interaction'
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='activities')
+    # Denormalized from user.email at save time (_stamp_owner_email):
+    # list rows and __str__ render without joining users_user.
+    user_email = models.CharField(max_length=254, blank=True, default='', editable=False)
     action_type = models.CharField(
         max_length=50,
-        choices=[
-            ('login', 'Login'), ('logout', 'Logout'), ('view_listing', 'View Listing'),
-            ('save_search', 'Save Search'), ('profile_update', 'Profile Update'),
-            ('password_change', 'Password Change'), ('message_sent', 'Message Sent'),
-            ('listing_favorited', 'Listing Favorited'), ('review_posted', 'Review Posted'),
-            ('map_interaction', 'Map Interaction')
-        ],
+        choices=ActionType.choices,
         verbose_name=_("Action Type")
     )
     action_detail = models.TextField(verbose_name=_("Action Detail"), help_text=_("e.g., 'Viewed listing #123'"))
-    timestamp = models.DateTimeField(default=timezone.now, verbose_name=_("Timestamp"))
+    # db_default: the database stamps the row, so bulk loads skip one
+    # timezone.now() call and datetime allocation per row (same on the
+    # other append-only log models).
+    timestamp = models.DateTimeField(db_default=Now(), verbose_name=_("Timestamp"))
     ip_address = models.GenericIPAddressField(blank=True, null=True, verbose_name=_("IP Address"))
     device_info = models.CharField(
         max_length=255,
@@ -834,31 +1518,85 @@ class UserActivity(models.Model):
         verbose_name=_("Action Location Longitude")
     )
 
+    objects = UserRelatedManager()
+    raw_objects = UnsortedManager()
+
     class Meta:
         ordering = ['-timestamp']
         verbose_name = _("User Activity")
         verbose_name_plural = _("User Activities")
         indexes = [
-            models.Index(fields=['user', 'timestamp']),
+            # Descending to match the hot query shape exactly: the recent-
+            # activity list is filter(user)+ORDER BY timestamp DESC LIMIT 50,
+            # which this serves as a forward index scan of one leaf page.
+            models.Index(fields=['user', '-timestamp']),
             models.Index(fields=['action_type']),
             models.Index(fields=['location_latitude', 'location_longitude']),
+            # Fraud/abuse analytics filter by address and subnet.
+            models.Index(fields=['ip_address'], name='activity_ip_idx'),
         ]
+        if connection.vendor == 'postgresql':
+            from django.contrib.postgres.indexes import BrinIndex
+
+            # Append-only log whose physical order tracks timestamp, so one
+            # min/max per 128-page range covers time-window analytics at a
+            # tiny fraction of a btree's size. The (user, timestamp) btree
+            # stays for per-user lookups.
+            indexes.append(BrinIndex(fields=['timestamp'], name='activity_ts_brin', pages_per_range=128))
 
     def __str__(self):
-        return f"{self.user.email} - {self.action_type} - {self.timestamp}"
+        return f"{self.user_email or self.user.email} - {self.action_type} - {self.timestamp}"
+
+    @classmethod
+    def bulk_load(cls, records, batch_size=10000):
+        """Ingest a burst of activity events from an analytics pipeline.
+
+        records is an iterable of field dicts, consumed lazily so the
+        caller can stream from a file or queue without materializing the
+        whole burst. Inserts land as batched multi-row statements inside
+        one transaction; small writes should keep using logbuffer.log()
+        or save(). Returns the number of rows loaded.
+        """
+        total = 0
+        with transaction.atomic():
+            batch = []
+            for record in records:
+                batch.append(cls(**record))
+                if len(batch) >= batch_size:
+                    cls.objects.bulk_create(batch, batch_size=batch_size)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                cls.objects.bulk_create(batch, batch_size=batch_size)
+                total += len(batch)
+        return total
+
+    @classmethod
+    def in_subnet(cls, cidr):
+        """Activity rows originating from the given CIDR block."""
+        return _rows_in_subnet(cls, cidr)
 
 # User Notification
 class UserNotification(models.Model):
+    class NotificationType(models.TextChoices):
+        LISTING = 'listing', 'New Listing'
+        UPDATE = 'update', 'Account Update'
+        SYSTEM = 'system', 'System Alert'
+        MESSAGE = 'message', 'Message'
+        OFFER = 'offer', 'Offer Received'
+        PAYMENT = 'payment', 'Payment Confirmation'
+        REVIEW = 'review', 'New Review'
+        CONNECTION = 'connection', 'New Connection'
+        GEOFENCE = 'geofence', 'Geofence Alert'
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
+    # Denormalized from user.email at save time, as on UserActivity.
+    user_email = models.CharField(max_length=254, blank=True, default='', editable=False)
     message = models.TextField(verbose_name=_("Message"))
     notification_type = models.CharField(
         max_length=50,
-        choices=[
-            ('listing', 'New Listing'), ('update', 'Account Update'), ('system', 'System Alert'),
-            ('message', 'Message'), ('offer', 'Offer Received'), ('payment', 'Payment Confirmation'),
-            ('review', 'New Review'), ('connection', 'New Connection'), ('geofence', 'Geofence Alert')
-        ],
-        default='listing',
+        choices=NotificationType.choices,
+        default=NotificationType.LISTING,
         verbose_name=_("Notification Type")
     )
     priority = models.CharField(
@@ -868,39 +1606,140 @@ class UserNotification(models.Model):
         verbose_name=_("Priority")
     )
     is_read = models.BooleanField(default=False, verbose_name=_("Read"))
-    created_at = models.DateTimeField(default=timezone.now, verbose_name=_("Created At"))
+    created_at = models.DateTimeField(db_default=Now(), verbose_name=_("Created At"))
     expires_at = models.DateTimeField(blank=True, null=True, verbose_name=_("Expires At"))
     link = models.URLField(
         blank=True, null=True,
         validators=[URLValidator()],
         verbose_name=_("Link")
     )
-    sent_via = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("Sent Via"),
-        help_text=_("e.g., {'email': True, 'sms': False, 'push': True}")
+    # Delivery bookkeeping, packed into two small ints instead of JSON
+    # blobs: `channels` holds one bit per channel, `channel_status` two
+    # bits per channel. Integers keep the rows narrow and make "email
+    # failed" an indexable filter instead of a JSON parse per row.
+    CHANNEL_BITS = {'email': 0, 'sms': 1, 'push': 2}
+
+    class ChannelStatus(models.IntegerChoices):
+        PENDING = 0, _('Pending')
+        DELIVERED = 1, _('Delivered')
+        FAILED = 2, _('Failed')
+        BOUNCED = 3, _('Bounced')
+
+    channels = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name=_("Channels"),
+        help_text=_("Bitmask of channels the notification was sent via: bit 0=email, 1=sms, 2=push")
     )
-    delivery_status = models.JSONField(
-        blank=True, null=True,
-        verbose_name=_("Delivery Status"),
-        help_text=_("e.g., {'email': 'delivered', 'sms': 'failed'}")
+    channel_status = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name=_("Channel Status"),
+        help_text=_("Per-channel delivery status, two bits per channel")
     )
     read_at = models.DateTimeField(blank=True, null=True, verbose_name=_("Read At"))
 
+    objects = UserRelatedManager()
+    raw_objects = UnsortedManager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = _("User Notification")
         verbose_name_plural = _("User Notifications")
         indexes = [
-            models.Index(fields=['user', 'is_read']),
             models.Index(fields=['notification_type']),
+            # Failed-delivery dashboards only look at rows where some
+            # channel has moved past pending; the all-zero majority stays
+            # out of the index.
+            models.Index(
+                fields=['channel_status'],
+                name='notif_delivery_idx',
+                condition=models.Q(channel_status__gt=0),
+            ),
+            # The feed query — unread for one user, newest first — walks
+            # this partial index in order; read rows (the vast majority)
+            # never enter it.
+            models.Index(
+                fields=['user', '-created_at'],
+                name='notif_user_unread_idx',
+                condition=models.Q(is_read=False),
+            ),
         ]
+        if connection.vendor == 'postgresql':
+            # Covering variant: the feed renders type and priority straight
+            # off the index without heap fetches. message stays out of the
+            # INCLUDE list — unbounded text would bloat the index pages.
+            indexes[-1] = models.Index(
+                fields=['user', '-created_at'],
+                name='notif_user_unread_idx',
+                condition=models.Q(is_read=False),
+                include=['notification_type', 'priority'],
+            )
 
     def __str__(self):
-        return f"{self.user.email} - {self.notification_type} - {self.message[:50]}"
+        return f"{self.user_email or self.user.email} - {self.notification_type} - {self.message[:50]}"
+
+    def sent_via_channel(self, channel):
+        return bool(self.channels & (1 << self.CHANNEL_BITS[channel]))
+
+    def mark_sent(self, channel):
+        self.channels |= 1 << self.CHANNEL_BITS[channel]
+
+    def status_for(self, channel):
+        return self.ChannelStatus((self.channel_status >> (2 * self.CHANNEL_BITS[channel])) & 0b11)
+
+    def set_status(self, channel, status):
+        shift = 2 * self.CHANNEL_BITS[channel]
+        self.channel_status = (self.channel_status & ~(0b11 << shift)) | (status << shift)
+
+    @property
+    def sent_via_email(self):
+        return self.sent_via_channel('email')
+
+    @property
+    def sent_via_sms(self):
+        return self.sent_via_channel('sms')
+
+    @property
+    def sent_via_push(self):
+        return self.sent_via_channel('push')
+
+    @classmethod
+    def with_channel_status(cls, channel, status):
+        """Notifications whose given channel is in the given ChannelStatus.
+
+        The unpack happens in SQL (shift + mask on the packed column), so
+        e.g. "all notifications where email failed" never parses JSON.
+        """
+        shift = 2 * cls.CHANNEL_BITS[channel]
+        return cls.objects.annotate(
+            _channel_status=models.F('channel_status').bitrightshift(shift).bitand(0b11)
+        ).filter(_channel_status=status)
+
+    @classmethod
+    def bulk_dispatch(cls, rows, batch_size=10000):
+        """Insert notification fan-out rows in bulk.
+
+        rows is an iterable of field dicts (user_id, message,
+        notification_type, priority, ...). Saved-search fan-out can hit
+        hundreds of thousands of rows per new listing; batched multi-row
+        INSERTs make that one statement per 10k rows instead of one per
+        notification. Returns the number of rows inserted.
+        """
+        batch, total = [], 0
+        for row in rows:
+            batch.append(cls(**row))
+            if len(batch) >= batch_size:
+                cls.objects.bulk_create(batch, batch_size=batch_size)
+                total += len(batch)
+                batch = []
+        if batch:
+            cls.objects.bulk_create(batch, batch_size=batch_size)
+            total += len(batch)
+        return total
 
 # Agent Profile
-class AgentProfile(models.Model):
+class AgentProfile(PolygonAreaModel):
+    polygon_field = 'service_area'
+
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='agent_profile')
     license_number = models.CharField(max_length=50, unique=True, verbose_name=_("License Number"))
     license_state = models.CharField(max_length=100, blank=True, null=True, verbose_name=_("License State"))
@@ -915,7 +1754,7 @@ class AgentProfile(models.Model):
         verbose_name=_("Agency Address")
     )
     agency_website = models.URLField(blank=True, null=True, verbose_name=_("Agency Website"))
-    years_experience = models.PositiveIntegerField(
+    years_experience = models.PositiveSmallIntegerField(
         default=0,
         validators=[MaxValueValidator(100)],
         verbose_name=_("Years of Experience")
@@ -976,18 +1815,34 @@ class AgentProfile(models.Model):
         help_text=_("Optional radius if area is circular")
     )
 
+    objects = AgentRelatedManager()
+
     class Meta:
         verbose_name = _("Agent Profile")
         verbose_name_plural = _("Agent Profiles")
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(years_experience__lte=100),
+                name='agent_experience_0_100'
+            ),
+            models.CheckConstraint(
+                check=models.Q(rating__gte=0) & models.Q(rating__lte=5),
+                name='agent_rating_0_5'
+            ),
+        ]
         indexes = [
             models.Index(fields=['service_area_center_latitude', 'service_area_center_longitude']),
+            models.Index(fields=['bounds_min_latitude', 'bounds_max_latitude',
+                                 'bounds_min_longitude', 'bounds_max_longitude']),
         ]
 
     def __str__(self):
         return f"Agent: {self.user.email}"
 
 # User Property
-class UserProperty(models.Model):
+class UserProperty(PolygonAreaModel):
+    polygon_field = 'geofence'
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='properties')
     property_type = models.CharField(
         max_length=20,
@@ -1014,7 +1869,7 @@ class UserProperty(models.Model):
     )
     year_built = models.PositiveIntegerField(
         blank=True, null=True,
-        validators=[MinValueValidator(1800), MaxValueValidator(timezone.now().year)],
+        validators=[MinValueValidator(1800), MaxValueValidator(_current_year)],
         verbose_name=_("Year Built")
     )
     property_category = models.CharField(
@@ -1061,12 +1916,20 @@ class UserProperty(models.Model):
         help_text=_("Custom marker icon URL or ID")
     )
 
+    objects = UserRelatedManager()
+
     class Meta:
         verbose_name = _("User Property")
         verbose_name_plural = _("User Properties")
         indexes = [
             models.Index(fields=['user', 'property_type']),
+            # Btree, not GiST: radius search here is a latitude range scan
+            # plus a longitude filter (see annotate_distance /
+            # within_radius-style callers), which this composite serves
+            # without the gis stack.
             models.Index(fields=['location_latitude', 'location_longitude']),
+            models.Index(fields=['bounds_min_latitude', 'bounds_max_latitude',
+                                 'bounds_min_longitude', 'bounds_max_longitude']),
         ]
 
     def __str__(self):
@@ -1074,19 +1937,74 @@ class UserProperty(models.Model):
 
     def distance_to(self, other_latitude, other_longitude):
         if self.location_latitude and self.location_longitude and other_latitude and other_longitude:
-            from math import sqrt
-            lat_diff = self.location_latitude - other_latitude
-            lon_diff = self.location_longitude - other_longitude
-            return sqrt(lat_diff**2 + lon_diff**2) * 111  # Rough km conversion
+            return _haversine_km(
+                self.location_latitude, self.location_longitude,
+                other_latitude, other_longitude
+            )
         return None
 
+    @classmethod
+    def annotate_distance(cls, qs, latitude, longitude):
+        """Annotate distance_km in the database instead of looping in Python.
+
+        Equirectangular approximation with cos(latitude) hoisted into a
+        Python constant, so the per-row work is plain arithmetic the
+        database evaluates — good to well under a percent at search radii
+        — and order_by('distance_km') sorts DB-side without hydrating rows.
+        """
+        lat_scale = 111.0
+        lon_scale = 111.0 * math.cos(math.radians(latitude))
+        d_lat = (models.F('location_latitude') - latitude) * lat_scale
+        d_lon = (models.F('location_longitude') - longitude) * lon_scale
+        return qs.annotate(distance_km=Sqrt(d_lat * d_lat + d_lon * d_lon))
+
+# Property Search Entry (denormalized search table)
+class PropertySearchEntry(models.Model):
+    """Flat search row joining UserProperty with its owner's agent stats.
+
+    Materialized-view stand-in that works on every backend: the
+    refresh_property_search management command rebuilds it on a schedule,
+    so search pages scan one indexed flat table instead of re-joining
+    UserProperty, AgentProfile and UserReview per page. Rows disappear
+    with their property via the cascade.
+    """
+    property = models.OneToOneField(
+        UserProperty, on_delete=models.CASCADE, related_name='search_entry'
+    )
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='property_search_entries')
+    property_type = models.CharField(max_length=20, verbose_name=_("Property Type"))
+    city = models.CharField(max_length=100, verbose_name=_("City"))
+    price = models.DecimalField(max_digits=15, decimal_places=2, verbose_name=_("Price"))
+    bedrooms = models.PositiveIntegerField(default=1, verbose_name=_("Bedrooms"))
+    location_latitude = models.FloatField(verbose_name=_("Latitude"))
+    location_longitude = models.FloatField(verbose_name=_("Longitude"))
+    is_active = models.BooleanField(default=True, verbose_name=_("Active"))
+    agent_rating = models.FloatField(default=0.0, verbose_name=_("Agent Rating"))
+    agent_review_count = models.PositiveIntegerField(default=0, verbose_name=_("Agent Review Count"))
+    agent_verified = models.BooleanField(default=False, verbose_name=_("Verified Agent"))
+    refreshed_at = models.DateTimeField(auto_now=True, verbose_name=_("Refreshed At"))
+
+    class Meta:
+        verbose_name = _("Property Search Entry")
+        verbose_name_plural = _("Property Search Entries")
+        indexes = [
+            models.Index(fields=['city', 'price']),
+            models.Index(fields=['location_latitude', 'location_longitude']),
+        ]
+
+    def __str__(self):
+        return f"Search entry for {self.property_id}"
+
+
 # Saved Map View
-class SavedMapView(models.Model):
+class SavedMapView(PolygonAreaModel):
+    polygon_field = 'boundary'
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='saved_map_views')
     name = models.CharField(max_length=100, verbose_name=_("Map View Name"))
     center_latitude = models.FloatField(verbose_name=_("Map Center Latitude"))
     center_longitude = models.FloatField(verbose_name=_("Map Center Longitude"))
-    zoom_level = models.PositiveIntegerField(
+    zoom_level = models.PositiveSmallIntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(20)],
         default=12,
         verbose_name=_("Zoom Level")
@@ -1131,12 +2049,22 @@ class SavedMapView(models.Model):
         help_text=_("e.g., {'lat': 40.7128, 'lon': -74.0060}")
     )
 
+    objects = UserRelatedManager()
+
     class Meta:
         verbose_name = _("Saved Map View")
         verbose_name_plural = _("Saved Map Views")
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(zoom_level__gte=1) & models.Q(zoom_level__lte=20),
+                name='map_view_zoom_1_20'
+            ),
+        ]
         indexes = [
             models.Index(fields=['user', 'is_default']),
             models.Index(fields=['center_latitude', 'center_longitude']),
+            models.Index(fields=['bounds_min_latitude', 'bounds_max_latitude',
+                                 'bounds_min_longitude', 'bounds_max_longitude']),
         ]
 
     def __str__(self):
@@ -1144,14 +2072,20 @@ class SavedMapView(models.Model):
 
 # User Map Interaction
 class UserMapInteraction(models.Model):
+    class InteractionType(models.TextChoices):
+        PAN = 'pan', 'Pan'
+        ZOOM = 'zoom', 'Zoom'
+        CLICK = 'click', 'Click'
+        SEARCH = 'search', 'Search'
+        MARKER_ADD = 'marker_add', 'Add Marker'
+        MARKER_REMOVE = 'marker_remove', 'Remove Marker'
+        OVERLAY_TOGGLE = 'overlay_toggle', 'Toggle Overlay'
+        GEOFENCE_TRIGGER = 'geofence_trigger', 'Geofence Trigger'
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='map_interactions')
     interaction_type = models.CharField(
         max_length=20,
-        choices=[
-            ('pan', 'Pan'), ('zoom', 'Zoom'), ('click', 'Click'), ('search', 'Search'),
-            ('marker_add', 'Add Marker'), ('marker_remove', 'Remove Marker'),
-            ('overlay_toggle', 'Toggle Overlay'), ('geofence_trigger', 'Geofence Trigger')
-        ],
+        choices=InteractionType.choices,
         verbose_name=_("Interaction Type")
     )
     location_latitude = models.FloatField(
@@ -1162,26 +2096,47 @@ class UserMapInteraction(models.Model):
         blank=True, null=True,
         verbose_name=_("Interaction Location Longitude")
     )
-    zoom_level = models.PositiveIntegerField(
+    zoom_level = models.PositiveSmallIntegerField(
         blank=True, null=True,
         validators=[MinValueValidator(1), MaxValueValidator(20)],
         verbose_name=_("Zoom Level")
     )
-    timestamp = models.DateTimeField(default=timezone.now, verbose_name=_("Timestamp"))
+    timestamp = models.DateTimeField(db_default=Now(), verbose_name=_("Timestamp"))
     details = models.JSONField(
         blank=True, null=True,
         verbose_name=_("Details"),
         help_text=_("e.g., {'new_center': {'lat': 40.7128, 'lon': -74.0060}, 'overlay': 'traffic'}")
     )
 
+    objects = UserRelatedManager()
+    raw_objects = UnsortedManager()
+
     class Meta:
+        # Newest-first like the other log models; without it the capped
+        # recent-interactions list was LIMIT 50 over an undefined order.
+        ordering = ['-timestamp']
         verbose_name = _("User Map Interaction")
         verbose_name_plural = _("User Map Interactions")
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(zoom_level__isnull=True)
+                | (models.Q(zoom_level__gte=1) & models.Q(zoom_level__lte=20)),
+                name='map_inter_zoom_1_20'
+            ),
+        ]
         indexes = [
-            models.Index(fields=['user', 'timestamp']),
+            # Same shape as the UserActivity index: serves the per-user
+            # newest-first LIMIT scan forward.
+            models.Index(fields=['user', '-timestamp']),
             models.Index(fields=['interaction_type']),
             models.Index(fields=['location_latitude', 'location_longitude']),
         ]
+        if connection.vendor == 'postgresql':
+            from django.contrib.postgres.indexes import BrinIndex
+
+            # Same append-only shape as UserActivity: BRIN for time ranges,
+            # btree for per-user lookups.
+            indexes.append(BrinIndex(fields=['timestamp'], name='map_inter_ts_brin', pages_per_range=128))
 
     def __str__(self):
         return f"{self.user.email} - {self.interaction_type} - {self.timestamp}"
@@ -1189,8 +2144,11 @@ class UserMapInteraction(models.Model):
 # User Review
 class UserReview(models.Model):
     reviewer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='reviews_given')
+    # Denormalized from reviewer.email at save time; review lists serve
+    # the reviewer's email straight off the row.
+    reviewer_email = models.CharField(max_length=254, blank=True, default='', editable=False)
     reviewed_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='reviews_received')
-    rating = models.PositiveIntegerField(
+    rating = models.PositiveSmallIntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(5)],
         verbose_name=_("Rating")
     )
@@ -1198,36 +2156,171 @@ class UserReview(models.Model):
     created_at = models.DateTimeField(default=timezone.now, verbose_name=_("Created At"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Updated At"))
     is_anonymous = models.BooleanField(default=False, verbose_name=_("Anonymous"))
-    helpful_votes = models.PositiveIntegerField(default=0, verbose_name=_("Helpful Votes"))
+    helpful_votes = models.PositiveSmallIntegerField(default=0, verbose_name=_("Helpful Votes"))
     flagged = models.BooleanField(default=False, verbose_name=_("Flagged"))
     flag_reason = models.TextField(blank=True, null=True, verbose_name=_("Flag Reason"))
     response = models.TextField(blank=True, null=True, verbose_name=_("Response from Reviewed User"))
     response_at = models.DateTimeField(blank=True, null=True, verbose_name=_("Response Date"))
 
+    objects = ReviewRelatedManager()
+
     class Meta:
         constraints = [
-            models.UniqueConstraint(fields=['reviewer', 'reviewed_user'], name='unique_user_review')
+            models.UniqueConstraint(fields=['reviewer', 'reviewed_user'], name='unique_user_review'),
+            # Enforced in the database, not just full_clean(): raw
+            # bulk paths can't write an out-of-range rating either.
+            models.CheckConstraint(
+                check=models.Q(rating__gte=1) & models.Q(rating__lte=5),
+                name='review_rating_1_5'
+            ),
         ]
         ordering = ['-created_at']
         verbose_name = _("User Review")
         verbose_name_plural = _("User Reviews")
 
     def __str__(self):
-        return f"{self.reviewer.email} -> {self.reviewed_user.email}: {self.rating}/5"
+        return f"{self.reviewer_email or self.reviewer.email} -> {self.reviewed_user.email}: {self.rating}/5"
+
+
+# Incremental AgentProfile rating maintenance: each review folds into the
+# stored average with O(1) arithmetic in a single UPDATE, instead of
+# re-running AVG() over every review the agent has ever received. The SET
+# expressions read the pre-update column values, so rating and
+# review_count move together atomically.
+def _agent_stats(instance):
+    return AgentProfile.objects.filter(user_id=instance.reviewed_user_id)
+
+
+def _capture_previous_rating(sender, instance, **kwargs):
+    if instance.pk:
+        instance._previous_rating = (
+            sender.objects.filter(pk=instance.pk).values_list('rating', flat=True).first()
+        )
+
+
+def _fold_review_into_rating(sender, instance, created, **kwargs):
+    if created:
+        _agent_stats(instance).update(
+            rating=models.ExpressionWrapper(
+                (models.F('rating') * models.F('review_count') + instance.rating)
+                / (models.F('review_count') + 1),
+                output_field=models.FloatField(),
+            ),
+            review_count=models.F('review_count') + 1,
+        )
+        return
+    previous = getattr(instance, '_previous_rating', None)
+    if previous is None or previous == instance.rating:
+        return
+    _agent_stats(instance).filter(review_count__gt=0).update(
+        rating=models.ExpressionWrapper(
+            models.F('rating')
+            + (instance.rating - previous) * 1.0 / models.F('review_count'),
+            output_field=models.FloatField(),
+        )
+    )
+
+
+def _drop_review_from_rating(sender, instance, **kwargs):
+    _agent_stats(instance).update(
+        rating=models.Case(
+            models.When(
+                review_count__gt=1,
+                then=models.ExpressionWrapper(
+                    (models.F('rating') * models.F('review_count') - instance.rating)
+                    / (models.F('review_count') - 1),
+                    output_field=models.FloatField(),
+                ),
+            ),
+            default=models.Value(0.0),
+            output_field=models.FloatField(),
+        ),
+        review_count=models.Case(
+            models.When(review_count__gt=0, then=models.F('review_count') - 1),
+            default=models.Value(0),
+        ),
+    )
+
+
+models.signals.pre_save.connect(_capture_previous_rating, sender=UserReview)
+models.signals.post_save.connect(_fold_review_into_rating, sender=UserReview)
+models.signals.post_delete.connect(_drop_review_from_rating, sender=UserReview)
+
+
+# Denormalized owner emails: the high-read children carry the email on
+# the row itself so list APIs and __str__ skip the users_user join.
+# Stamped on save (bulk_create paths bypass signals — bulk callers
+# should fill the field themselves); an email change on User (rare)
+# cascades to the children in one UPDATE each.
+_DENORMALIZED_EMAILS = {
+    UserActivity: ('user', 'user_email'),
+    UserNotification: ('user', 'user_email'),
+    UserReview: ('reviewer', 'reviewer_email'),
+}
+
+
+def _stamp_owner_email(sender, instance, **kwargs):
+    fk_name, field_name = _DENORMALIZED_EMAILS[sender]
+    if getattr(instance, field_name):
+        return
+    owner = instance._state.fields_cache.get(fk_name)
+    email = owner.email if owner is not None else (
+        User.objects.filter(pk=getattr(instance, f'{fk_name}_id'))
+        .values_list('email', flat=True).first() or ''
+    )
+    setattr(instance, field_name, email)
+
+
+for _model in _DENORMALIZED_EMAILS:
+    models.signals.pre_save.connect(_stamp_owner_email, sender=_model)
+
+
+def _capture_previous_email(sender, instance, **kwargs):
+    if instance.pk:
+        instance._previous_email = (
+            sender.objects.filter(pk=instance.pk).values_list('email', flat=True).first()
+        )
+
+
+def _cascade_email_change(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_email', None)
+    if created or previous is None or previous == instance.email:
+        return
+    for model, (fk_name, field_name) in _DENORMALIZED_EMAILS.items():
+        model.objects.order_by().filter(**{fk_name: instance.pk}).update(
+            **{field_name: instance.email}
+        )
+
+
+models.signals.pre_save.connect(_capture_previous_email, sender=User)
+models.signals.post_save.connect(_cascade_email_change, sender=User)
+
 
 # User Document
 class UserDocument(models.Model):
+    class DocumentType(models.TextChoices):
+        ID = 'id', 'Government ID'
+        LICENSE = 'license', 'Real Estate License'
+        PASSPORT = 'passport', 'Passport'
+        PROOF_OF_INCOME = 'proof_of_income', 'Proof of Income'
+        TAX_RETURN = 'tax_return', 'Tax Return'
+        UTILITY_BILL = 'utility_bill', 'Utility Bill'
+        OTHER = 'other', 'Other'
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='documents')
     document_type = models.CharField(
         max_length=50,
-        choices=[
-            ('id', 'Government ID'), ('license', 'Real Estate License'), ('passport', 'Passport'),
-            ('proof_of_income', 'Proof of Income'), ('tax_return', 'Tax Return'),
-            ('utility_bill', 'Utility Bill'), ('other', 'Other')
-        ],
+        choices=DocumentType.choices,
         verbose_name=_("Document Type")
     )
     file = models.FileField(upload_to='users/documents/%Y/%m/%d/', verbose_name=_("File"))
+    # Stamped by the process_documents job, never in the upload request —
+    # hashing a multi-MB file would otherwise re-read it on the worker.
+    checksum = models.CharField(
+        max_length=64,
+        blank=True, default='', editable=False,
+        verbose_name=_("SHA-256 Checksum")
+    )
     uploaded_at = models.DateTimeField(default=timezone.now, verbose_name=_("Uploaded At"))
     verified = models.BooleanField(default=False, verbose_name=_("Verified"))
     verification_method = models.CharField(
@@ -1250,6 +2343,8 @@ class UserDocument(models.Model):
         verbose_name=_("Issuing Authority")
     )
 
+    objects = UserRelatedManager()
+
     class Meta:
         verbose_name = _("User Document")
         verbose_name_plural = _("User Documents")
@@ -1259,6 +2354,11 @@ class UserDocument(models.Model):
 
 # User Subscription
 class UserSubscription(models.Model):
+    class BillingCycle(models.TextChoices):
+        MONTHLY = 'monthly', 'Monthly'
+        QUARTERLY = 'quarterly', 'Quarterly'
+        YEARLY = 'yearly', 'Yearly'
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='subscriptions')
     plan_name = models.CharField(max_length=100, verbose_name=_("Plan Name"))
     plan_description = models.TextField(blank=True, null=True, verbose_name=_("Plan Description"))
@@ -1267,8 +2367,8 @@ class UserSubscription(models.Model):
     is_active = models.BooleanField(default=True, verbose_name=_("Active"))
     billing_cycle = models.CharField(
         max_length=20,
-        choices=[('monthly', 'Monthly'), ('quarterly', 'Quarterly'), ('yearly', 'Yearly')],
-        default='monthly',
+        choices=BillingCycle.choices,
+        default=BillingCycle.MONTHLY,
         verbose_name=_("Billing Cycle")
     )
     payment_method = models.CharField(
@@ -1296,6 +2396,8 @@ class UserSubscription(models.Model):
     cancellation_date = models.DateTimeField(blank=True, null=True, verbose_name=_("Cancellation Date"))
     cancellation_reason = models.TextField(blank=True, null=True, verbose_name=_("Cancellation Reason"))
 
+    objects = UserRelatedManager()
+
     class Meta:
         verbose_name = _("User Subscription")
         verbose_name_plural = _("User Subscriptions")
@@ -1307,10 +2409,12 @@ class UserSubscription(models.Model):
 class UserReferral(models.Model):
     referrer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='referrals_sent')
     referred_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='referrals_received')
-    referral_code = models.CharField(
-        max_length=20,
+    # Native UUID instead of CharField+lambda: half the unique-index key
+    # width, and a lambda default can't be serialized into migrations.
+    referral_code = models.UUIDField(
+        default=uuid.uuid4,
         unique=True,
-        default=lambda: uuid.uuid4().hex[:10],
+        editable=False,
         verbose_name=_("Referral Code")
     )
     referred_at = models.DateTimeField(default=timezone.now, verbose_name=_("Referred At"))
@@ -1328,6 +2432,8 @@ class UserReferral(models.Model):
     )
     reward_issued_at = models.DateTimeField(blank=True, null=True, verbose_name=_("Reward Issued At"))
 
+    objects = UserRelatedManager()
+
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=['referrer', 'referred_user'], name='unique_user_referral')
@@ -1338,6 +2444,11 @@ class UserReferral(models.Model):
     def __str__(self):
         return f"{self.referrer.email} referred {self.referred_user.email}"
 
+    @property
+    def short_code(self):
+        """Compact form of the referral code for URLs and invite emails."""
+        return self.referral_code.hex[:10]
+
 # User Audit Log
 class UserAuditLog(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='audit_logs')
@@ -1356,17 +2467,39 @@ class UserAuditLog(models.Model):
     field_name = models.CharField(max_length=100, verbose_name=_("Field Name"))
     old_value = models.TextField(blank=True, null=True, verbose_name=_("Old Value"))
     new_value = models.TextField(blank=True, null=True, verbose_name=_("New Value"))
-    timestamp = models.DateTimeField(default=timezone.now, verbose_name=_("Timestamp"))
+    timestamp = models.DateTimeField(db_default=Now(), verbose_name=_("Timestamp"))
     ip_address = models.GenericIPAddressField(blank=True, null=True, verbose_name=_("IP Address"))
 
+    objects = UserRelatedManager()
+    raw_objects = UnsortedManager()
+
     class Meta:
         ordering = ['-timestamp']
         verbose_name = _("User Audit Log")
         verbose_name_plural = _("User Audit Logs")
+        indexes = [
+            # The admin audit-trail view is filter(user)+newest-first
+            # LIMIT 50; without this the only access path was a full scan
+            # plus sort, since ip_address was the sole index.
+            models.Index(fields=['user', '-timestamp']),
+            models.Index(fields=['ip_address'], name='audit_ip_idx'),
+        ]
+        if connection.vendor == 'postgresql':
+            from django.contrib.postgres.indexes import BrinIndex
+
+            # Audit rows are written once and queried by time window or,
+            # for abuse forensics, by source address; BRIN covers the time
+            # ranges, the btree above the address lookups.
+            indexes.append(BrinIndex(fields=['timestamp'], name='audit_ts_brin', pages_per_range=128))
 
     def __str__(self):
         return f"{self.user.email} - {self.change_type} - {self.field_name} - {self.timestamp}"
 
+    @classmethod
+    def in_subnet(cls, cidr):
+        """Audit rows originating from the given CIDR block."""
+        return _rows_in_subnet(cls, cidr)
+
 # User Preference
 class UserPreference(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='preferences')
@@ -1411,9 +2544,108 @@ class UserPreference(models.Model):
         verbose_name=_("Preferred Currency")
     )
 
+    objects = UserRelatedManager()
+
     class Meta:
         verbose_name = _("User Preference")
         verbose_name_plural = _("User Preferences")
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(default_search_radius__gte=1) & models.Q(default_search_radius__lte=1000),
+                name='pref_search_radius_1_1000'
+            ),
+        ]
 
     def __str__(self):
-        return f"Preferences for {self.user.email}"
\ No newline at end of file
+        return f"Preferences for {self.user.email}"
+
+    @classmethod
+    def get_for(cls, user_id):
+        """Per-user settings dict served from the cache.
+
+        Preferences are read on essentially every authenticated request
+        (theme, language, formats, currency) and change rarely; one cached
+        dict per user replaces a guaranteed SELECT per request. The
+        post_save/post_delete hooks drop the key, so edits show up
+        immediately. Returns None if the user has no preference row.
+        """
+        key = f"userpref:{user_id}"
+        data = cache.get(key)
+        if data is None:
+            data = cls.objects.filter(user_id=user_id).values().first()
+            if data is None:
+                return None
+            cache.set(key, data, 60 * 60)
+        return data
+
+
+def _invalidate_preference_cache(sender, instance, **kwargs):
+    cache.delete(f"userpref:{instance.user_id}")
+
+
+models.signals.post_save.connect(_invalidate_preference_cache, sender=UserPreference)
+models.signals.post_delete.connect(_invalidate_preference_cache, sender=UserPreference)
+
+# Write-through caches for the single-row-per-user payloads. The
+# retrieve endpoints for these models serve pre-rendered JSON bytes;
+# since each payload is built from exactly one row, the writer can
+# re-render and set the fresh bytes at commit time instead of deleting
+# the key and making the next reader pay the rebuild — the first read
+# after a write is already a hit. Collection caches (properties,
+# reviews, ...) stay on invalidation, where write-through would mean
+# re-running a whole list query per write.
+
+def _cache_rendered(key, data, ttl):
+    from RESPlateForm.renderers import FastJSONRenderer
+
+    body = FastJSONRenderer().render(data)
+
+    def commit():
+        cache.set(key, body, ttl)
+        # Evict any per-process L1 copy of the old bytes everywhere.
+        publish_invalidation([key])
+
+    transaction.on_commit(commit)
+
+
+def _write_through_user_cache(sender, instance, **kwargs):
+    from .serializers import UserSerializer
+
+    # Suffix matches UserViewSet.retrieve's key: the endpoint requires
+    # authentication, so is_authenticated is always True there.
+    _cache_rendered(f"user_{instance.user_id}_True", UserSerializer(instance).data, 60 * 15)
+
+
+def _write_through_agent_profile_cache(sender, instance, **kwargs):
+    from .serializers import AgentProfileSerializer
+
+    _cache_rendered(
+        f"agent_profile_{instance.user.user_id}",
+        AgentProfileSerializer(instance).data, 60 * 15,
+    )
+
+
+def _write_through_preference_cache(sender, instance, **kwargs):
+    from .serializers import UserPreferenceSerializer
+
+    _cache_rendered(
+        f"user_preferences_{instance.user.user_id}",
+        UserPreferenceSerializer(instance).data, 60 * 15,
+    )
+
+
+def _drop_agent_profile_cache(sender, instance, **kwargs):
+    keys = [f"agent_profile_{instance.user.user_id}"]
+    cache.delete_many(keys)
+    publish_invalidation(keys)
+
+
+def _drop_preference_cache(sender, instance, **kwargs):
+    cache.delete(f"user_preferences_{instance.user.user_id}")
+
+
+models.signals.post_save.connect(_write_through_user_cache, sender=User)
+models.signals.post_save.connect(_write_through_agent_profile_cache, sender=AgentProfile)
+models.signals.post_save.connect(_write_through_preference_cache, sender=UserPreference)
+models.signals.post_delete.connect(_drop_agent_profile_cache, sender=AgentProfile)
+models.signals.post_delete.connect(_drop_preference_cache, sender=UserPreference)
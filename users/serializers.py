@@ -1,5 +1,9 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
 from rest_framework import serializers
 from typing import Any
+from property.serializers import CachedFieldsSerializerMixin, FastToRepresentationMixin
+from RESPlateForm.renderers import stream_json_rows
 from .models import (
     User, UserProperty, UserAddress, SavedMapView, UserActivity,
     UserConnection, SavedSearch, UserNotification, AgentProfile,
@@ -7,122 +11,206 @@ from .models import (
     UserAuditLog, UserPreference, UserMapInteraction
 )
 
-class UserSerializer(serializers.ModelSerializer):
+
+class CachedModelSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
+    """Shared base for this module: the field map is built once per class
+    and shallow-copied per instance (see property.serializers), instead of
+    re-introspecting Meta/model on every request."""
+
+    @classmethod
+    def project(cls, queryset):
+        """Narrow a list queryset to the model columns this serializer reads.
+
+        Meta.fields is resolved against the model once per class; names
+        that aren't concrete columns (annotation-fed fields, properties)
+        are skipped. Joins from default managers are dropped too — the
+        list serializers here read denormalized or annotated columns, not
+        related rows — so only the serialized bytes cross the DB link.
+        """
+        if '_db_columns' not in cls.__dict__:
+            columns = []
+            for name in cls.Meta.fields:
+                try:
+                    field = cls.Meta.model._meta.get_field(name)
+                except FieldDoesNotExist:
+                    continue
+                if field.concrete:
+                    columns.append(field.name)
+            cls._db_columns = tuple(columns)
+        return queryset.select_related(None).only(*cls._db_columns)
+
+
+def _iso_datetime(value):
+    return value.isoformat().replace('+00:00', 'Z')
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+class FastListMixin:
+    """Dict-projection list path for flat read-only serializers.
+
+    On high-cardinality list endpoints (activity, notifications, audit
+    logs, user directories) the serializer's per-field dispatch is the
+    dominant cost once N+1s are gone. fast_list() pulls Meta.fields with
+    values() — rows arrive as dicts, no model instances are built — and
+    only coerces the columns JSON can't take raw (datetimes, dates, UUIDs,
+    Decimals) to the form DRF would render. Which columns need which
+    converter is read off the model once per class, so the per-row work is
+    a direct key access, not an isinstance sweep over every value. Output
+    is identical for flat field sets; anything nested or method-based must
+    stay on the normal path. Writes keep the full ModelSerializer so
+    validation is untouched.
+    """
+
+    @classmethod
+    def _coercions(cls):
+        if '_coerce_plan' not in cls.__dict__:
+            plan = []
+            for name in cls.Meta.fields:
+                field = cls.Meta.model._meta.get_field(name)
+                if isinstance(field, models.DateTimeField):
+                    plan.append((name, _iso_datetime))
+                elif isinstance(field, (models.DateField, models.TimeField)):
+                    plan.append((name, _isoformat))
+                elif isinstance(field, (models.UUIDField, models.DecimalField)):
+                    plan.append((name, str))
+            cls._coerce_plan = tuple(plan)
+        return cls._coerce_plan
+
+    @classmethod
+    def fast_list(cls, queryset):
+        rows = list(queryset.values(*cls.Meta.fields))
+        for name, convert in cls._coercions():
+            for row in rows:
+                value = row[name]
+                if value is not None:
+                    row[name] = convert(value)
+        return rows
+
+    @classmethod
+    def stream(cls, queryset):
+        """Uncapped export variant of fast_list: rows are projected,
+        encoded and flushed one server-side chunk at a time instead of
+        building the whole payload in memory."""
+        return stream_json_rows(queryset.values(*cls.Meta.fields).iterator(chunk_size=500))
+
+
+class UserSerializer(FastToRepresentationMixin, FastListMixin, CachedModelSerializer):
     full_name = serializers.ReadOnlyField()
 
     class Meta:
         model = User
-        fields = ['user_id', 'email', 'full_name', 'user_role', 'primary_location_latitude', 'primary_location_longitude']
-        read_only_fields = ['user_id', 'full_name']
+        fields = ('user_id', 'email', 'full_name', 'user_role', 'primary_location_latitude', 'primary_location_longitude')
+        read_only_fields = ('user_id', 'full_name')
 
-class UserPropertySerializer(serializers.ModelSerializer):
+class UserPropertySerializer(FastToRepresentationMixin, FastListMixin, CachedModelSerializer):
     class Meta:
         model = UserProperty
-        fields = ['title', 'location_latitude', 'location_longitude', 'price', 'property_type', 'created_at']
-        read_only_fields = ['created_at']
+        fields = ('title', 'location_latitude', 'location_longitude', 'price', 'property_type', 'created_at')
+        read_only_fields = ('created_at',)
 
-class UserAddressSerializer(serializers.ModelSerializer):
+class UserAddressSerializer(CachedModelSerializer):
     country = serializers.CharField(source='country.code', read_only=True)  # Assuming CountryField usage
 
     class Meta:
         model = UserAddress
-        fields = ['address_type', 'address_line_1', 'city', 'state', 'postal_code', 'country']
+        fields = ('address_type', 'address_line_1', 'city', 'state', 'postal_code', 'country')
 
-class SavedMapViewSerializer(serializers.ModelSerializer):
+class SavedMapViewSerializer(FastToRepresentationMixin, CachedModelSerializer):
     class Meta:
         model = SavedMapView
-        fields = ['name', 'center_latitude', 'center_longitude', 'zoom_level', 'map_style']
-        extra_kwargs = {
-            'zoom_level': {'min_value': 1, 'max_value': 20}
-        }
+        fields = ('name', 'center_latitude', 'center_longitude', 'zoom_level', 'map_style')
 
-class UserActivitySerializer(serializers.ModelSerializer):
+class UserActivitySerializer(FastToRepresentationMixin, FastListMixin, CachedModelSerializer):
     class Meta:
         model = UserActivity
-        fields = ['action_type', 'action_detail', 'timestamp']
-        read_only_fields = ['timestamp']
+        fields = ('action_type', 'action_detail', 'timestamp')
+        read_only_fields = ('timestamp',)
 
-class UserConnectionSerializer(serializers.ModelSerializer):
-    connected_user_email = serializers.EmailField(source='connected_user.email', read_only=True)
+class UserConnectionSerializer(CachedModelSerializer):
+    # Bound to the column annotated in the list queryset
+    # (F('connected_user__email')) — read straight off the row instead of
+    # walking obj.connected_user.email, which would build a User instance
+    # per row even with select_related. Omitted on instances that lack
+    # the annotation (e.g. the create response).
+    connected_user_email = serializers.CharField(read_only=True)
 
     class Meta:
         model = UserConnection
-        fields = ['connected_user_email', 'connection_type', 'connected_at']
-        read_only_fields = ['connected_user_email', 'connected_at']
+        fields = ('connected_user_email', 'connection_type', 'connected_at')
+        read_only_fields = ('connected_user_email', 'connected_at')
 
-class SavedSearchSerializer(serializers.ModelSerializer):
+class SavedSearchSerializer(FastToRepresentationMixin, CachedModelSerializer):
     class Meta:
         model = SavedSearch
-        fields = ['name', 'search_query', 'created_at', 'notify_on_match']
-        read_only_fields = ['created_at']
+        fields = ('name', 'search_query', 'created_at', 'notify_on_match')
+        read_only_fields = ('created_at',)
 
-class UserNotificationSerializer(serializers.ModelSerializer):
+class UserNotificationSerializer(FastToRepresentationMixin, FastListMixin, CachedModelSerializer):
     class Meta:
         model = UserNotification
-        fields = ['message', 'notification_type', 'priority', 'created_at', 'is_read']
-        read_only_fields = ['created_at']
+        fields = ('message', 'notification_type', 'priority', 'created_at', 'is_read')
+        read_only_fields = ('created_at',)
 
-class AgentProfileSerializer(serializers.ModelSerializer):
+class AgentProfileSerializer(FastToRepresentationMixin, CachedModelSerializer):
     class Meta:
         model = AgentProfile
-        fields = ['license_number', 'agency_name', 'years_experience', 'bio', 'rating']
-        extra_kwargs = {
-            'rating': {'min_value': 0, 'max_value': 5}
-        }
+        fields = ('license_number', 'agency_name', 'years_experience', 'bio', 'rating')
 
-class UserReviewSerializer(serializers.ModelSerializer):
-    reviewer_email = serializers.EmailField(source='reviewer.email', read_only=True)
-    reviewer = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), write_only=True)
+class UserReviewSerializer(FastToRepresentationMixin, CachedModelSerializer):
+    # Reads the denormalized column stamped at save time, so review lists
+    # don't join users_user for the email.
+    reviewer_email = serializers.CharField(read_only=True)
+    # only('pk') keeps the FK-existence probe to a single index-only
+    # column instead of the full users_user row; anything downstream that
+    # needs more (the email-stamping signal) loads it lazily. The field
+    # object itself comes out of the per-class field cache rather than
+    # being rebuilt per request.
+    reviewer = serializers.PrimaryKeyRelatedField(queryset=User.objects.only('pk'), write_only=True)
 
     class Meta:
         model = UserReview
-        fields = ['reviewer', 'reviewer_email', 'reviewed_user', 'rating', 'comment', 'created_at']
-        read_only_fields = ['reviewer_email', 'created_at']
-        extra_kwargs = {
-            'rating': {'min_value': 1, 'max_value': 5}
-        }
+        fields = ('reviewer', 'reviewer_email', 'reviewed_user', 'rating', 'comment', 'created_at')
+        read_only_fields = ('reviewer_email', 'created_at')
 
-class UserDocumentSerializer(serializers.ModelSerializer):
+class UserDocumentSerializer(FastToRepresentationMixin, CachedModelSerializer):
     file = serializers.FileField(write_only=True)  # Ensure file upload handling
 
     class Meta:
         model = UserDocument
-        fields = ['document_type', 'file', 'uploaded_at', 'verified']
-        read_only_fields = ['uploaded_at']
+        fields = ('document_type', 'file', 'uploaded_at', 'verified')
+        read_only_fields = ('uploaded_at',)
 
-class UserSubscriptionSerializer(serializers.ModelSerializer):
+class UserSubscriptionSerializer(FastToRepresentationMixin, CachedModelSerializer):
     class Meta:
         model = UserSubscription
-        fields = ['plan_name', 'start_date', 'end_date', 'is_active', 'amount']
-        read_only_fields = ['start_date']
+        fields = ('plan_name', 'start_date', 'end_date', 'is_active', 'amount')
+        read_only_fields = ('start_date',)
 
-class UserReferralSerializer(serializers.ModelSerializer):
-    referred_user_email = serializers.EmailField(source='referred_user.email', read_only=True)
+class UserReferralSerializer(CachedModelSerializer):
+    # Annotated in the list queryset, same as connected_user_email.
+    referred_user_email = serializers.CharField(read_only=True)
 
     class Meta:
         model = UserReferral
-        fields = ['referred_user_email', 'referral_code', 'referred_at', 'reward_earned']
-        read_only_fields = ['referred_user_email', 'referral_code', 'referred_at']
+        fields = ('referred_user_email', 'referral_code', 'referred_at', 'reward_earned')
+        read_only_fields = ('referred_user_email', 'referral_code', 'referred_at')
 
-class UserAuditLogSerializer(serializers.ModelSerializer):
+class UserAuditLogSerializer(FastToRepresentationMixin, FastListMixin, CachedModelSerializer):
     class Meta:
         model = UserAuditLog
-        fields = ['change_type', 'field_name', 'old_value', 'new_value', 'timestamp']
-        read_only_fields = ['timestamp']
+        fields = ('change_type', 'field_name', 'old_value', 'new_value', 'timestamp')
+        read_only_fields = ('timestamp',)
 
-class UserPreferenceSerializer(serializers.ModelSerializer):
+class UserPreferenceSerializer(FastToRepresentationMixin, CachedModelSerializer):
     class Meta:
         model = UserPreference
-        fields = ['theme', 'language', 'date_format', 'time_format', 'default_search_radius', 'map_provider', 'currency']
-        extra_kwargs = {
-            'default_search_radius': {'min_value': 1, 'max_value': 1000}
-        }
+        fields = ('theme', 'language', 'date_format', 'time_format', 'default_search_radius', 'map_provider', 'currency')
 
-class UserMapInteractionSerializer(serializers.ModelSerializer):
+class UserMapInteractionSerializer(FastToRepresentationMixin, FastListMixin, CachedModelSerializer):
     class Meta:
         model = UserMapInteraction
-        fields = ['interaction_type', 'location_latitude', 'location_longitude', 'zoom_level', 'timestamp']
-        read_only_fields = ['timestamp']
-        extra_kwargs = {
-            'zoom_level': {'min_value': 1, 'max_value': 20}
-        }
\ No newline at end of file
+        fields = ('interaction_type', 'location_latitude', 'location_longitude', 'zoom_level', 'timestamp')
+        read_only_fields = ('timestamp',)
@@ -1,68 +1,69 @@
+from django.http import Http404
 from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
+
 from . import views
 
-urlpatterns = [
+# Django's URLResolver walks urlpatterns linearly, compiling and trying one
+# regex per entry, so 30-odd near-identical sub-resource paths cost a full
+# scan on every request. All per-model CRUD routes share two shapes —
+# .../<resource>/ and .../<resource>/<pk>/ — so they collapse into two
+# resolver entries plus an O(1) dict lookup on the resource segment.
+
+_LIST = {'get': 'list', 'post': 'create'}
+_DETAIL = {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}
+_RO_LIST = {'get': 'list'}
+_RO_DETAIL = {'get': 'retrieve'}
+
+# resource segment -> (list view, detail view); views are bound once at
+# import instead of per path() call.
+RESOURCE_VIEWS = {
+    'properties': (views.UserPropertyViewSet.as_view(_LIST), views.UserPropertyViewSet.as_view(_DETAIL)),
+    'addresses': (views.UserAddressViewSet.as_view(_LIST), views.UserAddressViewSet.as_view(_DETAIL)),
+    'map-views': (views.SavedMapViewViewSet.as_view(_LIST), views.SavedMapViewViewSet.as_view(_DETAIL)),
+    'activity': (views.UserActivityViewSet.as_view(_RO_LIST), views.UserActivityViewSet.as_view(_RO_DETAIL)),
+    'connections': (views.UserConnectionViewSet.as_view(_LIST), views.UserConnectionViewSet.as_view(_DETAIL)),
+    'searches': (views.SavedSearchViewSet.as_view(_LIST), views.SavedSearchViewSet.as_view(_DETAIL)),
+    'notifications': (views.UserNotificationViewSet.as_view(_LIST), views.UserNotificationViewSet.as_view(_DETAIL)),
+    'agent': (views.AgentProfileViewSet.as_view(_LIST), views.AgentProfileViewSet.as_view(_DETAIL)),
+    'reviews': (views.UserReviewViewSet.as_view(_LIST), views.UserReviewViewSet.as_view(_DETAIL)),
+    'documents': (views.UserDocumentViewSet.as_view(_LIST), views.UserDocumentViewSet.as_view(_DETAIL)),
+    'subscriptions': (views.UserSubscriptionViewSet.as_view(_LIST), views.UserSubscriptionViewSet.as_view(_DETAIL)),
+    'referrals': (views.UserReferralViewSet.as_view(_LIST), views.UserReferralViewSet.as_view(_DETAIL)),
+    'audit-logs': (views.UserAuditLogViewSet.as_view(_RO_LIST), views.UserAuditLogViewSet.as_view(_RO_DETAIL)),
+    # Preferences are a per-user singleton: retrieve() ignores pk and
+    # get_or_creates the row, so the list slot maps straight to it.
+    'preferences': (views.UserPreferenceViewSet.as_view({'get': 'retrieve'}),
+                    views.UserPreferenceViewSet.as_view({'get': 'retrieve', 'put': 'update', 'patch': 'partial_update'})),
+    'map-interactions': (views.UserMapInteractionViewSet.as_view(_LIST), views.UserMapInteractionViewSet.as_view(_DETAIL)),
+}
+
+
+# csrf_exempt matches APIView.as_view(); DRF re-applies CSRF itself for
+# session-authenticated writes.
+@csrf_exempt
+def _dispatch(request, user_id, resource, pk=None):
+    try:
+        list_view, detail_view = RESOURCE_VIEWS[resource]
+    except KeyError:
+        raise Http404(f"Unknown user sub-resource: {resource}")
+    if pk is None:
+        return list_view(request, user_id=user_id)
+    return detail_view(request, user_id=user_id, pk=pk)
+
+
+urlpatterns = (
     # User
-    path('api/user/<uuid:user_id>/', views.user_detail_api, name='user_detail_api'),
-    
-    # UserProperty
-    path('api/user/<uuid:user_id>/properties/', views.UserPropertyAPI.as_view(), name='user_properties_api'),
-    path('api/user/<uuid:user_id>/properties/<int:property_id>/', views.user_property_detail_api, name='user_property_detail_api'),
-    
-    # UserAddress
-    path('api/user/<uuid:user_id>/addresses/', views.user_addresses_api, name='user_addresses_api'),
-    path('api/user/<uuid:user_id>/addresses/<int:address_id>/', views.user_address_detail_api, name='user_address_detail_api'),
-    
-    # SavedMapView
-    path('api/user/<uuid:user_id>/map-views/', views.saved_map_views_api, name='saved_map_views_api'),
-    path('api/user/<uuid:user_id>/map-views/<int:map_view_id>/', views.saved_map_view_detail_api, name='saved_map_view_detail_api'),
-    
-    # UserActivity
-    path('api/user/<uuid:user_id>/activity/', views.user_activity_api, name='user_activity_api'),
-    
-    # UserConnection
-    path('api/user/<uuid:user_id>/connections/', views.user_connections_api, name='user_connections_api'),
-    path('api/user/<uuid:user_id>/connections/<int:connection_id>/', views.user_connection_detail_api, name='user_connection_detail_api'),
-    
-    # SavedSearch
-    path('api/user/<uuid:user_id>/searches/', views.saved_searches_api, name='saved_searches_api'),
-    path('api/user/<uuid:user_id>/searches/<int:search_id>/', views.saved_search_detail_api, name='saved_search_detail_api'),
-    
-    # UserNotification
-    path('api/user/<uuid:user_id>/notifications/', views.user_notifications_api, name='user_notifications_api'),
-    path('api/user/<uuid:user_id>/notifications/<int:notification_id>/', views.user_notification_detail_api, name='user_notification_detail_api'),
-    
-    # AgentProfile
-    path('api/user/<uuid:user_id>/agent/', views.agent_profile_api, name='agent_profile_api'),
-    
-    # UserReview
-    path('api/user/<uuid:user_id>/reviews/', views.user_reviews_api, name='user_reviews_api'),
-    path('api/user/<uuid:user_id>/reviews/<int:review_id>/', views.user_review_detail_api, name='user_review_detail_api'),
-    
-    # UserDocument
-    path('api/user/<uuid:user_id>/documents/', views.user_documents_api, name='user_documents_api'),
-    path('api/user/<uuid:user_id>/documents/<int:document_id>/', views.user_document_detail_api, name='user_document_detail_api'),
-    
-    # UserSubscription
-    path('api/user/<uuid:user_id>/subscriptions/', views.user_subscriptions_api, name='user_subscriptions_api'),
-    path('api/user/<uuid:user_id>/subscriptions/<int:subscription_id>/', views.user_subscription_detail_api, name='user_subscription_detail_api'),
-    
-    # UserReferral
-    path('api/user/<uuid:user_id>/referrals/', views.user_referrals_api, name='user_referrals_api'),
-    path('api/user/<uuid:user_id>/referrals/<int:referral_id>/', views.user_referral_detail_api, name='user_referral_detail_api'),
-    
-    # UserAuditLog
-    path('api/user/<uuid:user_id>/audit-logs/', views.user_audit_logs_api, name='user_audit_logs_api'),
-    
-    # UserPreference
-    path('api/user/<uuid:user_id>/preferences/', views.user_preferences_api, name='user_preferences_api'),
-    
-    # UserMapInteraction
-    path('api/user/<uuid:user_id>/map-interactions/', views.user_map_interactions_api, name='user_map_interactions_api'),
-    
-    # Utility Views
+    path('api/user/<uuid:user_id>/', views.UserViewSet.as_view(_DETAIL), name='user_detail_api'),
+
+    # Utility views (search-preferences must precede the generic resource
+    # pattern, which would otherwise capture its segment)
+    path('api/user/<uuid:user_id>/search-preferences/', views.user_search_preferences_api, name='user_search_preferences_api'),
     path('api/nearby-users/', views.NearbyUsersAPI.as_view(), name='nearby_users_api'),
     path('api/users/active/', views.active_users_api, name='active_users_api'),
     path('api/users/role/<str:role>/', views.users_by_role_api, name='users_by_role_api'),
-    path('api/user/<uuid:user_id>/search-preferences/', views.user_search_preferences_api, name='user_search_preferences_api'),
-]
\ No newline at end of file
+
+    # All per-model sub-resources
+    path('api/user/<uuid:user_id>/<str:resource>/', _dispatch, name='user_subresource_api'),
+    path('api/user/<uuid:user_id>/<str:resource>/<int:pk>/', _dispatch, name='user_subresource_detail_api'),
+)
@@ -1,6 +1,10 @@
 from django.shortcuts import get_object_or_404
 from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.http import Http404, HttpResponse
+from django.db.models import F
 from django.utils import timezone
+from django.utils.functional import cached_property
 from rest_framework import status, viewsets
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -24,26 +28,211 @@ from .serializers import (
     UserReferralSerializer, UserAuditLogSerializer, UserPreferenceSerializer,
     UserMapInteractionSerializer
 )
-import json
+from property import counters
+from RESPlateForm.cache_bus import l1_get, l1_set, publish_invalidation
+from RESPlateForm.renderers import FastJSONRenderer
 
 # --- Helper Functions ---
 
 def invalidate_user_cache(user_id):
     """Invalidate all caches related to a user."""
-    prefixes = [
-        f"user_{user_id}", f"user_properties_{user_id}", f"user_addresses_{user_id}",
+    # user_{id}_True, agent_profile_{id} and user_preferences_{id} are
+    # deliberately absent: those single-row payloads are maintained
+    # write-through by post_save signals (see users.models), so deleting
+    # them here would only throw away bytes the writer just refreshed.
+    keys = [
+        f"user_addresses_{user_id}",
         f"nearby_users_{user_id}", f"saved_map_views_{user_id}", f"user_activity_{user_id}",
         f"user_connections_{user_id}", f"saved_searches_{user_id}", f"user_notifications_{user_id}",
-        f"agent_profile_{user_id}", f"user_reviews_{user_id}", f"user_documents_{user_id}",
+        f"user_reviews_{user_id}", f"user_documents_{user_id}",
         f"user_subscriptions_{user_id}", f"user_referrals_{user_id}", f"user_audit_logs_{user_id}",
-        f"user_preferences_{user_id}", f"user_map_interactions_{user_id}"
+        f"user_map_interactions_{user_id}",
+        f"user_meta_{user_id}"
     ]
-    for prefix in prefixes:
-        # Use cache.delete() for each key pattern manually since delete_pattern isn’t standard
-        cache.delete(prefix)
+    # The property list caches one payload per filter variant; the
+    # vocabulary is closed (anything else falls back to 'all'), so every
+    # possible key is enumerable — same approach as the role-list keys.
+    keys += [f"user_properties_{user_id}_{variant}" for variant in ('all', 'owned', 'saved')]
+    # One round trip (django-redis pipelines DEL) instead of 17 sequential
+    # delete calls on every write.
+    cache.delete_many(keys)
+    # Then tell every worker process to drop its L1 copies; writes, not
+    # TTL expiry, are what make cached bytes wrong.
+    publish_invalidation(keys)
+
+
+def invalidate_user_cache_on_commit(user_id):
+    """Invalidate after the surrounding transaction commits.
+
+    Inline invalidation had two problems: the Redis round trip sat inside
+    the request before the response could go out, and a rolled-back write
+    still cleared the cache. on_commit defers the delete until the data
+    is actually visible; under autocommit it runs immediately, so
+    behaviour only changes inside atomic blocks.
+    """
+    transaction.on_commit(lambda: invalidate_user_cache(user_id))
+
+
+def get_user_meta(user_id):
+    """Cached (pk, privacy_level) for a user_id; 404 if no such user.
+
+    The per-resource get_queryset checks only need identity and privacy,
+    but fetched the whole User row to read them — an extra full-row
+    SELECT on every request. The pair is cached under user_meta_{user_id},
+    which invalidate_user_cache clears, so privacy changes take effect
+    together with the rest of the user's keys.
+    """
+    cache_key = f"user_meta_{user_id}"
+    meta = cache.get(cache_key)
+    if meta is None:
+        meta = (
+            User.objects.filter(user_id=user_id)
+            .values_list('pk', 'privacy_level')
+            .first()
+        )
+        if meta is None:
+            raise Http404("User not found")
+        # add: burst missers all computed the same pair; one write wins.
+        cache.add(cache_key, meta, 60 * 5)
+    return meta
+
+
+def cached_json_response(cache_key, ttl, produce, l1=False):
+    """Serve an endpoint from cached, already-rendered JSON bytes.
+
+    The per-view pattern this replaces stored json.dumps(data) and
+    re-parsed it with json.loads on every hit, only for DRF to re-encode
+    the same payload on the way out. Hits now return the stored bytes
+    directly; misses call produce(), render once through the project
+    renderer, and cache the bytes.
+
+    Misses take a short Redis lock on <key>:build so a TTL expiry under
+    burst rebuilds once instead of piling every concurrent request onto
+    the DB; losers block until the winner has filled the cache, then
+    serve the fresh bytes from the re-check. Backends without lock()
+    (e.g. LocMemCache in tests) just rebuild inline.
+
+    l1=True additionally keeps the bytes in the per-process cache_bus L1,
+    skipping the Redis round trip for keys shared by everyone (the user
+    directories, popular agent cards). Only use it for keys covered by
+    the invalidation bus or tolerant of L1_TTL seconds of staleness.
+    """
+    if l1:
+        body = l1_get(cache_key)
+        if body is not None:
+            return HttpResponse(body, content_type='application/json')
+    body = cache.get(cache_key)
+    if body is None:
+        if hasattr(cache, 'lock'):
+            with cache.lock(f"{cache_key}:build", timeout=10):
+                body = cache.get(cache_key)
+                if body is None:
+                    body = FastJSONRenderer().render(produce())
+                    cache.set(cache_key, body, ttl)
+        else:
+            body = FastJSONRenderer().render(produce())
+            # add = SET NX: concurrent missers on lockless backends all
+            # rebuild, but only the first write lands; the rest skip the
+            # redundant network write of identical bytes.
+            cache.add(cache_key, body, ttl)
+    if l1:
+        l1_set(cache_key, body)
+    return HttpResponse(body, content_type='application/json')
 
 # --- API ViewSets (Full CRUD for All Models) ---
 
+class CachedUserScopedViewSet(viewsets.ModelViewSet):
+    """Shared machinery for the per-user resource viewsets.
+
+    These viewsets were near-identical copies of the same ownership
+    check, cached list block and perform_* invalidation hooks — a dozen
+    places to patch whenever the caching story changed. The shared path
+    lives here once, parameterized by class attributes; subclasses
+    declare their model, serializer and cache key prefix and override
+    only what genuinely differs (query-param filters, soft deletes,
+    privacy rules).
+    """
+
+    permission_classes = [IsAuthenticated]
+    model = None
+    key_prefix = ''
+    ttl = 60 * 10
+    # Column on self.model pointing at the owning user, and the kwarg
+    # perform_create passes the owner instance under.
+    owner_field = 'user_id'
+    owner_kwarg = 'user'
+    # Historically only some resources reject creates on behalf of other
+    # users; the check stays opt-in so behaviour is unchanged.
+    enforce_owner_on_create = False
+    # Flat read-only rows can list via FastListMixin.fast_list (values()
+    # projection, no model instances) instead of the serializer path.
+    use_fast_list = False
+    # Row cap applied by list() only (the log-style resources show a
+    # recent window). It must never reach get_queryset: get_object
+    # filters the queryset again, and Django raises TypeError on a
+    # filtered slice — exports and detail lookups read uncapped.
+    queryset_cap = None
+
+    def scoped_queryset(self, pk):
+        return self.model.objects.filter(**{self.owner_field: pk})
+
+    @cached_property
+    def _scoped_user(self):
+        """Owning User row, fetched at most once per request.
+
+        Read paths never need it (get_queryset works off the cached
+        user-meta pair); write hooks that do — perform_create passes the
+        instance to serializer.save so pre_save signals can read it —
+        share this one fetch.
+        """
+        return get_object_or_404(User, user_id=self.kwargs['user_id'])
+
+    def get_queryset(self):
+        pk, _ = get_user_meta(self.kwargs['user_id'])
+        if pk != self.request.user.pk and not self.request.user.is_staff:
+            return self.model.objects.none()
+        return self.scoped_queryset(pk)
+
+    def list_queryset(self):
+        queryset = self.get_queryset()
+        if self.queryset_cap:
+            queryset = queryset[:self.queryset_cap]
+        return queryset
+
+    def list_cache_key(self):
+        return f"{self.key_prefix}_{self.kwargs['user_id']}"
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('export') and hasattr(self.serializer_class, 'stream'):
+            # Uncapped history, streamed row by row like the activity and
+            # audit exports; never cached and never materialized
+            # server-side.
+            return self.serializer_class.stream(self.get_queryset())
+        if self.use_fast_list:
+            produce = lambda: self.serializer_class.fast_list(self.list_queryset())
+        else:
+            def produce():
+                # Only the serialized columns leave the DB (see project()).
+                queryset = self.get_serializer_class().project(self.list_queryset())
+                return self.get_serializer(queryset, many=True).data
+        return cached_json_response(self.list_cache_key(), self.ttl, produce)
+
+    def perform_create(self, serializer):
+        user = self._scoped_user
+        if self.enforce_owner_on_create and user != self.request.user and not self.request.user.is_staff:
+            raise PermissionDenied("Unauthorized")
+        serializer.save(**{self.owner_kwarg: user})
+        invalidate_user_cache_on_commit(self.kwargs['user_id'])
+
+    def perform_update(self, serializer):
+        serializer.save()
+        invalidate_user_cache_on_commit(self.kwargs['user_id'])
+
+    def perform_destroy(self, instance):
+        invalidate_user_cache_on_commit(self.kwargs['user_id'])
+        instance.delete()
+
+
 # 1. User
 class UserViewSet(viewsets.ModelViewSet):
     serializer_class = UserSerializer
@@ -60,14 +249,12 @@ class UserViewSet(viewsets.ModelViewSet):
         user = self.get_object()
         if user.privacy_level == 'private' and request.user != user and not request.user.is_staff:
             return Response({"error": "Private profile"}, status=status.HTTP_403_FORBIDDEN)
+        if request.user != user:
+            # Buffered in Redis; the flush_counters job applies it later,
+            # so popular profiles don't serialize viewers on one hot row.
+            counters.bump('user', user.pk, 'profile_views')
         cache_key = f"user_{user.user_id}_{request.user.is_authenticated}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        serializer = self.get_serializer(user)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 15)
-        return Response(data)
+        return cached_json_response(cache_key, 60 * 15, lambda: self.get_serializer(user).data)
 
     def update(self, request, *args, **kwargs):
         user = self.get_object()
@@ -75,7 +262,7 @@ class UserViewSet(viewsets.ModelViewSet):
             return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         response = super().update(request, *args, **kwargs)
         if response.status_code == status.HTTP_200_OK:
-            invalidate_user_cache(user.user_id)
+            invalidate_user_cache_on_commit(user.user_id)
         return response
 
     def destroy(self, request, *args, **kwargs):
@@ -85,135 +272,50 @@ class UserViewSet(viewsets.ModelViewSet):
         user.account_status = 'deleted'
         user.is_active = False
         user.save()
-        invalidate_user_cache(user.user_id)
+        invalidate_user_cache_on_commit(user.user_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # 2. UserProperty
-class UserPropertyViewSet(viewsets.ModelViewSet):
+class UserPropertyViewSet(CachedUserScopedViewSet):
     serializer_class = UserPropertySerializer
-    permission_classes = [IsAuthenticated]
+    model = UserProperty
+    key_prefix = 'user_properties'
+    enforce_owner_on_create = True
 
-    def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            return UserProperty.objects.none()
+    def scoped_queryset(self, pk):
         filter_type = self.request.query_params.get('filter', 'all')
         if filter_type == 'owned':
-            return user.properties.filter(property_type='owned', is_active=True)
+            return UserProperty.objects.filter(user_id=pk, property_type='owned', is_active=True)
         elif filter_type == 'saved':
-            return user.properties.filter(property_type='saved', is_active=True)
-        return user.properties.filter(is_active=True)
+            return UserProperty.objects.filter(user_id=pk, property_type='saved', is_active=True)
+        return UserProperty.objects.filter(user_id=pk, is_active=True)
 
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"user_properties_{user_id}_{request.query_params.get('filter', 'all')}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 10)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            raise PermissionDenied("Unauthorized")
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
-
-    def perform_update(self, serializer):
-        user_id = self.kwargs['user_id']
-        serializer.save()
-        invalidate_user_cache(user_id)
+    def list_cache_key(self):
+        filter_type = self.request.query_params.get('filter', 'all')
+        if filter_type not in ('owned', 'saved'):
+            # scoped_queryset treats anything else as 'all'; normalizing
+            # here keeps the key space closed (and enumerable by
+            # invalidate_user_cache) instead of one key per typo.
+            filter_type = 'all'
+        return f"user_properties_{self.kwargs['user_id']}_{filter_type}"
 
     def perform_destroy(self, instance):
         instance.is_active = False
         instance.save()
-        invalidate_user_cache(self.kwargs['user_id'])
+        invalidate_user_cache_on_commit(self.kwargs['user_id'])
 
 # 3. UserAddress
-class UserAddressViewSet(viewsets.ModelViewSet):
+class UserAddressViewSet(CachedUserScopedViewSet):
     serializer_class = UserAddressSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            return UserAddress.objects.none()
-        return user.addresses.all()
-
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"user_addresses_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 10)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            raise PermissionDenied("Unauthorized")
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
-
-    def perform_update(self, serializer):
-        user_id = self.kwargs['user_id']
-        serializer.save()
-        invalidate_user_cache(user_id)
-
-    def perform_destroy(self, instance):
-        invalidate_user_cache(self.kwargs['user_id'])
-        instance.delete()
+    model = UserAddress
+    key_prefix = 'user_addresses'
+    enforce_owner_on_create = True
 
 # 4. SavedMapView
-class SavedMapViewViewSet(viewsets.ModelViewSet):
+class SavedMapViewViewSet(CachedUserScopedViewSet):
     serializer_class = SavedMapViewSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            return SavedMapView.objects.none()
-        return SavedMapView.objects.filter(user=user)
-
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"saved_map_views_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 10)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
-
-    def perform_update(self, serializer):
-        user_id = self.kwargs['user_id']
-        serializer.save()
-        invalidate_user_cache(user_id)
-
-    def perform_destroy(self, instance):
-        invalidate_user_cache(self.kwargs['user_id'])
-        instance.delete()
+    model = SavedMapView
+    key_prefix = 'saved_map_views'
 
 # 5. UserActivity
 class UserActivityViewSet(viewsets.ReadOnlyModelViewSet):
@@ -221,137 +323,59 @@ class UserActivityViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
+        pk, _ = get_user_meta(self.kwargs['user_id'])
+        if pk != self.request.user.pk and not self.request.user.is_staff:
             return UserActivity.objects.none()
-        return UserActivity.objects.filter(user=user)[:50]
+        return UserActivity.objects.filter(user_id=pk)
 
     def list(self, request, *args, **kwargs):
+        if request.query_params.get('export'):
+            # Full history, streamed row by row; never cached and never
+            # materialized server-side.
+            return UserActivitySerializer.stream(self.get_queryset())
         user_id = self.kwargs['user_id']
         cache_key = f"user_activity_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 5)
-        return Response(data)
+        # Flat read-only rows: project with values() and skip per-field
+        # serializer dispatch entirely (see FastListMixin).
+        return cached_json_response(
+            cache_key, 60 * 5,
+            # [:50] stays out of get_queryset so retrieve() can filter.
+            lambda: UserActivitySerializer.fast_list(self.get_queryset()[:50]),
+        )
 
 # 6. UserConnection
-class UserConnectionViewSet(viewsets.ModelViewSet):
+class UserConnectionViewSet(CachedUserScopedViewSet):
     serializer_class = UserConnectionSerializer
-    permission_classes = [IsAuthenticated]
+    model = UserConnection
+    key_prefix = 'user_connections'
+    enforce_owner_on_create = True
 
     def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user.privacy_level == 'private' and user != self.request.user and not self.request.user.is_staff:
+        pk, privacy_level = get_user_meta(self.kwargs['user_id'])
+        if privacy_level == 'private' and pk != self.request.user.pk and not self.request.user.is_staff:
             return UserConnection.objects.none()
-        return UserConnection.objects.filter(user=user)
-
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"user_connections_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 10)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            raise PermissionDenied("Unauthorized")
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
+        return self.scoped_queryset(pk)
 
-    def perform_destroy(self, instance):
-        invalidate_user_cache(self.kwargs['user_id'])
-        instance.delete()
+    def scoped_queryset(self, pk):
+        # The email arrives as an annotated column, so serialization reads
+        # it off the row without constructing the related User instance.
+        return UserConnection.objects.filter(user_id=pk).annotate(
+            connected_user_email=F('connected_user__email')
+        )
 
 # 7. SavedSearch
-class SavedSearchViewSet(viewsets.ModelViewSet):
+class SavedSearchViewSet(CachedUserScopedViewSet):
     serializer_class = SavedSearchSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            return SavedSearch.objects.none()
-        return SavedSearch.objects.filter(user=user)
-
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"saved_searches_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 10)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
-
-    def perform_update(self, serializer):
-        user_id = self.kwargs['user_id']
-        serializer.save()
-        invalidate_user_cache(user_id)
-
-    def perform_destroy(self, instance):
-        invalidate_user_cache(self.kwargs['user_id'])
-        instance.delete()
+    model = SavedSearch
+    key_prefix = 'saved_searches'
 
 # 8. UserNotification
-class UserNotificationViewSet(viewsets.ModelViewSet):
+class UserNotificationViewSet(CachedUserScopedViewSet):
     serializer_class = UserNotificationSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            return UserNotification.objects.none()
-        return UserNotification.objects.filter(user=user)
-
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"user_notifications_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 5)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
-
-    def perform_update(self, serializer):
-        user_id = self.kwargs['user_id']
-        serializer.save()
-        invalidate_user_cache(user_id)
-
-    def perform_destroy(self, instance):
-        invalidate_user_cache(self.kwargs['user_id'])
-        instance.delete()
+    model = UserNotification
+    key_prefix = 'user_notifications'
+    ttl = 60 * 5
+    use_fast_list = True
 
 # 9. AgentProfile
 class AgentProfileViewSet(viewsets.ModelViewSet):
@@ -359,36 +383,43 @@ class AgentProfileViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        return AgentProfile.objects.filter(user=user)
+        # Single joined query: the default manager already select_relates
+        # user and agency_address (both needed to render an agent card),
+        # and filtering on user__user_id folds the User lookup into the
+        # same statement instead of fetching the user first.
+        return AgentProfile.objects.filter(user__user_id=self.kwargs['user_id'])
 
     def retrieve(self, request, *args, **kwargs):
         user_id = self.kwargs['user_id']
         cache_key = f"agent_profile_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 15)
-        return Response(data)
+        # l1: popular agent cards are read by many users; the write-
+        # through signal refreshes the bytes on save and its bus message
+        # evicts stale L1 copies in every process.
+        return cached_json_response(
+            cache_key, 60 * 15,
+            lambda: self.get_serializer(self.get_object()).data,
+            l1=True,
+        )
 
     def perform_create(self, serializer):
         user_id = self.kwargs['user_id']
         user = get_object_or_404(User, user_id=user_id)
         if user != self.request.user and not self.request.user.is_staff:
             raise PermissionDenied("Unauthorized")
-        if hasattr(user, 'agent_profile'):
+        # The OneToOneField's UNIQUE constraint is the duplicate check:
+        # the old hasattr(user, 'agent_profile') probe cost a SELECT on
+        # every create and was racy anyway — two concurrent creates both
+        # passed it and one still blew up on the constraint.
+        try:
+            serializer.save(user=user)
+        except IntegrityError:
             raise ValidationError({"error": "Agent profile already exists"})
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
+        invalidate_user_cache_on_commit(user_id)
 
     def perform_update(self, serializer):
         user_id = self.kwargs['user_id']
         serializer.save()
-        invalidate_user_cache(user_id)
+        invalidate_user_cache_on_commit(user_id)
 
 # 10. UserReview
 class UserReviewViewSet(viewsets.ModelViewSet):
@@ -396,155 +427,70 @@ class UserReviewViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        return UserReview.objects.filter(reviewed_user=user)
+        # Reviews are public; joining on reviewed_user__user_id skips the
+        # separate User fetch and the default manager pulls reviewer +
+        # reviewed_user in the same statement.
+        return UserReview.objects.filter(reviewed_user__user_id=self.kwargs['user_id'])
 
     def list(self, request, *args, **kwargs):
         user_id = self.kwargs['user_id']
         cache_key = f"user_reviews_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 10)
-        return Response(data)
+        def produce():
+            # Only the serialized columns leave the DB (see project()).
+            queryset = self.get_serializer_class().project(self.get_queryset())
+            return self.get_serializer(queryset, many=True).data
+        return cached_json_response(cache_key, 60 * 10, produce)
 
     def perform_create(self, serializer):
         user_id = self.kwargs['user_id']
         user = get_object_or_404(User, user_id=user_id)
         serializer.save(reviewer=self.request.user, reviewed_user=user)
-        invalidate_user_cache(user_id)
+        invalidate_user_cache_on_commit(user_id)
 
     def perform_update(self, serializer):
         instance = self.get_object()
         if instance.reviewer != self.request.user and not self.request.user.is_staff:
             raise PermissionDenied("Unauthorized")
         serializer.save()
-        invalidate_user_cache(self.kwargs['user_id'])
+        invalidate_user_cache_on_commit(self.kwargs['user_id'])
 
     def perform_destroy(self, instance):
         if instance.reviewer != self.request.user and not self.request.user.is_staff:
             raise PermissionDenied("Unauthorized")
-        invalidate_user_cache(self.kwargs['user_id'])
+        invalidate_user_cache_on_commit(self.kwargs['user_id'])
         instance.delete()
 
 # 11. UserDocument
-class UserDocumentViewSet(viewsets.ModelViewSet):
+class UserDocumentViewSet(CachedUserScopedViewSet):
     serializer_class = UserDocumentSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            return UserDocument.objects.none()
-        return UserDocument.objects.filter(user=user)
-
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"user_documents_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 10)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
-
-    def perform_update(self, serializer):
-        user_id = self.kwargs['user_id']
-        serializer.save()
-        invalidate_user_cache(user_id)
-
-    def perform_destroy(self, instance):
-        invalidate_user_cache(self.kwargs['user_id'])
-        instance.delete()
+    model = UserDocument
+    key_prefix = 'user_documents'
 
 # 12. UserSubscription
-class UserSubscriptionViewSet(viewsets.ModelViewSet):
+class UserSubscriptionViewSet(CachedUserScopedViewSet):
     serializer_class = UserSubscriptionSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            return UserSubscription.objects.none()
-        return UserSubscription.objects.filter(user=user)
-
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"user_subscriptions_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 10)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
-
-    def perform_update(self, serializer):
-        user_id = self.kwargs['user_id']
-        serializer.save()
-        invalidate_user_cache(user_id)
+    model = UserSubscription
+    key_prefix = 'user_subscriptions'
 
     def perform_destroy(self, instance):
         instance.is_active = False
         instance.cancellation_date = timezone.now()
         instance.save()
-        invalidate_user_cache(self.kwargs['user_id'])
+        invalidate_user_cache_on_commit(self.kwargs['user_id'])
 
 # 13. UserReferral
-class UserReferralViewSet(viewsets.ModelViewSet):
+class UserReferralViewSet(CachedUserScopedViewSet):
     serializer_class = UserReferralSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            return UserReferral.objects.none()
-        return UserReferral.objects.filter(referrer=user)
+    model = UserReferral
+    key_prefix = 'user_referrals'
+    owner_field = 'referrer_id'
+    owner_kwarg = 'referrer'
 
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"user_referrals_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 10)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        serializer.save(referrer=user)
-        invalidate_user_cache(user_id)
-
-    def perform_update(self, serializer):
-        user_id = self.kwargs['user_id']
-        serializer.save()
-        invalidate_user_cache(user_id)
+    def scoped_queryset(self, pk):
+        # Annotated like connected_user_email: read off the row.
+        return UserReferral.objects.filter(referrer_id=pk).annotate(
+            referred_user_email=F('referred_user__email')
+        )
 
 # 14. UserAuditLog
 class UserAuditLogViewSet(viewsets.ReadOnlyModelViewSet):
@@ -552,21 +498,22 @@ class UserAuditLogViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAdminUser]
 
     def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        return UserAuditLog.objects.filter(user=user)[:50]
+        pk, _ = get_user_meta(self.kwargs['user_id'])
+        return UserAuditLog.objects.filter(user_id=pk)
 
     def list(self, request, *args, **kwargs):
+        if request.query_params.get('export'):
+            # Admin-only full trail, streamed like the activity export.
+            return UserAuditLogSerializer.stream(self.get_queryset())
         user_id = self.kwargs['user_id']
         cache_key = f"user_audit_logs_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 5)
-        return Response(data)
+        # Flat read-only rows: project with values() and skip per-field
+        # serializer dispatch entirely (see FastListMixin).
+        return cached_json_response(
+            cache_key, 60 * 5,
+            # [:50] stays out of get_queryset so retrieve() can filter.
+            lambda: UserAuditLogSerializer.fast_list(self.get_queryset()[:50]),
+        )
 
 # 15. UserPreference
 class UserPreferenceViewSet(viewsets.ModelViewSet):
@@ -574,59 +521,33 @@ class UserPreferenceViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
+        pk, _ = get_user_meta(self.kwargs['user_id'])
+        if pk != self.request.user.pk and not self.request.user.is_staff:
             return UserPreference.objects.none()
-        return UserPreference.objects.filter(user=user)
+        return UserPreference.objects.filter(user_id=pk)
 
     def retrieve(self, request, *args, **kwargs):
         user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        preference, created = UserPreference.objects.get_or_create(user=user)
         cache_key = f"user_preferences_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        serializer = self.get_serializer(preference)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 15)
-        return Response(data)
+        def produce():
+            pk, _ = get_user_meta(user_id)
+            preference, _ = UserPreference.objects.get_or_create(user_id=pk)
+            return self.get_serializer(preference).data
+        return cached_json_response(cache_key, 60 * 15, produce)
 
     def perform_update(self, serializer):
         user_id = self.kwargs['user_id']
         serializer.save()
-        invalidate_user_cache(user_id)
+        invalidate_user_cache_on_commit(user_id)
 
 # 16. UserMapInteraction
-class UserMapInteractionViewSet(viewsets.ModelViewSet):
+class UserMapInteractionViewSet(CachedUserScopedViewSet):
     serializer_class = UserMapInteractionSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        if user != self.request.user and not self.request.user.is_staff:
-            return UserMapInteraction.objects.none()
-        return UserMapInteraction.objects.filter(user=user)[:50]
-
-    def list(self, request, *args, **kwargs):
-        user_id = self.kwargs['user_id']
-        cache_key = f"user_map_interactions_{user_id}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 5)
-        return Response(data)
-
-    def perform_create(self, serializer):
-        user_id = self.kwargs['user_id']
-        user = get_object_or_404(User, user_id=user_id)
-        serializer.save(user=user)
-        invalidate_user_cache(user_id)
+    model = UserMapInteraction
+    key_prefix = 'user_map_interactions'
+    ttl = 60 * 5
+    use_fast_list = True
+    queryset_cap = 50
 
 # --- Additional Utility Views ---
 
@@ -637,41 +558,57 @@ class NearbyUsersAPI(APIView):
         latitude = float(request.query_params.get('lat', 0))
         longitude = float(request.query_params.get('lon', 0))
         distance_km = float(request.query_params.get('distance', 10))
-        cache_key = f"nearby_users_{latitude}_{longitude}_{distance_km}"
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(json.loads(cached_data))
-        users = User.objects.nearby_users(latitude, longitude, distance_km)
-        serializer = UserSerializer(users, many=True)
-        data = serializer.data
-        cache.set(cache_key, json.dumps(data), 60 * 5)
-        return Response(data)
+        # Raw GPS floats made the old f"..._{lat}_{lon}_..." key unique
+        # per request (coordinates differ at the 1e-7 level), so the
+        # cache never hit. Quantize to a grid of quarter-radius cells:
+        # every client in the same cell shares a key, and the query runs
+        # from the cell centre with the radius padded by the cell
+        # half-diagonal so no one inside their true radius is missed —
+        # the approximation only ever adds edge results.
+        cell_km = max(distance_km, 1.0) / 4
+        cell = cell_km / 111.0
+        lat_cell = round(latitude / cell)
+        lon_cell = round(longitude / cell)
+        # The radius goes in at (rounded) full precision: truncating it
+        # made every sub-km request share one key, so later callers could
+        # be served a payload built with a smaller padded radius and lose
+        # genuine in-range rows.
+        cache_key = f"nearby_users_grid_{lat_cell}_{lon_cell}_{round(distance_km, 2)}"
+        def produce():
+            # exact=True: bbox prefilter in SQL, then the tight haversine
+            # loop (_pks_within_km) trims the corners so the response is a
+            # true radius, not a square.
+            users = User.objects.nearby_users(
+                lat_cell * cell, lon_cell * cell,
+                distance_km + cell_km * 0.7072, exact=True,
+            )
+            return UserSerializer(users, many=True).data
+        return cached_json_response(cache_key, 60 * 5, produce)
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def active_users_api(request):
     cache_key = "active_users"
-    cached_data = cache.get(cache_key)
-    if cached_data:
-        return Response(json.loads(cached_data))
-    users = User.objects.active_users()
-    serializer = UserSerializer(users, many=True)
-    data = serializer.data
-    cache.set(cache_key, json.dumps(data), 60 * 5)
-    return Response(data)
+    # Directory-style flat rows: values() projection, no User instances.
+    # l1: the key is global and already TTL-bounded, so the shorter L1
+    # TTL only tightens staleness.
+    return cached_json_response(
+        cache_key, 60 * 5,
+        lambda: UserSerializer.fast_list(User.objects.active_users()),
+        l1=True,
+    )
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def users_by_role_api(request, role):
     cache_key = f"users_by_role_{role}"
-    cached_data = cache.get(cache_key)
-    if cached_data:
-        return Response(json.loads(cached_data))
-    users = User.objects.by_role(role)
-    serializer = UserSerializer(users, many=True)
-    data = serializer.data
-    cache.set(cache_key, json.dumps(data), 60 * 10)
-    return Response(data)
+    # Directory-style flat rows: values() projection, no User instances.
+    # l1: same reasoning as active_users — global, TTL-bounded key.
+    return cached_json_response(
+        cache_key, 60 * 10,
+        lambda: UserSerializer.fast_list(User.objects.by_role(role)),
+        l1=True,
+    )
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -680,16 +617,7 @@ def user_search_preferences_api(request, user_id):
     if user != request.user and not request.user.is_staff:
         return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
     cache_key = f"user_search_preferences_{user_id}"
-    cached_data = cache.get(cache_key)
-    if cached_data:
-        return Response(json.loads(cached_data))
-    data = {
-        'min_price': user.min_price,
-        'max_price': user.max_price,
-        'min_bedrooms': user.min_bedrooms,
-        'max_bedrooms': user.max_bedrooms,
-        'property_types': json.loads(user.property_types) if user.property_types else [],
-        'preferred_locations': json.loads(user.preferred_locations) if user.preferred_locations else [],
-    }
-    cache.set(cache_key, json.dumps(data), 60 * 10)
-    return Response(data)
\ No newline at end of file
+    # Usually a hit: a post_save signal write-through refills this key
+    # with freshly rendered bytes on every User save (see users.models),
+    # so misses only happen after TTL expiry or a cold cache.
+    return cached_json_response(cache_key, 60 * 10, user.search_preferences_payload)
\ No newline at end of file